@@ -1,328 +1,673 @@
-"""
-Contract Manager
-Handles all smart contract interactions
-"""
-
-import os
-import json
-from typing import Dict, List, Optional
-from web3 import Web3
-from loguru import logger
-from dotenv import load_dotenv
-
-load_dotenv()
-
-
-class ContractManager:
-    """
-    Manages smart contract instances and interactions
-    """
-    
-    def __init__(self, w3: Web3):
-        """
-        Initialize Contract Manager
-        
-        Args:
-            w3: Web3 instance
-        """
-        self.w3 = w3
-        
-        # Load contract address from environment
-        self.flashloan_contract_address = os.getenv('FLASHLOAN_CONTRACT_ADDRESS')
-        
-        if not self.flashloan_contract_address:
-            logger.warning("FLASHLOAN_CONTRACT_ADDRESS not set - contract interactions disabled")
-            self.flashloan_contract = None
-        else:
-            # Load contract ABI and create instance
-            self.flashloan_contract = self._load_flashloan_contract()
-        
-        logger.info("Contract Manager initialized")
-    
-    def _load_flashloan_contract(self):
-        """Load FlashloanArbitrage contract instance"""
-        try:
-            # Load ABI from compiled artifacts
-            abi_path = "artifacts/contracts/FlashloanArbitrage.sol/FlashloanArbitrage.json"
-            
-            if os.path.exists(abi_path):
-                with open(abi_path, 'r') as f:
-                    contract_json = json.load(f)
-                    abi = contract_json['abi']
-            else:
-                # Use minimal ABI if artifacts not available
-                abi = self._get_minimal_flashloan_abi()
-            
-            contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.flashloan_contract_address),
-                abi=abi
-            )
-            
-            logger.success(f"FlashloanArbitrage contract loaded at {self.flashloan_contract_address}")
-            return contract
-            
-        except Exception as e:
-            logger.error(f"Error loading FlashloanArbitrage contract: {e}")
-            return None
-    
-    async def execute_flashloan(
-        self,
-        asset: str,
-        amount: int,
-        params: bytes,
-        wallet_manager
-    ) -> Optional[bytes]:
-        """
-        Execute flashloan arbitrage
-        
-        Args:
-            asset: Token address to borrow
-            amount: Amount to borrow (in wei)
-            params: Encoded arbitrage parameters
-            wallet_manager: Wallet manager for signing
-            
-        Returns:
-            Transaction hash or None
-        """
-        try:
-            if not self.flashloan_contract:
-                logger.error("Flashloan contract not initialized")
-                return None
-            
-            # Build transaction
-            tx = self.flashloan_contract.functions.executeFlashLoan(
-                Web3.to_checksum_address(asset),
-                amount,
-                params
-            ).build_transaction({
-                'from': wallet_manager.executor_address,
-                'nonce': self.w3.eth.get_transaction_count(wallet_manager.executor_address),
-                'gas': 800000,
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            # Sign and send
-            signed_tx = wallet_manager.sign_transaction(tx, wallet='executor')
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            logger.info(f"Flashloan executed: {tx_hash.hex()}")
-            return tx_hash
-            
-        except Exception as e:
-            logger.error(f"Error executing flashloan: {e}")
-            return None
-    
-    async def withdraw_profits(
-        self,
-        token_address: str,
-        to_address: str,
-        wallet_manager
-    ) -> Optional[bytes]:
-        """
-        Withdraw accumulated profits from contract
-        
-        Args:
-            token_address: Token to withdraw
-            to_address: Recipient address (admin wallet)
-            wallet_manager: Wallet manager for signing
-            
-        Returns:
-            Transaction hash or None
-        """
-        try:
-            if not self.flashloan_contract:
-                logger.error("Flashloan contract not initialized")
-                return None
-            
-            # Build transaction
-            tx = self.flashloan_contract.functions.withdrawProfits(
-                Web3.to_checksum_address(token_address),
-                Web3.to_checksum_address(to_address)
-            ).build_transaction({
-                'from': wallet_manager.admin_address,
-                'nonce': self.w3.eth.get_transaction_count(wallet_manager.admin_address),
-                'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            # Sign with admin key
-            signed_tx = wallet_manager.sign_transaction(tx, wallet='admin')
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            logger.success(f"Profits withdrawn: {tx_hash.hex()}")
-            return tx_hash
-            
-        except Exception as e:
-            logger.error(f"Error withdrawing profits: {e}")
-            return None
-    
-    async def emergency_pause(self, wallet_manager) -> Optional[bytes]:
-        """
-        Trigger emergency pause (kill switch)
-        
-        Args:
-            wallet_manager: Wallet manager for signing
-            
-        Returns:
-            Transaction hash or None
-        """
-        try:
-            if not self.flashloan_contract:
-                logger.error("Flashloan contract not initialized")
-                return None
-            
-            tx = self.flashloan_contract.functions.emergencyPause().build_transaction({
-                'from': wallet_manager.admin_address,
-                'nonce': self.w3.eth.get_transaction_count(wallet_manager.admin_address),
-                'gas': 50000,
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            signed_tx = wallet_manager.sign_transaction(tx, wallet='admin')
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            logger.critical(f"Emergency pause activated: {tx_hash.hex()}")
-            return tx_hash
-            
-        except Exception as e:
-            logger.error(f"Error triggering emergency pause: {e}")
-            return None
-    
-    async def set_executor(self, executor_address: str, wallet_manager) -> Optional[bytes]:
-        """
-        Set authorized executor address
-        
-        Args:
-            executor_address: New executor address
-            wallet_manager: Wallet manager for signing
-            
-        Returns:
-            Transaction hash or None
-        """
-        try:
-            if not self.flashloan_contract:
-                return None
-            
-            tx = self.flashloan_contract.functions.setExecutor(
-                Web3.to_checksum_address(executor_address)
-            ).build_transaction({
-                'from': wallet_manager.admin_address,
-                'nonce': self.w3.eth.get_transaction_count(wallet_manager.admin_address),
-                'gas': 50000,
-                'gasPrice': self.w3.eth.gas_price
-            })
-            
-            signed_tx = wallet_manager.sign_transaction(tx, wallet='admin')
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            logger.info(f"Executor set: {tx_hash.hex()}")
-            return tx_hash
-            
-        except Exception as e:
-            logger.error(f"Error setting executor: {e}")
-            return None
-    
-    def get_contract_balance(self, token_address: str) -> int:
-        """
-        Get contract's token balance
-        
-        Args:
-            token_address: Token address
-            
-        Returns:
-            Balance in wei
-        """
-        try:
-            if not self.flashloan_contract:
-                return 0
-            
-            # ERC20 balanceOf call
-            token_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=[{
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function"
-                }]
-            )
-            
-            balance = token_contract.functions.balanceOf(
-                self.flashloan_contract.address
-            ).call()
-            
-            return balance
-            
-        except Exception as e:
-            logger.error(f"Error getting contract balance: {e}")
-            return 0
-    
-    def is_contract_paused(self) -> bool:
-        """Check if contract is paused"""
-        try:
-            if not self.flashloan_contract:
-                return True
-            
-            return self.flashloan_contract.functions.paused().call()
-            
-        except Exception as e:
-            logger.error(f"Error checking pause status: {e}")
-            return True
-    
-    def _get_minimal_flashloan_abi(self) -> List[Dict]:
-        """
-        Get minimal ABI for FlashloanArbitrage contract
-        Used when compiled artifacts are not available
-        """
-        return [
-            {
-                "inputs": [
-                    {"name": "asset", "type": "address"},
-                    {"name": "amount", "type": "uint256"},
-                    {"name": "params", "type": "bytes"}
-                ],
-                "name": "executeFlashLoan",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"name": "token", "type": "address"},
-                    {"name": "to", "type": "address"}
-                ],
-                "name": "withdrawProfits",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "emergencyPause",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "unpause",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [{"name": "executor", "type": "address"}],
-                "name": "setExecutor",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "paused",
-                "outputs": [{"name": "", "type": "bool"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
+"""
+Contract Manager
+Handles all smart contract interactions
+"""
+
+import os
+import time
+import asyncio
+import functools
+import statistics
+from typing import Dict, List, Optional, Set, Tuple
+import aiohttp
+import orjson
+from web3 import Web3
+from web3.exceptions import Web3Exception
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+from loguru import logger
+from dotenv import load_dotenv
+
+from utils.rpc_manager import batch_request
+from utils.address_cache import to_checksum_address
+from utils.multicall import Multicall
+from .nonce_manager import NonceManager
+
+load_dotenv()
+
+# Precomputed function selectors (calldata is encoded directly on the hot path)
+EXECUTE_FLASHLOAN_SELECTOR = function_signature_to_4byte_selector('executeFlashLoan(address,uint256,bytes)')
+WITHDRAW_PROFITS_SELECTOR = function_signature_to_4byte_selector('withdrawProfits(address,address)')
+EMERGENCY_PAUSE_SELECTOR = function_signature_to_4byte_selector('emergencyPause()')
+SET_EXECUTOR_SELECTOR = function_signature_to_4byte_selector('setExecutor(address)')
+PAUSED_SELECTOR = function_signature_to_4byte_selector('paused()')
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector('balanceOf(address)')
+
+# Expected failures when submitting (node rejections, reverts, transport errors)
+SUBMIT_ERRORS = (ValueError, OSError, asyncio.TimeoutError, aiohttp.ClientError, Web3Exception)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_abi_cached(path: str, mtime: float) -> List[Dict]:
+    """
+    Parse a Hardhat artifact ABI (memoized on path + mtime)
+    All ContractManager instances share one parsed ABI until the artifact changes
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())['abi']
+
+
+class ContractManager:
+    """
+    Manages smart contract instances and interactions
+    """
+    
+    # Fixed attribute layout - instances are hit on every transaction
+    __slots__ = (
+        'w3',
+        'nonce_managers',
+        '_submit_urls',
+        '_submit_session',
+        '_chain_id',
+        '_fee_params',
+        '_fees_ts',
+        '_tx_templates',
+        '_presign_tasks',
+        'flashloan_contract_address',
+        'flashloan_contract',
+        '_balance_of_calldata',
+        '_multicall'
+    )
+    
+    # Fee history is refreshed at most once per TTL (~1 Polygon block)
+    FEE_TTL = 1.0
+    
+    def __init__(self, w3: Web3, nonce_manager: Optional[NonceManager] = None):
+        """
+        Initialize Contract Manager
+        
+        Args:
+            w3: Web3 instance
+            nonce_manager: Executor wallet nonce manager (shared with bot engine)
+        """
+        self.w3 = w3
+        
+        # Per-sender nonce managers (executor injected, others created on demand)
+        self.nonce_managers: Dict[str, NonceManager] = {}
+        if nonce_manager is not None:
+            self.nonce_managers[nonce_manager.executor_address] = nonce_manager
+        
+        # Extra endpoints raced on broadcast (comma-separated SUBMIT_RPCS)
+        self._submit_urls = [
+            url.strip()
+            for url in os.getenv('SUBMIT_RPCS', '').split(',')
+            if url.strip()
+        ]
+        self._submit_session: Optional[aiohttp.ClientSession] = None  # created on first broadcast
+        
+        # Cached network parameters (avoid per-tx RPC round-trips)
+        self._chain_id: Optional[int] = None
+        self._fee_params: Optional[Dict[str, int]] = None  # EIP-1559 maxFee/priorityFee
+        self._fees_ts = 0.0
+        
+        # Static tx fields per (sender, gas limit) - only data/nonce/fees vary per call
+        self._tx_templates: Dict[Tuple[str, int], Dict] = {}
+        
+        # In-flight cancel pre-signs (referenced until done, so they can't be collected mid-run)
+        self._presign_tasks: Set[asyncio.Task] = set()
+        
+        # Load contract address from environment
+        self.flashloan_contract_address = os.getenv('FLASHLOAN_CONTRACT_ADDRESS')
+        
+        if not self.flashloan_contract_address:
+            logger.warning("FLASHLOAN_CONTRACT_ADDRESS not set - contract interactions disabled")
+            self.flashloan_contract = None
+        else:
+            # Load contract ABI and create instance
+            self.flashloan_contract = self._load_flashloan_contract()
+        
+        # balanceOf(contract) calldata is identical for every token
+        self._balance_of_calldata = (
+            BALANCE_OF_SELECTOR + encode(['address'], [self.flashloan_contract.address])
+            if self.flashloan_contract else None
+        )
+        
+        # Multicall3 aggregator for balance sweeps (created on first use)
+        self._multicall: Optional[Multicall] = None
+        
+        logger.info("Contract Manager initialized")
+    
+    def _load_flashloan_contract(self):
+        """Load FlashloanArbitrage contract instance"""
+        try:
+            # Load ABI from compiled artifacts
+            abi_path = "artifacts/contracts/FlashloanArbitrage.sol/FlashloanArbitrage.json"
+            
+            if os.path.exists(abi_path):
+                abi = _load_abi_cached(abi_path, os.path.getmtime(abi_path))
+            else:
+                # Use minimal ABI if artifacts not available
+                abi = self._get_minimal_flashloan_abi()
+            
+            contract = self.w3.eth.contract(
+                address=to_checksum_address(self.flashloan_contract_address),
+                abi=abi
+            )
+            
+            logger.success(f"FlashloanArbitrage contract loaded at {self.flashloan_contract_address}")
+            return contract
+            
+        except Exception as e:
+            logger.error(f"Error loading FlashloanArbitrage contract: {e}")
+            return None
+    
+    def _get_chain_id(self) -> int:
+        """Get chain ID (resolved once per process)"""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+    
+    def _refresh_fees(self, fee_history: Dict):
+        """
+        Derive EIP-1559 fee params from an eth_feeHistory result
+        
+        Args:
+            fee_history: Raw eth_feeHistory result (hex quantities)
+        """
+        # Last entry is the base fee of the next (pending) block
+        base_fee = int(fee_history['baseFeePerGas'][-1], 16)
+        tip = int(statistics.median(int(r[0], 16) for r in fee_history['reward']))
+        
+        self._fee_params = {
+            'maxFeePerGas': base_fee * 2 + tip,
+            'maxPriorityFeePerGas': tip
+        }
+        self._fees_ts = time.monotonic()
+    
+    async def on_new_block(self, head: Dict):
+        """
+        Refresh cached fees from a pushed block header (no RPC)
+        
+        Args:
+            head: newHeads payload
+        """
+        if self._fee_params is None or 'baseFeePerGas' not in head:
+            # Tip estimate comes from fee history - wait for the first prefetch
+            return
+        
+        base_fee = int(head['baseFeePerGas'], 16)
+        tip = self._fee_params['maxPriorityFeePerGas']
+        
+        self._fee_params = {
+            'maxFeePerGas': base_fee * 2 + tip,
+            'maxPriorityFeePerGas': tip
+        }
+        self._fees_ts = time.monotonic()
+    
+    def _prefetch_tx_params(self) -> Dict[str, int]:
+        """
+        Fetch fee history and chain ID in a single JSON-RPC batch
+        Cached values (chain ID, fresh fee params) are not re-requested
+        
+        Returns:
+            EIP-1559 fee params
+        """
+        refresh_fees = (
+            self._fee_params is None
+            or time.monotonic() - self._fees_ts > self.FEE_TTL
+        )
+        
+        calls = []
+        if refresh_fees:
+            calls.append(('eth_feeHistory', [5, 'latest', [50]]))
+        if self._chain_id is None:
+            calls.append(('eth_chainId', []))
+        
+        if calls:
+            results = batch_request(self.w3, calls)
+            
+            idx = 0
+            if refresh_fees:
+                self._refresh_fees(results[idx])
+                idx += 1
+            if self._chain_id is None:
+                self._chain_id = int(results[idx], 16)
+        
+        return self._fee_params
+    
+    def _build_contract_tx(
+        self,
+        sender: str,
+        data: bytes,
+        nonce: int,
+        gas: int,
+        fee_params: Dict[str, int]
+    ) -> Dict:
+        """Build a type-2 FlashloanArbitrage call transaction from pre-encoded calldata"""
+        template = self._tx_templates.get((sender, gas))
+        
+        if template is None:
+            template = {
+                'type': 2,
+                'from': sender,
+                'to': self.flashloan_contract.address,
+                'value': 0,
+                'gas': gas,
+                'chainId': self._chain_id
+            }
+            self._tx_templates[(sender, gas)] = template
+        
+        return {**template, 'data': data, 'nonce': nonce, **fee_params}
+    
+    def _get_nonce_manager(self, address: str) -> NonceManager:
+        """Get (or lazily create) the nonce manager for a sender address"""
+        address = to_checksum_address(address)
+        nonce_manager = self.nonce_managers.get(address)
+        
+        if nonce_manager is None:
+            nonce_manager = NonceManager(self.w3, address)
+            self.nonce_managers[address] = nonce_manager
+        
+        return nonce_manager
+    
+    async def _send_raw_transaction(self, raw_tx: bytes) -> bytes:
+        """
+        Broadcast a signed transaction
+        Races all SUBMIT_RPCS endpoints and returns the first accepted hash
+        
+        Args:
+            raw_tx: Signed raw transaction
+            
+        Returns:
+            Transaction hash
+        """
+        if not self._submit_urls:
+            # Blocking HTTP - keep the event loop serving monitors meanwhile
+            return await asyncio.to_thread(self.w3.eth.send_raw_transaction, raw_tx)
+        
+        if self._submit_session is None:
+            self._submit_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=30)
+            )
+        
+        # Encode the JSON-RPC body once and POST the same bytes to every endpoint
+        payload = orjson.dumps({
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'eth_sendRawTransaction',
+            'params': ['0x' + bytes(raw_tx).hex()]
+        })
+        
+        tasks = [
+            asyncio.ensure_future(self._post_raw_transaction(url, payload))
+            for url in self._submit_urls
+        ]
+        
+        try:
+            last_error = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except Exception as e:
+                    last_error = e
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _post_raw_transaction(self, url: str, payload: bytes) -> bytes:
+        """
+        POST a pre-encoded eth_sendRawTransaction request
+        
+        Args:
+            url: RPC endpoint
+            payload: orjson-encoded JSON-RPC request body
+            
+        Returns:
+            Transaction hash
+        """
+        async with self._submit_session.post(
+            url,
+            data=payload,
+            headers={'Content-Type': 'application/json'}
+        ) as response:
+            result = orjson.loads(await response.read())
+        
+        if 'error' in result:
+            raise ValueError(result['error'])
+        
+        return HexBytes(result['result'])
+    
+    async def close(self):
+        """Close the broadcast HTTP session"""
+        if self._submit_session is not None:
+            await self._submit_session.close()
+            self._submit_session = None
+    
+    async def _sign_and_send(
+        self,
+        tx: Dict,
+        nonce_manager: NonceManager,
+        wallet_manager,
+        wallet: str
+    ) -> bytes:
+        """
+        Sign and broadcast a transaction, tracking its nonce
+        
+        Args:
+            tx: Transaction dict (nonce allocated from nonce_manager)
+            nonce_manager: Nonce manager the nonce was allocated from
+            wallet_manager: Wallet manager for signing
+            wallet: 'executor' or 'admin'
+            
+        Returns:
+            Transaction hash
+        """
+        try:
+            # ECDSA signing is CPU-bound - keep it off the event loop
+            signed_tx = await asyncio.to_thread(wallet_manager.sign_transaction, tx, wallet=wallet)
+            tx_hash = await self._send_raw_transaction(signed_tx.rawTransaction)
+        except Exception:
+            # Nonce was never broadcast - hand it back so later txs don't queue behind a gap
+            await nonce_manager.release_nonce(tx['nonce'])
+            raise
+        
+        # Prepare a replacement now so a stuck tx can be cancelled instantly
+        # (seed the chain ID already fetched by _prefetch_tx_params - no RPC on this path)
+        if nonce_manager.chain_id is None:
+            nonce_manager.chain_id = tx.get('chainId')
+        fee_params = {
+            'maxFeePerGas': tx['maxFeePerGas'],
+            'maxPriorityFeePerGas': tx['maxPriorityFeePerGas']
+        }
+        # Used by NonceManager.on_new_block when the nonce gets stuck
+        task = asyncio.create_task(
+            nonce_manager.presign_cancel(tx['nonce'], wallet_manager, fee_params, wallet=wallet)
+        )
+        self._presign_tasks.add(task)
+        task.add_done_callback(self._presign_tasks.discard)
+        
+        return tx_hash
+    
+    async def execute_flashloan(
+        self,
+        asset: str,
+        amount: int,
+        params: bytes,
+        wallet_manager
+    ) -> Optional[bytes]:
+        """
+        Execute flashloan arbitrage
+        
+        Args:
+            asset: Token address to borrow
+            amount: Amount to borrow (in wei)
+            params: Encoded arbitrage parameters
+            wallet_manager: Wallet manager for signing
+            
+        Returns:
+            Transaction hash or None
+        """
+        if not self.flashloan_contract:
+            logger.error("Flashloan contract not initialized")
+            return None
+        
+        data = EXECUTE_FLASHLOAN_SELECTOR + encode(
+            ['address', 'uint256', 'bytes'],
+            [to_checksum_address(asset), amount, params]
+        )
+        nonce_manager = self._get_nonce_manager(wallet_manager.executor_address)
+        
+        try:
+            # Fee refresh may hit the RPC (cache expired) - keep it off the event loop
+            fee_params = await asyncio.to_thread(self._prefetch_tx_params)
+            await nonce_manager.ensure_synced()
+            
+            # Build transaction
+            tx = self._build_contract_tx(
+                wallet_manager.executor_address, data, nonce_manager.get_nonce(),
+                800000, fee_params
+            )
+            
+            # Sign and send
+            tx_hash = await self._sign_and_send(tx, nonce_manager, wallet_manager, 'executor')
+        except SUBMIT_ERRORS:
+            logger.opt(exception=True).error("Error executing flashloan")
+            return None
+        
+        logger.opt(lazy=True).info("Flashloan executed: {}", tx_hash.hex)
+        return tx_hash
+    
+    async def withdraw_profits(
+        self,
+        token_address: str,
+        to_address: str,
+        wallet_manager
+    ) -> Optional[bytes]:
+        """
+        Withdraw accumulated profits from contract
+        
+        Args:
+            token_address: Token to withdraw
+            to_address: Recipient address (admin wallet)
+            wallet_manager: Wallet manager for signing
+            
+        Returns:
+            Transaction hash or None
+        """
+        if not self.flashloan_contract:
+            logger.error("Flashloan contract not initialized")
+            return None
+        
+        data = WITHDRAW_PROFITS_SELECTOR + encode(
+            ['address', 'address'],
+            [to_checksum_address(token_address), to_checksum_address(to_address)]
+        )
+        nonce_manager = self._get_nonce_manager(wallet_manager.admin_address)
+        
+        try:
+            # Admin/shutdown path - keep fee and nonce RPCs off the event loop
+            fee_params = await asyncio.to_thread(self._prefetch_tx_params)
+            await nonce_manager.ensure_synced()
+            
+            # Build transaction
+            tx = self._build_contract_tx(
+                wallet_manager.admin_address, data, nonce_manager.get_nonce(),
+                100000, fee_params
+            )
+            
+            # Sign with admin key
+            tx_hash = await self._sign_and_send(tx, nonce_manager, wallet_manager, 'admin')
+        except SUBMIT_ERRORS:
+            logger.opt(exception=True).error("Error withdrawing profits")
+            return None
+        
+        logger.opt(lazy=True).success("Profits withdrawn: {}", tx_hash.hex)
+        return tx_hash
+    
+    async def emergency_pause(self, wallet_manager) -> Optional[bytes]:
+        """
+        Trigger emergency pause (kill switch)
+        
+        Args:
+            wallet_manager: Wallet manager for signing
+            
+        Returns:
+            Transaction hash or None
+        """
+        if not self.flashloan_contract:
+            logger.error("Flashloan contract not initialized")
+            return None
+        
+        nonce_manager = self._get_nonce_manager(wallet_manager.admin_address)
+        
+        try:
+            # Admin/shutdown path - keep fee and nonce RPCs off the event loop
+            fee_params = await asyncio.to_thread(self._prefetch_tx_params)
+            await nonce_manager.ensure_synced()
+            
+            tx = self._build_contract_tx(
+                wallet_manager.admin_address, EMERGENCY_PAUSE_SELECTOR, nonce_manager.get_nonce(),
+                50000, fee_params
+            )
+            
+            tx_hash = await self._sign_and_send(tx, nonce_manager, wallet_manager, 'admin')
+        except SUBMIT_ERRORS:
+            logger.opt(exception=True).error("Error triggering emergency pause")
+            return None
+        
+        logger.opt(lazy=True).critical("Emergency pause activated: {}", tx_hash.hex)
+        return tx_hash
+    
+    async def set_executor(self, executor_address: str, wallet_manager) -> Optional[bytes]:
+        """
+        Set authorized executor address
+        
+        Args:
+            executor_address: New executor address
+            wallet_manager: Wallet manager for signing
+            
+        Returns:
+            Transaction hash or None
+        """
+        if not self.flashloan_contract:
+            return None
+        
+        data = SET_EXECUTOR_SELECTOR + encode(
+            ['address'],
+            [to_checksum_address(executor_address)]
+        )
+        nonce_manager = self._get_nonce_manager(wallet_manager.admin_address)
+        
+        try:
+            # Admin/shutdown path - keep fee and nonce RPCs off the event loop
+            fee_params = await asyncio.to_thread(self._prefetch_tx_params)
+            await nonce_manager.ensure_synced()
+            
+            tx = self._build_contract_tx(
+                wallet_manager.admin_address, data, nonce_manager.get_nonce(),
+                50000, fee_params
+            )
+            
+            tx_hash = await self._sign_and_send(tx, nonce_manager, wallet_manager, 'admin')
+        except SUBMIT_ERRORS:
+            logger.opt(exception=True).error("Error setting executor")
+            return None
+        
+        logger.opt(lazy=True).info("Executor set: {}", tx_hash.hex)
+        return tx_hash
+    
+    def get_contract_balance(self, token_address: str) -> int:
+        """
+        Get contract's token balance
+        
+        Args:
+            token_address: Token address
+            
+        Returns:
+            Balance in wei
+        """
+        try:
+            if not self.flashloan_contract:
+                return 0
+            
+            # ERC20 balanceOf via raw eth_call with prebuilt calldata
+            raw = self.w3.eth.call({
+                'to': to_checksum_address(token_address),
+                'data': self._balance_of_calldata
+            })
+            
+            return int.from_bytes(raw, byteorder='big')
+            
+        except Exception as e:
+            logger.error(f"Error getting contract balance: {e}")
+            return 0
+    
+    async def get_contract_balances(self, token_addresses: List[str]) -> List[int]:
+        """
+        Get contract's balances for several tokens in one Multicall3 eth_call
+        
+        Args:
+            token_addresses: Token addresses
+            
+        Returns:
+            Balances (wei) in token_addresses order, 0 where a call failed
+        """
+        if not self.flashloan_contract or not token_addresses:
+            return [0] * len(token_addresses)
+        
+        if self._multicall is None:
+            self._multicall = Multicall(self.w3)
+        
+        # Same prebuilt balanceOf(contract) calldata against every token (allowFailure)
+        results = await self._multicall.aggregate([
+            {'target': token_address, 'call_data': self._balance_of_calldata}
+            for token_address in token_addresses
+        ])
+        
+        return [int.from_bytes(raw, byteorder='big') if raw else 0 for raw in results]
+    
+    def is_contract_paused(self) -> bool:
+        """Check if contract is paused"""
+        try:
+            if not self.flashloan_contract:
+                return True
+            
+            raw = self.w3.eth.call({
+                'to': self.flashloan_contract.address,
+                'data': PAUSED_SELECTOR
+            })
+            
+            return int.from_bytes(raw, byteorder='big') != 0
+            
+        except Exception as e:
+            logger.error(f"Error checking pause status: {e}")
+            return True
+    
+    def _get_minimal_flashloan_abi(self) -> List[Dict]:
+        """
+        Get minimal ABI for FlashloanArbitrage contract
+        Used when compiled artifacts are not available
+        """
+        return [
+            {
+                "inputs": [
+                    {"name": "asset", "type": "address"},
+                    {"name": "amount", "type": "uint256"},
+                    {"name": "params", "type": "bytes"}
+                ],
+                "name": "executeFlashLoan",
+                "outputs": [],
+                "stateMutability": "nonpayable",
+                "type": "function"
+            },
+            {
+                "inputs": [
+                    {"name": "token", "type": "address"},
+                    {"name": "to", "type": "address"}
+                ],
+                "name": "withdrawProfits",
+                "outputs": [],
+                "stateMutability": "nonpayable",
+                "type": "function"
+            },
+            {
+                "inputs": [],
+                "name": "emergencyPause",
+                "outputs": [],
+                "stateMutability": "nonpayable",
+                "type": "function"
+            },
+            {
+                "inputs": [],
+                "name": "unpause",
+                "outputs": [],
+                "stateMutability": "nonpayable",
+                "type": "function"
+            },
+            {
+                "inputs": [{"name": "executor", "type": "address"}],
+                "name": "setExecutor",
+                "outputs": [],
+                "stateMutability": "nonpayable",
+                "type": "function"
+            },
+            {
+                "inputs": [],
+                "name": "paused",
+                "outputs": [{"name": "", "type": "bool"}],
+                "stateMutability": "view",
+                "type": "function"
+            }
         ]
\ No newline at end of file
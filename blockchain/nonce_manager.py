@@ -4,7 +4,8 @@ Handles transaction nonce sequencing to avoid stuck transactions
 """
 
 import asyncio
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Optional, Set
 from web3 import Web3
 from loguru import logger
 
@@ -15,6 +16,18 @@ class NonceManager:
     Ensures sequential nonce allocation to prevent stuck transactions
     """
     
+    # Fixed attribute layout - instances are hit on every transaction
+    __slots__ = (
+        'w3',
+        'executor_address',
+        'current_nonce',
+        '_pending',
+        '_released',
+        'lock',
+        'chain_id',
+        '_cancel_cache'
+    )
+    
     def __init__(self, w3: Web3, executor_address: str):
         """
         Initialize Nonce Manager
@@ -27,46 +40,87 @@ class NonceManager:
         self.executor_address = Web3.to_checksum_address(executor_address)
         
         # Internal nonce tracking
-        self.current_nonce = None
-        self.pending_nonces = set()
+        self.current_nonce: Optional[int] = None
+        self._pending: Dict[int, float] = {}  # nonce -> allocation time (monotonic)
+        self._released: Set[int] = set()  # unused nonces below current_nonce, reissued first
         self.lock = asyncio.Lock()
         
-        # Initialize nonce from blockchain
-        self._sync_nonce()
+        # Chain ID (resolved once, on first use)
+        self.chain_id: Optional[int] = None
+        
+        # Pre-signed replacement (cancel) txs, nonce -> signed tx
+        self._cancel_cache: Dict[int, Any] = {}
         
-        logger.info(f"Nonce Manager initialized with nonce: {self.current_nonce}")
+        # Nonce is synced from chain on first use (keeps construction RPC-free)
+        logger.info(f"Nonce Manager initialized for {self.executor_address}")
     
-    def _sync_nonce(self):
-        """Sync nonce with blockchain"""
+    def _fetch_nonce(self) -> int:
+        """Fetch transaction count (confirmed + pending) from blockchain"""
         try:
-            # Get transaction count (confirmed + pending)
-            nonce = self.w3.eth.get_transaction_count(
+            return self.w3.eth.get_transaction_count(
                 self.executor_address,
                 'pending'  # Include pending transactions
             )
-            self.current_nonce = nonce
-            logger.debug(f"Nonce synced: {nonce}")
         except Exception as e:
             logger.error(f"Error syncing nonce: {e}")
-            self.current_nonce = 0
+            return 0
+    
+    def _sync_nonce(self):
+        """Sync nonce with blockchain"""
+        self.current_nonce = self._fetch_nonce()
+        self._released.clear()
+        logger.debug(f"Nonce synced: {self.current_nonce}")
+    
+    async def ensure_synced(self):
+        """
+        Sync nonce off the event loop if not yet synced
+        Lets startup overlap the RPC with other I/O
+        """
+        if self.current_nonce is not None:
+            return
+        
+        nonce = await asyncio.to_thread(self._fetch_nonce)
+        
+        # get_nonce may have synced inline while the fetch was in flight
+        if self.current_nonce is None:
+            self.current_nonce = nonce
+            logger.debug(f"Nonce synced: {nonce}")
+    
+    def _get_chain_id(self) -> int:
+        """Get chain ID (resolved once per process)"""
+        if self.chain_id is None:
+            self.chain_id = self.w3.eth.chain_id
+        return self.chain_id
+    
+    async def _ensure_chain_id(self):
+        """Resolve the chain ID off the event loop if nobody has seeded it yet"""
+        if self.chain_id is None:
+            self.chain_id = await asyncio.to_thread(lambda: self.w3.eth.chain_id)
     
-    async def get_nonce(self) -> int:
+    def get_nonce(self) -> int:
         """
         Get next available nonce
         
+        Synchronous and lock-free: the event loop is single-threaded and
+        nothing here awaits, so the read-increment cannot be interleaved
+        
         Returns:
             Next nonce to use
         """
-        async with self.lock:
-            if self.current_nonce is None:
-                self._sync_nonce()
-            
+        if self.current_nonce is None:
+            self._sync_nonce()
+        
+        if self._released:
+            # Fill gaps left by released nonces before going higher
+            nonce = min(self._released)
+            self._released.discard(nonce)
+        else:
             nonce = self.current_nonce
-            self.current_nonce += 1
-            self.pending_nonces.add(nonce)
-            
-            logger.debug(f"Allocated nonce: {nonce}")
-            return nonce
+            self.current_nonce = nonce + 1
+        self._pending[nonce] = time.monotonic()
+        
+        logger.debug("Allocated nonce: {}", nonce)
+        return nonce
     
     async def confirm_nonce(self, nonce: int):
         """
@@ -75,44 +129,150 @@ class NonceManager:
         Args:
             nonce: Nonce that was confirmed
         """
-        async with self.lock:
-            if nonce in self.pending_nonces:
-                self.pending_nonces.discard(nonce)
-                logger.debug(f"Confirmed nonce: {nonce}")
+        self._cancel_cache.pop(nonce, None)
+        if self._pending.pop(nonce, None) is not None:
+            logger.debug("Confirmed nonce: {}", nonce)
+    
+    async def release_nonce(self, nonce: int):
+        """
+        Return a nonce that was allocated but never broadcast or never included
+        Other in-flight nonces keep their tracking and pre-signed cancels
+        
+        Args:
+            nonce: Nonce to release
+        """
+        if self._pending.pop(nonce, None) is None:
+            return
+        self._cancel_cache.pop(nonce, None)
+        
+        if nonce == self.current_nonce - 1:
+            # Highest nonce issued - rewind, along with any released gaps just below it
+            self.current_nonce = nonce
+            while self.current_nonce - 1 in self._released:
+                self.current_nonce -= 1
+                self._released.discard(self.current_nonce)
+        else:
+            # Later nonces are in flight - reissue this one next so they aren't blocked
+            self._released.add(nonce)
+        
+        logger.debug("Released nonce: {}", nonce)
     
     async def reset_nonce(self):
-        """Reset nonce from blockchain (used after stuck transaction)"""
+        """Reset nonce from blockchain (startup or explicit recovery - drops all tracking)"""
         async with self.lock:
-            self._sync_nonce()
-            self.pending_nonces.clear()
+            # RPC off the event loop
+            self.current_nonce = await asyncio.to_thread(self._fetch_nonce)
+            self._pending.clear()
+            self._released.clear()
+            self._cancel_cache.clear()
             logger.warning(f"Nonce reset to: {self.current_nonce}")
     
     async def get_pending_count(self) -> int:
         """Get count of pending transactions"""
-        return len(self.pending_nonces)
+        return len(self._pending)
+    
+    def _build_cancel_tx(
+        self,
+        nonce: int,
+        gas_price: Optional[int] = None,
+        fee_params: Optional[Dict[str, int]] = None
+    ) -> Dict:
+        """Build 0-value self-transfer replacing the tx at nonce"""
+        cancel_tx = {
+            'from': self.executor_address,
+            'to': self.executor_address,  # Send to self
+            'value': 0,
+            'gas': 21000,  # Minimum gas
+            'nonce': nonce,
+            'chainId': self._get_chain_id()
+        }
+        
+        if fee_params:
+            cancel_tx['type'] = 2
+            cancel_tx['maxFeePerGas'] = fee_params['maxFeePerGas']
+            cancel_tx['maxPriorityFeePerGas'] = fee_params['maxPriorityFeePerGas']
+        else:
+            cancel_tx['gasPrice'] = gas_price
+        
+        return cancel_tx
+    
+    async def presign_cancel(
+        self,
+        nonce: int,
+        wallet_manager,
+        fee_params: Dict[str, int],
+        wallet: str = 'executor',
+        bump: float = 1.125
+    ):
+        """
+        Pre-sign a cancel for a freshly broadcast nonce
+        Runs off the submit path so send_cancel() can fire without build/sign delay
+        
+        Args:
+            nonce: Nonce just broadcast
+            wallet_manager: Wallet manager for signing
+            fee_params: EIP-1559 fees of the original tx
+            wallet: 'executor' or 'admin'
+            bump: Fee multiplier (nodes require >= 10% to replace)
+        """
+        try:
+            await self._ensure_chain_id()
+            
+            bumped = {key: int(value * bump) for key, value in fee_params.items()}
+            cancel_tx = self._build_cancel_tx(nonce, fee_params=bumped)
+            
+            signed = await asyncio.to_thread(wallet_manager.sign_transaction, cancel_tx, wallet=wallet)
+            
+            # Skip if the nonce was confirmed while signing
+            if nonce in self._pending:
+                self._cancel_cache[nonce] = signed
+                
+        except Exception as e:
+            logger.error(f"Error pre-signing cancel for nonce {nonce}: {e}")
+    
+    async def send_cancel(self, nonce: int) -> Optional[bytes]:
+        """
+        Broadcast the pre-signed cancel for a stuck nonce
+        
+        Args:
+            nonce: Stuck nonce
+            
+        Returns:
+            Cancel tx hash, or None if no cancel was pre-signed
+        """
+        signed = self._cancel_cache.pop(nonce, None)
+        
+        if signed is None:
+            return None
+        
+        try:
+            tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed.rawTransaction)
+            logger.warning(f"Sent pre-signed cancel for nonce {nonce}")
+            return tx_hash
+        except Exception as e:
+            logger.error(f"Error sending cancel for nonce {nonce}: {e}")
+            return None
     
-    async def cancel_transaction(self, nonce: int, gas_price: int) -> Dict:
+    async def cancel_transaction(
+        self,
+        nonce: int,
+        gas_price: Optional[int] = None,
+        fee_params: Optional[Dict[str, int]] = None
+    ) -> Dict:
         """
         Cancel a stuck transaction by sending 0-value tx with higher gas
         
         Args:
             nonce: Nonce of stuck transaction
-            gas_price: New gas price (should be 12.5% higher than original)
+            gas_price: New legacy gas price (should be 12.5% higher than original)
+            fee_params: EIP-1559 maxFeePerGas/maxPriorityFeePerGas (takes precedence)
             
         Returns:
             Cancellation transaction dict
         """
         try:
-            # Create 0-value transaction with same nonce
-            cancel_tx = {
-                'from': self.executor_address,
-                'to': self.executor_address,  # Send to self
-                'value': 0,
-                'gas': 21000,  # Minimum gas
-                'gasPrice': gas_price,
-                'nonce': nonce,
-                'chainId': 137
-            }
+            await self._ensure_chain_id()
+            cancel_tx = self._build_cancel_tx(nonce, gas_price, fee_params)
             
             logger.warning(f"Created cancel transaction for nonce {nonce}")
             return cancel_tx
@@ -157,29 +317,31 @@ class NonceManager:
             logger.error(f"Error speeding up transaction: {e}")
             return {}
     
-    async def check_stuck_transactions(self, max_pending_blocks: int = 10) -> list:
+    async def check_stuck_transactions(self, max_age_s: float = 30) -> list:
         """
         Check for stuck transactions
         
         Args:
-            max_pending_blocks: Maximum blocks a tx can be pending
+            max_age_s: Maximum seconds a nonce can stay pending
             
         Returns:
             List of stuck transaction nonces
         """
-        stuck_nonces = []
-        
         try:
-            current_block = self.w3.eth.block_number
-            
-            for nonce in self.pending_nonces:
-                # Check if transaction exists in mempool
-                try:
-                    tx = self.w3.eth.get_transaction_by_block(nonce)
-                    if tx and (current_block - tx['blockNumber']) > max_pending_blocks:
-                        stuck_nonces.append(nonce)
-                except Exception:
-                    # Transaction not found - likely stuck
+            # One RPC (off the event loop): every nonce below the confirmed count has been mined
+            confirmed = await asyncio.to_thread(
+                self.w3.eth.get_transaction_count,
+                self.executor_address,
+                'latest'
+            )
+            now = time.monotonic()
+            stuck_nonces = []
+            
+            for nonce, allocated_at in list(self._pending.items()):
+                if nonce < confirmed:
+                    del self._pending[nonce]
+                    self._cancel_cache.pop(nonce, None)
+                elif now - allocated_at > max_age_s:
                     stuck_nonces.append(nonce)
             
             if stuck_nonces:
@@ -191,6 +353,21 @@ class NonceManager:
             logger.error(f"Error checking stuck transactions: {e}")
             return []
     
+    async def on_new_block(self, head: Dict):
+        """
+        Sweep for mined/stuck nonces on each new block
+        Stuck nonces are replaced with their pre-signed cancels
+        
+        Args:
+            head: newHeads payload
+        """
+        if not self._pending:
+            return
+        
+        for nonce in await self.check_stuck_transactions():
+            # No-op if no cancel was pre-signed or it was already sent
+            await self.send_cancel(nonce)
+    
     def get_current_nonce(self) -> int:
         """Get current nonce (without incrementing)"""
         if self.current_nonce is None:
@@ -3,17 +3,169 @@ Transaction Builder
 Constructs transactions for different arbitrage strategies
 """
 
-from typing import Dict, List, Optional
+import struct
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
 from web3 import Web3
-from eth_abi import encode
+from eth_abi.registry import registry
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
 from loguru import logger
 
+from utils.address_cache import to_checksum_address, to_address_bytes
+from strategies.opportunity import Opportunity
+
+# Polygon PoS
+POLYGON_CHAIN_ID = 137
+
+# Aave V3 Pool (liquidation target)
+AAVE_POOL = "0x794a61358D6845594F94dc1DB02A252b5b4814aD"
+
+
+class Selectors:
+    """Function selectors used by the builders (hashed once at import, not per build)"""
+    
+    # UniswapV2-style router
+    SWAP_EXACT_TOKENS_FOR_TOKENS = function_signature_to_4byte_selector(
+        'swapExactTokensForTokens(uint256,uint256,address[],address,uint256)'
+    )
+    SWAP_TOKENS_FOR_EXACT_TOKENS = function_signature_to_4byte_selector(
+        'swapTokensForExactTokens(uint256,uint256,address[],address,uint256)'
+    )
+    SWAP_EXACT_ETH_FOR_TOKENS = function_signature_to_4byte_selector(
+        'swapExactETHForTokens(uint256,address[],address,uint256)'
+    )
+    SWAP_EXACT_TOKENS_FOR_ETH = function_signature_to_4byte_selector(
+        'swapExactTokensForETH(uint256,uint256,address[],address,uint256)'
+    )
+    
+    # ERC20
+    APPROVE = function_signature_to_4byte_selector('approve(address,uint256)')
+    TRANSFER = function_signature_to_4byte_selector('transfer(address,uint256)')
+
+
+# Pre-built tuple encoder (type string parsed once, not on every encode() call)
+ENCODE_LIQUIDATION = registry.get_encoder('(uint8,address,address,address,uint256)')
+
+_ADDRESS_PAD = bytes(12)
+
+# Unset minimum outputs for 2- and 3-hop arbitrage (shared, immutable)
+_ZEROS2 = (0, 0)
+_ZEROS3 = (0, 0, 0)
+
+# Fixed-shape swapExactTokensForTokens calldata: selector + 8 words
+# [amountIn, amountOutMin, path offset, to, deadline, path length, path[0], path[1]]
+_SWAP_CALLDATA_SIZE = 4 + 8 * 32
+_SWAP_CALLDATA_TEMPLATE = bytearray(_SWAP_CALLDATA_SIZE)
+_SWAP_CALLDATA_TEMPLATE[0:4] = Selectors.SWAP_EXACT_TOKENS_FOR_TOKENS
+struct.pack_into('>Q', _SWAP_CALLDATA_TEMPLATE, 4 + 2 * 32 + 24, 5 * 32)  # path follows the 5 head words
+struct.pack_into('>Q', _SWAP_CALLDATA_TEMPLATE, 4 + 5 * 32 + 24, 2)  # path length
+# amountOutMin stays zero (accept any)
+
+
+def _address_word(address: str) -> bytes:
+    """Left-pad a hex address to a 32-byte ABI word (no checksum hashing)"""
+    return _ADDRESS_PAD + to_address_bytes(address)
+
+
+def _encode_swap_fixed2(amount_in: int, token_in: str, token_out: str, to: bytes, deadline: int) -> bytes:
+    """
+    Encode swapExactTokensForTokens calldata for a 2-token path
+    The layout is fixed, so only the variable fields are written into a copy
+    of a pre-filled buffer (selector, offset and length are already set)
+    
+    Args:
+        amount_in: Input amount (wei)
+        token_in: Token sold
+        token_out: Token bought
+        to: Recipient (20 bytes)
+        deadline: Unix deadline
+        
+    Returns:
+        Calldata including selector
+    """
+    buf = _SWAP_CALLDATA_TEMPLATE.copy()
+    
+    buf[4:36] = amount_in.to_bytes(32, 'big')
+    buf[112:132] = to
+    struct.pack_into('>Q', buf, 156, deadline)
+    buf[208:228] = to_address_bytes(token_in)
+    buf[240:260] = to_address_bytes(token_out)
+    
+    return bytes(buf)
+
+
+def _encode_approve(spender: str, amount: int) -> bytes:
+    """Encode approve(address,uint256) arguments (without selector)"""
+    return _address_word(spender) + amount.to_bytes(32, 'big')
+
+
+def _encode_arbitrage_fixed(
+    strategy_type: int,
+    path: List[bytes],
+    routers: List[bytes],
+    amounts_out_min: Sequence[int]
+) -> bytes:
+    """
+    Encode (uint8,address[],address[],uint256[]) by writing ABI words directly
+    Same output as the generic eth_abi tuple encoder, minus its per-value dispatch
+    
+    Args:
+        strategy_type: Strategy id (uint8)
+        path: 20-byte token addresses
+        routers: 20-byte router addresses
+        amounts_out_min: Minimum output amounts
+        
+    Returns:
+        ABI-encoded arguments
+    """
+    if not 0 <= strategy_type < 256:
+        raise ValueError(f"Strategy type out of uint8 range: {strategy_type}")
+    
+    # Head is 4 words; each array tail is a length word plus one word per item
+    path_offset = 4 * 32
+    routers_offset = path_offset + (len(path) + 1) * 32
+    amounts_offset = routers_offset + (len(routers) + 1) * 32
+    
+    words = [
+        strategy_type.to_bytes(32, 'big'),
+        path_offset.to_bytes(32, 'big'),
+        routers_offset.to_bytes(32, 'big'),
+        amounts_offset.to_bytes(32, 'big'),
+        len(path).to_bytes(32, 'big')
+    ]
+    words.extend(_ADDRESS_PAD + address for address in path)
+    words.append(len(routers).to_bytes(32, 'big'))
+    words.extend(_ADDRESS_PAD + address for address in routers)
+    words.append(len(amounts_out_min).to_bytes(32, 'big'))
+    words.extend(amount.to_bytes(32, 'big') for amount in amounts_out_min)
+    
+    return b''.join(words)
+
 
 class TransactionBuilder:
     """
     Builds transactions for various MEV strategies
     """
     
+    # Fixed attribute layout - read on every build
+    __slots__ = (
+        'w3',
+        'wallet_manager',
+        '_executor',
+        '_executor_bytes',
+        '_tpl_arb',
+        '_tpl_tri',
+        '_tpl_liq',
+        '_tpl_swap',
+        '_tpl_approve',
+        '_latest_timestamp',
+        '_timestamp_ts'
+    )
+    
+    # Max age of the pushed block timestamp before falling back to RPC
+    TIMESTAMP_TTL = 5.0
+    
     def __init__(self, w3: Web3, wallet_manager):
         """
         Initialize Transaction Builder
@@ -24,10 +176,63 @@ class TransactionBuilder:
         """
         self.w3 = w3
         self.wallet_manager = wallet_manager
+        
+        # Executor address resolved once (str for tx dicts, bytes for calldata)
+        self._executor = wallet_manager.executor_address
+        self._executor_bytes = to_address_bytes(self._executor)
+        
+        # Constant tx fields per strategy, copied and filled in on each build
+        self._tpl_arb = self._tx_template(500000)
+        self._tpl_tri = self._tx_template(450000)
+        self._tpl_liq = self._tx_template(350000, to=AAVE_POOL)
+        self._tpl_swap = self._tx_template(200000)
+        self._tpl_approve = self._tx_template(50000)
+        
+        # Latest block timestamp (pushed from newHeads via on_new_block)
+        self._latest_timestamp: Optional[int] = None
+        self._timestamp_ts = 0.0
+    
+    def _tx_template(self, gas: int, to: Optional[str] = None) -> Dict:
+        """Build the constant part of a strategy's transaction dict"""
+        template = {
+            'from': self._executor,
+            'value': 0,
+            'gas': gas,
+            'chainId': POLYGON_CHAIN_ID
+        }
+        
+        if to is not None:
+            template['to'] = to
+        
+        return template
+    
+    async def on_new_block(self, head: Dict):
+        """
+        Cache the block timestamp from a pushed block header (no RPC)
+        
+        Args:
+            head: newHeads payload
+        """
+        if 'timestamp' in head:
+            self._latest_timestamp = int(head['timestamp'], 16)
+            self._timestamp_ts = time.monotonic()
     
-    async def build_arbitrage_tx(
+    def _block_timestamp(self) -> int:
+        """Latest block timestamp (cached; fetched only if no recent header was pushed)"""
+        if self._latest_timestamp is None or time.monotonic() - self._timestamp_ts > self.TIMESTAMP_TTL:
+            try:
+                self._latest_timestamp = int(self.w3.eth.get_block('latest')['timestamp'])
+                self._timestamp_ts = time.monotonic()
+            except Exception as e:
+                if self._latest_timestamp is None:
+                    raise
+                # A stale timestamp still yields a valid (slightly earlier) deadline
+                logger.warning(f"Using stale block timestamp: {e}")
+        return self._latest_timestamp
+    
+    def build_arbitrage_tx(
         self,
-        opportunity: Dict,
+        opportunity: Opportunity,
         gas_price: int,
         tip: int
     ) -> Dict:
@@ -42,45 +247,34 @@ class TransactionBuilder:
         Returns:
             Transaction dict
         """
-        try:
-            # Extract parameters
-            data = opportunity['data']
-            token_a = data['pair'][0]
-            token_b = data['pair'][1]
-            buy_dex = data['buy_dex']
-            sell_dex = data['sell_dex']
-            #trade_size = data['trade_size_usd'] # Not used in encoding
-            
-            # Encode arbitrage parameters
-            # Strategy type: 1 = Direct arbitrage
-            params = self._encode_arbitrage_params(
-                strategy_type=1,
-                path=[token_a, token_b, token_a],
-                routers=[buy_dex, sell_dex],
-                amounts_out_min=[0, 0]  # Will be calculated
-            )
-            
-            # Build transaction
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': buy_dex,  # First DEX router
-                'value': 0,
-                'gas': 500000,
-                'maxFeePerGas': gas_price + tip,
-                'maxPriorityFeePerGas': tip,
-                'data': params,
-                'chainId': 137
-            }
-            
-            return tx
-            
-        except Exception as e:
-            logger.error(f"Error building arbitrage transaction: {e}")
-            return {}
+        # Extract parameters (addresses - 'pair'/'buy_dex'/'sell_dex' are symbols and names)
+        data = opportunity.data
+        token_a, token_b = data['pair_addresses']
+        buy_router = data['buy_router']
+        sell_router = data['sell_router']
+        #trade_size = data['trade_size_usd'] # Not used in encoding
+        
+        # Encode arbitrage parameters
+        # Strategy type: 1 = Direct arbitrage
+        params = self._encode_arbitrage_params(
+            strategy_type=1,
+            path=[token_a, token_b, token_a],
+            routers=[buy_router, sell_router],
+            amounts_out_min=_ZEROS2  # Will be calculated
+        )
+        
+        # Build transaction
+        tx = self._tpl_arb.copy()
+        tx['to'] = buy_router  # First DEX router
+        tx['maxFeePerGas'] = gas_price + tip
+        tx['maxPriorityFeePerGas'] = tip
+        tx['data'] = HexBytes(params)
+        
+        return tx
     
-    async def build_triangular_tx(
+    def build_triangular_tx(
         self,
-        opportunity: Dict,
+        opportunity: Opportunity,
         gas_price: int,
         tip: int
     ) -> Dict:
@@ -95,41 +289,31 @@ class TransactionBuilder:
         Returns:
             Transaction dict
         """
-        try:
-            data = opportunity['data']
-            path = data['path']  # [A, B, C, A]
-            dex_config = data['dex_config']
-            # trade_size = data['trade_size_usd']  # Not used in encoding
-            
-            # Encode parameters
-            # Strategy type: 2 = Triangular arbitrage
-            params = self._encode_arbitrage_params(
-                strategy_type=2,
-                path=path,
-                routers=[dex_config['router']] * 3,  # Same DEX for all swaps
-                amounts_out_min=[0, 0, 0]
-            )
-            
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': dex_config['router'],
-                'value': 0,
-                'gas': 450000,
-                'maxFeePerGas': gas_price + tip,
-                'maxPriorityFeePerGas': tip,
-                'data': params,
-                'chainId': 137
-            }
-            
-            return tx
-            
-        except Exception as e:
-            logger.error(f"Error building triangular transaction: {e}")
-            return {}
+        data = opportunity.data
+        path = data['path']  # [A, B, C, A]
+        dex_config = data['dex_config']
+        # trade_size = data['trade_size_usd']  # Not used in encoding
+        
+        # Encode parameters
+        # Strategy type: 2 = Triangular arbitrage
+        params = self._encode_arbitrage_params(
+            strategy_type=2,
+            path=path,
+            routers=[dex_config['router']] * 3,  # Same DEX for all swaps
+            amounts_out_min=_ZEROS3
+        )
+        
+        tx = self._tpl_tri.copy()
+        tx['to'] = dex_config['router']
+        tx['maxFeePerGas'] = gas_price + tip
+        tx['maxPriorityFeePerGas'] = tip
+        tx['data'] = HexBytes(params)
+        
+        return tx
     
-    async def build_liquidation_tx(
+    def build_liquidation_tx(
         self,
-        opportunity: Dict,
+        opportunity: Opportunity,
         gas_price: int,
         tip: int
     ) -> Dict:
@@ -144,166 +328,159 @@ class TransactionBuilder:
         Returns:
             Transaction dict
         """
-        try:
-            data = opportunity['data']
-            
-            # Encode liquidation parameters
-            # Strategy type: 3 = Liquidation
-            params = encode(
-                ['uint8', 'address', 'address', 'address', 'uint256'],
-                [
-                    3,  # Strategy type
-                    data['collateral_asset'],
-                    data['debt_asset'],
-                    data['user_address'],
-                    int(data['debt_to_cover'] * 10**18)
-                ]
-            )
-            
-            # Aave Pool address
-            aave_pool = "0x794a61358D6845594F94dc1DB02A252b5b4814aD"
-            
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': aave_pool,
-                'value': 0,
-                'gas': 350000,
-                'maxFeePerGas': gas_price + tip,
-                'maxPriorityFeePerGas': tip,
-                'data': params,
-                'chainId': 137
-            }
-            
-            return tx
-            
-        except Exception as e:
-            logger.error(f"Error building liquidation transaction: {e}")
-            return {}
+        data = opportunity.data
+        
+        # Encode liquidation parameters
+        # Strategy type: 3 = Liquidation
+        params = ENCODE_LIQUIDATION((
+            3,  # Strategy type
+            to_address_bytes(data['collateral_asset']),
+            to_address_bytes(data['debt_asset']),
+            to_address_bytes(data['user_address']),
+            data['debt_to_cover_wei']  # Integer wei, converted upstream
+        ))
+        
+        tx = self._tpl_liq.copy()
+        tx['maxFeePerGas'] = gas_price + tip
+        tx['maxPriorityFeePerGas'] = tip
+        tx['data'] = HexBytes(params)
+        
+        return tx
     
-    async def build_sandwich_tx(
+    def build_sandwich_tx(
         self,
         opportunity: Dict,
         gas_price: int,
-        tip: int
+        tip: int,
+        timestamp: Optional[int] = None
     ) -> Dict:
         """
         Build transaction for sandwich attack (front-run)
         
         Args:
-            opportunity: Sandwich opportunity
+            opportunity: Sandwich analysis (Opportunity.data)
             gas_price: Gas price in wei
             tip: Priority fee in wei
+            timestamp: Prefetched latest block timestamp (uses cached value if None)
             
         Returns:
             Transaction dict for front-run
         """
-        try:
-            front_run_params = opportunity['front_run_params']
-            
-            # Build front-run transaction
-            # This buys tokens before the victim
-            router_address = opportunity['victim_swap_params']['router']
-            
-            # Encode swap parameters
-            path = [
-                Web3.to_checksum_address(front_run_params['token_in']),
-                Web3.to_checksum_address(front_run_params['token_out'])
-            ]
-            
-            # Router function: swapExactTokensForTokens
-            function_sig = Web3.keccak(text="swapExactTokensForTokens(uint256,uint256,address[],address,uint256)")[:4]
-            
-            params = encode(
-                ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
-                [
-                    front_run_params['amount_in'],
-                    0,  # amountOutMin (accept any)
-                    path,
-                    self.wallet_manager.executor_address,
-                    int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                ]
-            )
-            
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': router_address,
-                'value': 0,
-                'gas': 200000,
-                'maxFeePerGas': gas_price + tip,
-                'maxPriorityFeePerGas': tip,
-                'data': function_sig.hex() + params.hex(),
-                'chainId': 137
-            }
-            
-            return tx
-            
-        except Exception as e:
-            logger.error(f"Error building sandwich transaction: {e}")
-            return {}
+        # Front-run buys tokens before the victim
+        return self._build_swap_leg(
+            opportunity['front_run_params'],
+            opportunity['victim_swap_params']['router'],
+            gas_price + tip,
+            tip,
+            self._deadline(timestamp)
+        )
     
-    async def build_backrun_tx(
+    def build_backrun_tx(
         self,
         opportunity: Dict,
         gas_price: int,
-        tip: int
+        tip: int,
+        timestamp: Optional[int] = None
     ) -> Dict:
         """
         Build back-run transaction for sandwich attack
         
         Args:
-            opportunity: Sandwich opportunity
+            opportunity: Sandwich analysis (Opportunity.data)
             gas_price: Gas price in wei
             tip: Priority fee in wei
+            timestamp: Prefetched latest block timestamp (uses cached value if None)
             
         Returns:
             Transaction dict for back-run
         """
-        try:
-            back_run_params = opportunity['back_run_params']
-            router_address = opportunity['victim_swap_params']['router']
-            
-            # Reverse path (sell tokens)
-            path = [
-                Web3.to_checksum_address(back_run_params['token_in']),
-                Web3.to_checksum_address(back_run_params['token_out'])
-            ]
-            
-            function_sig = Web3.keccak(text="swapExactTokensForTokens(uint256,uint256,address[],address,uint256)")[:4]
-            
-            params = encode(
-                ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
-                [
-                    int(back_run_params['amount_in']),
-                    0,
-                    path,
-                    self.wallet_manager.executor_address,
-                    int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                ]
-            )
-            
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': router_address,
-                'value': 0,
-                'gas': 200000,
-                'maxFeePerGas': gas_price,
-                'maxPriorityFeePerGas': int(tip * 0.5),  # Lower tip for back-run
-                'data': function_sig.hex() + params.hex(),
-                'chainId': 137
-            }
+        # Back-run sells the tokens on the reverse path, with a lower tip
+        return self._build_swap_leg(
+            opportunity['back_run_params'],
+            opportunity['victim_swap_params']['router'],
+            gas_price,
+            int(tip * 0.5),
+            self._deadline(timestamp)
+        )
+    
+    def build_sandwich_pair(
+        self,
+        opportunity: Dict,
+        gas_price: int,
+        tip: int,
+        timestamp: Optional[int] = None
+    ) -> Tuple[Dict, Dict]:
+        """
+        Build both sandwich legs sharing one deadline (single timestamp read)
+        
+        Args:
+            opportunity: Sandwich analysis (Opportunity.data)
+            gas_price: Gas price in wei
+            tip: Priority fee in wei
+            timestamp: Prefetched latest block timestamp (uses cached value if None)
             
-            return tx
+        Returns:
+            Tuple of (front_run_tx, back_run_tx)
+        """
+        router_address = opportunity['victim_swap_params']['router']
+        deadline = self._deadline(timestamp)
+        
+        front_tx = self._build_swap_leg(
+            opportunity['front_run_params'], router_address, gas_price + tip, tip, deadline
+        )
+        back_tx = self._build_swap_leg(
+            opportunity['back_run_params'], router_address, gas_price, int(tip * 0.5), deadline
+        )
+        
+        return front_tx, back_tx
+    
+    def _deadline(self, timestamp: Optional[int] = None) -> int:
+        """Swap deadline: 5 minutes past the latest block"""
+        return (timestamp if timestamp is not None else self._block_timestamp()) + 300
+    
+    def _build_swap_leg(
+        self,
+        leg_params: Dict,
+        router_address: str,
+        max_fee: int,
+        priority_fee: int,
+        deadline: int
+    ) -> Dict:
+        """
+        Build one swapExactTokensForTokens leg of a sandwich
+        
+        Args:
+            leg_params: Leg parameters (amount_in, token_in, token_out)
+            router_address: Router to swap on
+            max_fee: maxFeePerGas in wei
+            priority_fee: maxPriorityFeePerGas in wei
+            deadline: Swap deadline (unix time)
             
-        except Exception as e:
-            logger.error(f"Error building backrun transaction: {e}")
-            return {}
+        Returns:
+            Transaction dict
+        """
+        calldata = _encode_swap_fixed2(
+            int(leg_params['amount_in']),
+            leg_params['token_in'],
+            leg_params['token_out'],
+            self._executor_bytes,
+            deadline
+        )
+        
+        tx = self._tpl_swap.copy()
+        tx['to'] = router_address
+        tx['maxFeePerGas'] = max_fee
+        tx['maxPriorityFeePerGas'] = priority_fee
+        tx['data'] = HexBytes(calldata)
+        
+        return tx
     
     def _encode_arbitrage_params(
         self,
         strategy_type: int,
         path: List[str],
         routers: List[str],
-        amounts_out_min: List[int]
+        amounts_out_min: Sequence[int]
     ) -> bytes:
         """
         Encode arbitrage parameters for smart contract
@@ -317,24 +494,14 @@ class TransactionBuilder:
         Returns:
             Encoded bytes
         """
-        # Convert addresses to checksummed format
-        path_checksummed = [Web3.to_checksum_address(addr) for addr in path]
-        routers_checksummed = [Web3.to_checksum_address(addr) for addr in routers]
+        # Raw 20-byte addresses (memoized, no checksum keccak per address)
+        path_bytes = [to_address_bytes(addr) for addr in path]
+        routers_bytes = [to_address_bytes(addr) for addr in routers]
         
-        # Encode parameters
-        encoded = encode(
-            ['uint8', 'address[]', 'address[]', 'uint256[]'],
-            [
-                strategy_type,
-                path_checksummed,
-                routers_checksummed,
-                amounts_out_min
-            ]
-        )
-        
-        return encoded
+        # Fixed schema - encoded directly rather than through eth_abi
+        return _encode_arbitrage_fixed(strategy_type, path_bytes, routers_bytes, amounts_out_min)
     
-    async def build_approve_tx(
+    def build_approve_tx(
         self,
         token_address: str,
         spender_address: str,
@@ -353,27 +520,11 @@ class TransactionBuilder:
         Returns:
             Transaction dict
         """
-        try:
-            # ERC20 approve function signature
-            function_sig = Web3.keccak(text="approve(address,uint256)")[:4]
-            
-            params = encode(
-                ['address', 'uint256'],
-                [Web3.to_checksum_address(spender_address), amount]
-            )
-            
-            tx = {
-                'from': self.wallet_manager.executor_address,
-                'to': Web3.to_checksum_address(token_address),
-                'value': 0,
-                'gas': 50000,
-                'gasPrice': gas_price,
-                'data': function_sig.hex() + params.hex(),
-                'chainId': 137
-            }
-            
-            return tx
-            
-        except Exception as e:
-            logger.error(f"Error building approve transaction: {e}")
-            return {}
\ No newline at end of file
+        params = _encode_approve(spender_address, amount)
+        
+        tx = self._tpl_approve.copy()
+        tx['to'] = to_checksum_address(token_address)
+        tx['gasPrice'] = gas_price
+        tx['data'] = HexBytes(Selectors.APPROVE + params)
+        
+        return tx
\ No newline at end of file
@@ -3,12 +3,17 @@ MEV Bot Engine - Core orchestration logic
 Handles multi-strategy switching, opportunity detection, and execution
 """
 
+import os
 import asyncio
-import json
+import functools
 import time
 from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
 from decimal import Decimal
 from loguru import logger
+import aiohttp
+import numpy as np
+import orjson
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 
@@ -16,10 +21,12 @@ from strategies.flashloan_arb import FlashloanArbitrage
 from strategies.triangular_arb import TriangularArbitrage
 from strategies.liquidation_arb import LiquidationArbitrage
 from strategies.sandwich_attack import SandwichAttack
+from strategies.opportunity import Opportunity, StrategyKind
 
-from monitoring.mempool_monitor import MempoolMonitor
+from monitoring.mempool_monitor import MempoolMonitor, SWAP_SELECTORS
 from monitoring.price_monitor import PriceMonitor
 from monitoring.liquidity_monitor import LiquidityMonitor
+from monitoring.block_monitor import BlockMonitor
 
 from blockchain.contract_manager import ContractManager
 from blockchain.transaction_builder import TransactionBuilder
@@ -31,15 +38,34 @@ from ml.tip_optimizer import TipOptimizer
 from utils.multicall import Multicall
 from utils.gas_calculator import GasCalculator
 from utils.simulation import TransactionSimulator
-from utils.rpc_manager import RPCManager
+from utils.rpc_manager import RPCManager, batch_request
 from utils.alert_system import AlertSystem
 from utils.kill_switch import KillSwitch
-from utils.data_cache import DataCache
+from utils.arb_scan import scan_pairs
 
 from .strategy_manager import StrategyManager
 from .wallet_manager import WalletManager
 
 
+# Same selectors the mempool monitor admits, as raw bytes
+SANDWICH_SWAP_SELECTORS = frozenset(selector.to_bytes(4, 'big') for selector in SWAP_SELECTORS)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a JSON config file (memoized on path + mtime)
+    Re-instantiating the engine skips the parse until the file changes
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _load_config(path: str) -> Dict:
+    """Load a JSON config file through the mtime-keyed cache"""
+    return _load_config_cached(path, os.stat(path).st_mtime_ns)
+
+
 class MEVBotEngine:
     """
     Main MEV Bot Engine
@@ -51,14 +77,76 @@ class MEVBotEngine:
         logger.info("Initializing MEV Bot Engine...")
         
         # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = _load_config(config_path)
+        self.dex_config = _load_config("config/dex_config.json")
+        self.token_config = _load_config("config/token_config.json")
+        
+        # Static (pair x DEX) price query plan for direct arbitrage
+        # Token pairs as tuples (hashable dict keys, converted once)
+        self._pairs_tuples = [tuple(pair) for pair in self.token_config['high_volume_pairs']]
+        self._price_call_plan = self._build_price_call_plan()
+        
+        # Price matrix columns for the direct-arbitrage scan (quoted DEXes, plan order)
+        self._arb_dexes = list(dict.fromkeys(call['dex'] for call in self._price_call_plan))
+        self._arb_dex_index = {dex_name: col for col, dex_name in enumerate(self._arb_dexes)}
+        
+        # Addresses the direct-arbitrage builder encodes (opportunities carry symbols and DEX names)
+        self._arb_routers = {call['dex']: call['router'] for call in self._price_call_plan}
+        self._pair_addresses = {
+            pair: tuple(self.token_config['tokens'][symbol]['address'] for symbol in pair)
+            for pair in self._pairs_tuples
+        }
+        
+        # Hot-path config values (re-read these after a config reload)
+        self._min_conf = self.config['ml_optimization']['min_confidence_score']
+        self._strategy_enabled = {
+            name: settings.get('enabled', False)
+            for name, settings in self.config['strategies'].items()
+        }
+        
+        # Mempool pre-filter: known routers (lowercase) of enabled DEXes
+        self._dex_routers = frozenset(
+            dex_data['router'].lower()
+            for dex_data in self.dex_config['polygon_dexes'].values()
+            if dex_data.get('enabled') and 'router' in dex_data
+        )
+        
+        # Polygon block time (seconds) - max price cache lifetime between pushed heads
+        self._block_time_seconds = 2
+        
+        # Direct-arbitrage quotes for the current block, call plan cache_key -> price
+        # Replaced wholesale on each new head (see _on_new_block)
+        self._price_quotes: Dict[str, float] = {}
+        self._price_quotes_since = time.monotonic()
+        
+        # Arbitrage gas cost (USD) for one block: (block_number, value)
+        self._gas_cache: Tuple[Optional[int], float] = (None, 0.0)
+        
+        # Target main loop period (seconds) - sleep only for what's left of it
+        self._loop_period = 0.05
+        
+        # Mempool scan: concurrent analyses and overall deadline (seconds)
+        self._sandwich_concurrency = 16
+        self._sandwich_scan_timeout = 0.25
         
-        with open("config/dex_config.json", 'r') as f:
-            self.dex_config = json.load(f)
+        # Per-scan deadline (seconds) - a slow RPC drops that scan, not the loop
+        # (keep it above the sandwich deadline so its own timeout fires first)
+        self._scan_deadline = self.config['performance'].get('scan_deadline_ms', 1000) / 1000
         
-        with open("config/token_config.json", 'r') as f:
-            self.token_config = json.load(f)
+        # Scans still running past their deadline, scan name -> task
+        # The next loop joins these instead of starting over, so their fetches still fill the caches
+        self._scan_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Private relays for bundle submission (comma-separated MEV_RELAY_URLS)
+        self._relay_urls = [
+            url.strip()
+            for url in os.getenv('MEV_RELAY_URLS', '').split(',')
+            if url.strip()
+        ]
+        self._relay_session: Optional[aiohttp.ClientSession] = None  # created on first bundle
+        self._relay_timeout = aiohttp.ClientTimeout(
+            total=self.config['mev_boost']['builder_timeout_ms'] / 1000
+        )
         
         # Initialize RPC Manager (Tier 1-4 fallback system)
         self.rpc_manager = RPCManager()
@@ -66,8 +154,8 @@ class MEVBotEngine:
         
         # Initialize core components
         self.wallet_manager = WalletManager()
-        self.contract_manager = ContractManager(self.w3)
         self.nonce_manager = NonceManager(self.w3, self.wallet_manager.executor_address)
+        self.contract_manager = ContractManager(self.w3, self.nonce_manager)
         self.tx_builder = TransactionBuilder(self.w3, self.wallet_manager)
         
         # Initialize utilities
@@ -76,7 +164,6 @@ class MEVBotEngine:
         self.simulator = TransactionSimulator(self.w3)
         self.alert_system = AlertSystem()
         self.kill_switch = KillSwitch(self.config, self.alert_system)
-        self.cache = DataCache()
         
         # Initialize ML components
         self.price_predictor = PricePredictor(self.config)
@@ -87,6 +174,13 @@ class MEVBotEngine:
         self.price_monitor = PriceMonitor(self.config, self.token_config)
         self.liquidity_monitor = LiquidityMonitor(self.w3, self.dex_config)
         
+        # Per-block cache refresh (fees, stuck nonces, block timestamp) pushed over WebSocket
+        self.block_monitor = BlockMonitor(self.rpc_manager)
+        self.block_monitor.add_listener(self.contract_manager.on_new_block)
+        self.block_monitor.add_listener(self.nonce_manager.on_new_block)
+        self.block_monitor.add_listener(self.tx_builder.on_new_block)
+        self.block_monitor.add_listener(self._on_new_block)
+        
         # Initialize strategies
         self.flashloan_arb = FlashloanArbitrage(
             self.w3,
@@ -144,6 +238,10 @@ class MEVBotEngine:
         asyncio.create_task(self.mempool_monitor.start())
         asyncio.create_task(self.price_monitor.start())
         asyncio.create_task(self.liquidity_monitor.start())
+        asyncio.create_task(self.block_monitor.start())
+        
+        # Initial nonce sync overlaps with monitor startup
+        await self.nonce_manager.ensure_synced()
         
         # Start main loop
         await self.main_loop()
@@ -156,6 +254,9 @@ class MEVBotEngine:
         logger.info("Entering main execution loop...")
         
         while self.running:
+            loop_start = time.monotonic()
+            executed = False
+            
             try:
                 # Check kill switch
                 if self.kill_switch.is_triggered():
@@ -169,32 +270,37 @@ class MEVBotEngine:
                     continue
                 
                 # MULTI-STRATEGY SWITCHING LOGIC
-                # 1. Check sandwich attack opportunities (highest priority)
-                sandwich_opp = await self._check_sandwich_opportunities()
-                
-                # 2. Check liquidation opportunities
-                liquidation_opp = await self._check_liquidation_opportunities()
-                
-                # 3. Check direct arbitrage
-                direct_arb_opp = await self._check_direct_arbitrage()
+                # All four scans are I/O-bound and independent - run them concurrently
+                # (priority ordering is applied by the strategy manager)
+                results = await asyncio.gather(
+                    self._bounded_scan(self._check_sandwich_opportunities),
+                    self._bounded_scan(self._check_liquidation_opportunities),
+                    self._bounded_scan(self._check_direct_arbitrage),
+                    self._bounded_scan(self._check_triangular_arbitrage),
+                    return_exceptions=True
+                )
                 
-                # 4. Check triangular arbitrage
-                triangular_opp = await self._check_triangular_arbitrage()
+                opportunities = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error checking opportunities: {result}")
+                    else:
+                        opportunities.append(result)
                 
                 # Select best opportunity
-                best_opportunity = self.strategy_manager.select_best_opportunity([
-                    sandwich_opp,
-                    liquidation_opp,
-                    direct_arb_opp,
-                    triangular_opp
-                ])
+                best_opportunity = self.strategy_manager.select_best_opportunity(opportunities)
                 
                 if best_opportunity:
-                    logger.info(f"🎯 Best opportunity: {best_opportunity['strategy']} - "
-                               f"Expected profit: ${best_opportunity['expected_profit_usd']:.2f}")
+                    # Lazy formatting: args are only formatted if a sink accepts the level
+                    logger.info(
+                        "🎯 Best opportunity: {} - Expected profit: ${:.2f}",
+                        best_opportunity.strategy,
+                        best_opportunity.expected_profit_usd
+                    )
                     
                     # Execute opportunity
                     success = await self._execute_opportunity(best_opportunity)
+                    executed = True
                     
                     if success:
                         self.stats['successful_trades'] += 1
@@ -205,41 +311,119 @@ class MEVBotEngine:
                     
                     self.stats['total_trades'] += 1
                 
-                # Small delay to prevent CPU overload
-                await asyncio.sleep(0.1)
+                # Pace to the loop period; rescan immediately after an execution
+                if not executed:
+                    elapsed = time.monotonic() - loop_start
+                    await asyncio.sleep(max(0.0, self._loop_period - elapsed))
                 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
                 await asyncio.sleep(1)
     
-    async def _check_sandwich_opportunities(self) -> Optional[Dict]:
+    async def _bounded_scan(self, scan) -> Optional[Opportunity]:
+        """
+        Run one opportunity scan under the per-scan deadline
+        A scan that overruns keeps running in the background (not cancelled)
+        
+        Args:
+            scan: One of the _check_* coroutine methods
+            
+        Returns:
+            Scan result, or None if the deadline passed
+        """
+        name = scan.__name__
+        task = self._scan_tasks.get(name)
+        
+        if task is None:
+            task = asyncio.ensure_future(scan())
+            self._scan_tasks[name] = task
+            task.add_done_callback(lambda done: self._on_scan_done(name, done))
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=self._scan_deadline)
+        except asyncio.TimeoutError:
+            logger.debug("{} exceeded the {}s scan deadline", scan.__name__, self._scan_deadline)
+            return None
+    
+    def _on_scan_done(self, name: str, task: asyncio.Task):
+        """
+        Forget a finished scan task
+        
+        Args:
+            name: Scan method name
+            task: Finished scan task
+        """
+        self._scan_tasks.pop(name, None)
+        
+        # Scans log their own errors - mark an overrun's exception as retrieved
+        if not task.cancelled():
+            task.exception()
+    
+    async def _check_sandwich_opportunities(self) -> Optional[Opportunity]:
         """
         Check mempool for sandwich attack opportunities
         Priority: 5 (Highest)
         """
-        if not self.config['strategies']['sandwich_attack']['enabled']:
+        if not self._strategy_enabled['sandwich_attack']:
             return None
         
         try:
             # Get pending transactions from mempool
             pending_txs = self.mempool_monitor.get_pending_transactions()
             
-            for tx_hash, tx_data in pending_txs.items():
-                # Analyze transaction for sandwich potential
-                analysis = await self.sandwich_attack.analyze_transaction(tx_data)
-                
-                if analysis and analysis['is_profitable']:
+            if not pending_txs:
+                return None
+            
+            semaphore = asyncio.Semaphore(self._sandwich_concurrency)
+            
+            async def analyze(tx_data: Dict) -> Optional[Tuple[Dict, Dict]]:
+                async with semaphore:
+                    # Analyze transaction for sandwich potential
+                    analysis = await self.sandwich_attack.analyze_transaction(tx_data)
+                    
+                    if not analysis or not analysis['is_profitable']:
+                        return None
+                    
                     # ML prediction for success probability
                     ml_prediction = await self.price_predictor.predict_sandwich_success(analysis)
+                    return analysis, ml_prediction
+            
+            # Analyses run concurrently; take the first confident hit
+            tasks = [
+                asyncio.create_task(analyze(tx_data))
+                for tx_data in pending_txs.values()
+                if self._is_sandwich_candidate(tx_data)
+            ]
+            
+            if not tasks:
+                return None
+            
+            try:
+                for next_done in asyncio.as_completed(tasks, timeout=self._sandwich_scan_timeout):
+                    try:
+                        result = await next_done
+                    except asyncio.TimeoutError:
+                        # Raised by as_completed itself - the whole scan is out of time
+                        raise
+                    except Exception as e:
+                        logger.debug("Error analyzing pending tx: {}", e)
+                        continue
                     
-                    if ml_prediction['confidence'] >= self.config['ml_optimization']['min_confidence_score']:
-                        return {
-                            'strategy': 'sandwich_attack',
-                            'priority': 5,
-                            'expected_profit_usd': analysis['expected_profit_usd'],
-                            'confidence': ml_prediction['confidence'],
-                            'data': analysis
-                        }
+                    if result and result[1]['confidence'] >= self._min_conf:
+                        analysis, ml_prediction = result
+                        return Opportunity(
+                            strategy='sandwich_attack',
+                            kind=StrategyKind.SANDWICH,
+                            priority=5,
+                            expected_profit_usd=analysis['expected_profit_usd'],
+                            confidence=ml_prediction['confidence'],
+                            data=analysis
+                        )
+            except asyncio.TimeoutError:
+                logger.debug("Sandwich scan deadline reached")
+            finally:
+                for task in tasks:
+                    task.cancel()
             
             return None
             
@@ -247,12 +431,30 @@ class MEVBotEngine:
             logger.error(f"Error checking sandwich opportunities: {e}")
             return None
     
-    async def _check_liquidation_opportunities(self) -> Optional[Dict]:
+    def _is_sandwich_candidate(self, tx_data: Dict) -> bool:
+        """
+        Cheap pre-filter before the sandwich analysis
+        Keeps only txs sent to a known router with a known swap selector
+        """
+        to = tx_data.get('to')
+        
+        if not to or to.lower() not in self._dex_routers:
+            return False
+        
+        data = tx_data.get('input')
+        
+        if not data or len(data) < (10 if isinstance(data, str) else 4):
+            return False
+        
+        selector = bytes.fromhex(data[2:10]) if isinstance(data, str) else bytes(data[:4])
+        return selector in SANDWICH_SWAP_SELECTORS
+    
+    async def _check_liquidation_opportunities(self) -> Optional[Opportunity]:
         """
         Check for liquidation opportunities in lending protocols
         Priority: 4
         """
-        if not self.config['strategies']['liquidation_arbitrage']['enabled']:
+        if not self._strategy_enabled['liquidation_arbitrage']:
             return None
         
         try:
@@ -268,14 +470,15 @@ class MEVBotEngine:
                     'liquidation'
                 )
                 
-                if ml_prediction['confidence'] >= self.config['ml_optimization']['min_confidence_score']:
-                    return {
-                        'strategy': 'liquidation_arbitrage',
-                        'priority': 4,
-                        'expected_profit_usd': best['expected_profit_usd'],
-                        'confidence': ml_prediction['confidence'],
-                        'data': best
-                    }
+                if ml_prediction['confidence'] >= self._min_conf:
+                    return Opportunity(
+                        strategy='liquidation_arbitrage',
+                        kind=StrategyKind.LIQ_ARB,
+                        priority=4,
+                        expected_profit_usd=best['expected_profit_usd'],
+                        confidence=ml_prediction['confidence'],
+                        data=best
+                    )
             
             return None
             
@@ -283,75 +486,60 @@ class MEVBotEngine:
             logger.error(f"Error checking liquidation opportunities: {e}")
             return None
     
-    async def _check_direct_arbitrage(self) -> Optional[Dict]:
+    async def _check_direct_arbitrage(self) -> Optional[Opportunity]:
         """
         Check for direct arbitrage opportunities (DEX A -> DEX B)
         Priority: 2
         """
-        if not self.config['strategies']['direct_arbitrage']['enabled']:
+        if not self._strategy_enabled['direct_arbitrage']:
             return None
         
         try:
             # Get token pairs
-            pairs = self.token_config['high_volume_pairs']
+            pairs = self._pairs_tuples
             
-            # Use multicall to batch price queries
-            price_calls = []
-            for pair in pairs:
-                for dex_name, dex_data in self.dex_config['polygon_dexes'].items():
-                    if not dex_data.get('enabled'):
-                        continue
-                    
-                    price_calls.append({
-                        'dex': dex_name,
-                        'pair': pair,
-                        'router': dex_data['router']
-                    })
+            # Batch fetch prices (gas-optimized, plan built once from config)
+            prices = await self._fetch_prices_multicall(self._price_call_plan)
+            
+            # Pack quotes into a (pairs x dexes) matrix, NaN where a DEX has no quote
+            price_matrix = np.full((len(pairs), len(self._arb_dexes)), np.nan)
             
-            # Batch fetch prices (gas-optimized)
-            prices = await self._fetch_prices_multicall(price_calls)
+            for row, pair in enumerate(pairs):
+                for dex_name, price in prices.get(pair, {}).items():
+                    price_matrix[row, self._arb_dex_index[dex_name]] = price
+            
+            # Gas cost is the same for every pair - estimate it once
+            settings = self.config['strategies']['direct_arbitrage']
+            trade_size = settings['max_trade_size_usd']
+            gas_cost = await self._arbitrage_gas_cost()
+            
+            # Find the best spread (at least 0.5% difference)
+            row, buy_col, sell_col, net_profit = scan_pairs(
+                price_matrix,
+                float(gas_cost),
+                float(trade_size),
+                float(settings['min_profit_usd']),
+                0.5
+            )
             
-            # Find arbitrage opportunities
-            best_profit = 0
             best_opportunity = None
             
-            for pair in pairs:
-                # Calculate cross-DEX price difference
-                dex_prices = {k: v for k, v in prices.items() if k[1] == tuple(pair)}
-                
-                if len(dex_prices) < 2:
-                    continue
-                
-                # Find max price difference
-                min_dex, min_price = min(dex_prices.items(), key=lambda x: x[1])
-                max_dex, max_price = max(dex_prices.items(), key=lambda x: x[1])
-                
-                if min_price <= 0 or max_price <= 0:
-                    continue
-                
-                # Calculate potential profit
-                price_diff_pct = ((max_price - min_price) / min_price) * 100
+            if row >= 0:
+                buy_dex = self._arb_dexes[buy_col]
+                sell_dex = self._arb_dexes[sell_col]
                 
-                if price_diff_pct > 0.5:  # At least 0.5% difference
-                    # Estimate profit
-                    trade_size = self.config['strategies']['direct_arbitrage']['max_trade_size_usd']
-                    expected_profit = (trade_size * price_diff_pct / 100)
-                    
-                    # Subtract gas costs
-                    gas_cost = await self.gas_calculator.estimate_arbitrage_gas_cost()
-                    net_profit = expected_profit - gas_cost
-                    
-                    if net_profit > best_profit and net_profit >= self.config['strategies']['direct_arbitrage']['min_profit_usd']:
-                        best_profit = net_profit
-                        best_opportunity = {
-                            'pair': pair,
-                            'buy_dex': min_dex[0],
-                            'sell_dex': max_dex[0],
-                            'buy_price': min_price,
-                            'sell_price': max_price,
-                            'trade_size_usd': trade_size,
-                            'expected_profit_usd': net_profit
-                        }
+                best_opportunity = {
+                    'pair': pairs[row],
+                    'pair_addresses': self._pair_addresses[pairs[row]],
+                    'buy_dex': buy_dex,
+                    'sell_dex': sell_dex,
+                    'buy_router': self._arb_routers[buy_dex],
+                    'sell_router': self._arb_routers[sell_dex],
+                    'buy_price': float(price_matrix[row, buy_col]),
+                    'sell_price': float(price_matrix[row, sell_col]),
+                    'trade_size_usd': trade_size,
+                    'expected_profit_usd': float(net_profit)
+                }
             
             if best_opportunity:
                 # ML confidence check
@@ -360,14 +548,15 @@ class MEVBotEngine:
                     'direct_arbitrage'
                 )
                 
-                if ml_prediction['confidence'] >= self.config['ml_optimization']['min_confidence_score']:
-                    return {
-                        'strategy': 'direct_arbitrage',
-                        'priority': 2,
-                        'expected_profit_usd': best_opportunity['expected_profit_usd'],
-                        'confidence': ml_prediction['confidence'],
-                        'data': best_opportunity
-                    }
+                if ml_prediction['confidence'] >= self._min_conf:
+                    return Opportunity(
+                        strategy='direct_arbitrage',
+                        kind=StrategyKind.DIRECT_ARB,
+                        priority=2,
+                        expected_profit_usd=best_opportunity['expected_profit_usd'],
+                        confidence=ml_prediction['confidence'],
+                        data=best_opportunity
+                    )
             
             return None
             
@@ -375,12 +564,51 @@ class MEVBotEngine:
             logger.error(f"Error checking direct arbitrage: {e}")
             return None
     
-    async def _check_triangular_arbitrage(self) -> Optional[Dict]:
+    async def _arbitrage_gas_cost(self) -> float:
+        """
+        Arbitrage gas cost in USD, estimated at most once per block
+        Falls back to estimating every call until the block monitor sees a head
+        """
+        block_number = self.block_monitor.latest_block_number
+        cached_block, gas_cost = self._gas_cache
+        
+        if block_number is None or cached_block != block_number:
+            gas_cost = await self.gas_calculator.estimate_arbitrage_gas_cost()
+            self._gas_cache = (block_number, gas_cost)
+        
+        return gas_cost
+    
+    def _build_price_call_plan(self) -> List[Dict]:
+        """
+        Build the direct-arbitrage price queries from config
+        Pairs and DEXes are static, so this runs once (rebuild after a config reload)
+        
+        Returns:
+            List of dicts with 'dex', 'pair' (tuple), 'router' and 'cache_key'
+        """
+        price_calls = []
+        
+        for pair in self._pairs_tuples:
+            for dex_name, dex_data in self.dex_config['polygon_dexes'].items():
+                # Only router-based DEXes can be quoted via getAmountsOut
+                if not dex_data.get('enabled') or 'router' not in dex_data:
+                    continue
+                
+                price_calls.append({
+                    'dex': dex_name,
+                    'pair': pair,
+                    'router': dex_data['router'],
+                    'cache_key': f"price_{dex_name}_{pair[0]}_{pair[1]}"
+                })
+        
+        return price_calls
+    
+    async def _check_triangular_arbitrage(self) -> Optional[Opportunity]:
         """
         Check for triangular arbitrage opportunities (A -> B -> C -> A)
         Priority: 3
         """
-        if not self.config['strategies']['triangular_arbitrage']['enabled']:
+        if not self._strategy_enabled['triangular_arbitrage']:
             return None
         
         try:
@@ -396,14 +624,15 @@ class MEVBotEngine:
                     'triangular'
                 )
                 
-                if ml_prediction['confidence'] >= self.config['ml_optimization']['min_confidence_score']:
-                    return {
-                        'strategy': 'triangular_arbitrage',
-                        'priority': 3,
-                        'expected_profit_usd': best['expected_profit_usd'],
-                        'confidence': ml_prediction['confidence'],
-                        'data': best
-                    }
+                if ml_prediction['confidence'] >= self._min_conf:
+                    return Opportunity(
+                        strategy='triangular_arbitrage',
+                        kind=StrategyKind.TRI_ARB,
+                        priority=3,
+                        expected_profit_usd=best['expected_profit_usd'],
+                        confidence=ml_prediction['confidence'],
+                        data=best
+                    )
             
             return None
             
@@ -414,55 +643,111 @@ class MEVBotEngine:
     async def _fetch_prices_multicall(self, price_calls: List[Dict]) -> Dict:
         """
         Fetch prices using multicall for gas efficiency
+        Cache misses are quoted together through Multicall3 aggregate3
+        
+        Args:
+            price_calls: List of dicts with 'dex', 'pair', 'router' and 'cache_key'
+            
+        Returns:
+            Dict mapping pair tuple to {dex: price of pair[0] in pair[1]}
         """
-        # This is a simplified version - full implementation in multicall.py
-        results = {}
+        results = defaultdict(dict)
+        misses = []
+        
+        # Quotes never outlive a block time, even if no new head was pushed (WebSocket down)
+        if time.monotonic() - self._price_quotes_since > self._block_time_seconds:
+            self._reset_price_quotes()
+        
+        quotes_cache = self._price_quotes
         
         for call in price_calls:
-            # Cache check
-            cache_key = f"price_{call['dex']}_{call['pair'][0]}_{call['pair'][1]}"
-            cached = self.cache.get(cache_key)
+            # Cache check (key precomputed in the call plan)
+            cached = quotes_cache.get(call['cache_key'])
             
             if cached:
-                results[(call['dex'], tuple(call['pair']))] = cached
+                results[call['pair']][call['dex']] = cached
             else:
-                # Fetch from blockchain (multicall batched)
-                price = 1.0  # Placeholder
-                results[(call['dex'], tuple(call['pair']))] = price
-                self.cache.set(cache_key, price, ttl=30)
+                misses.append(call)
+        
+        if not misses:
+            return results
+        
+        # Quote 1 unit of pair[0] -> pair[1] on each router (one aggregate3 eth_call)
+        tokens = self.token_config['tokens']
+        requests = []
+        for call in misses:
+            token_in = tokens[call['pair'][0]]
+            token_out = tokens[call['pair'][1]]
+            requests.append((
+                call['router'],
+                10 ** token_in['decimals'],
+                [token_in['address'], token_out['address']]
+            ))
+        
+        quotes = await self.multicall.get_amounts_out_multi(requests)
+        
+        for call, amounts in zip(misses, quotes):
+            if len(amounts) < 2:
+                # Pool missing or call reverted (allowFailure) - skip this DEX
+                continue
+            
+            price = amounts[-1] / 10 ** tokens[call['pair'][1]]['decimals']
+            results[call['pair']][call['dex']] = price
+            
+            # Dropped if a new head replaced the cache while quoting
+            quotes_cache[call['cache_key']] = price
         
         return results
     
-    async def _execute_opportunity(self, opportunity: Dict) -> bool:
+    def _reset_price_quotes(self):
+        """Start an empty quote cache (old blocks' quotes are released in one go)"""
+        self._price_quotes = {}
+        self._price_quotes_since = time.monotonic()
+    
+    async def _on_new_block(self, head: Dict):
+        """
+        Drop the previous block's quotes on each new head
+        
+        Args:
+            head: newHeads payload
+        """
+        self._reset_price_quotes()
+    
+    async def _execute_opportunity(self, opportunity: Opportunity) -> bool:
         """
         Execute the selected opportunity
         Returns True if successful
         """
-        strategy = opportunity['strategy']
+        strategy = opportunity.strategy
         
         try:
-            logger.info(f"Executing {strategy}...")
+            logger.info("Executing {}...", strategy)
             
             # Pre-execution checks
             if not await self._pre_execution_checks(opportunity):
                 logger.warning("Pre-execution checks failed")
                 return False
             
-            # JIT gas pricing
-            gas_price = await self.gas_calculator.get_jit_gas_price()
+            # JIT gas pricing (network gas price + block timestamp in one round-trip)
+            network_gas_price, block_timestamp = await self._prefetch_block_context()
+            gas_price = await self.gas_calculator.get_jit_gas_price(network_gas_price)
             tip = await self.tip_optimizer.calculate_optimal_tip(opportunity)
             
-            # Build transaction
-            if strategy == 'direct_arbitrage':
-                tx = await self._build_direct_arbitrage_tx(opportunity, gas_price, tip)
-            elif strategy == 'triangular_arbitrage':
-                tx = await self._build_triangular_arbitrage_tx(opportunity, gas_price, tip)
-            elif strategy == 'liquidation_arbitrage':
-                tx = await self._build_liquidation_tx(opportunity, gas_price, tip)
-            elif strategy == 'sandwich_attack':
-                tx = await self._build_sandwich_tx(opportunity, gas_price, tip)
-            else:
-                logger.error(f"Unknown strategy: {strategy}")
+            # Build transaction (nothing is broadcast yet - a build error is not a failed tx)
+            try:
+                if strategy == 'direct_arbitrage':
+                    tx = self._build_direct_arbitrage_tx(opportunity, gas_price, tip)
+                elif strategy == 'triangular_arbitrage':
+                    tx = self._build_triangular_arbitrage_tx(opportunity, gas_price, tip)
+                elif strategy == 'liquidation_arbitrage':
+                    tx = self._build_liquidation_tx(opportunity, gas_price, tip)
+                elif strategy == 'sandwich_attack':
+                    tx = self._build_sandwich_tx(opportunity, gas_price, tip, block_timestamp)
+                else:
+                    logger.error(f"Unknown strategy: {strategy}")
+                    return False
+            except Exception as e:
+                logger.error(f"Error building {strategy} transaction: {e}")
                 return False
             
             # Simulate transaction
@@ -474,16 +759,36 @@ class MEVBotEngine:
             tx_hash = await self._send_transaction(tx)
             
             if tx_hash:
-                logger.info(f"Transaction sent: {tx_hash.hex()}")
+                logger.opt(lazy=True).info("Transaction sent: {}", tx_hash.hex)
                 
                 # Wait for confirmation
                 receipt = await self._wait_for_confirmation(tx_hash)
+                success = receipt is not None and receipt['status'] == 1
+                
+                # Feed the outcome back into the tip model (tip is in wei)
+                await self.tip_optimizer.record_tip_outcome(
+                    tip / 1e9,
+                    success,
+                    opportunity.expected_profit_usd,
+                    opportunity.kind
+                )
                 
-                if receipt and receipt['status'] == 1:
+                if receipt is None:
+                    logger.warning("Transaction not confirmed before timeout")
+                    if self._uses_relays():
+                        # A bundle only targets the next block - its nonce was never used
+                        # (a public tx may still land - the stuck sweep cancels it instead)
+                        await self.nonce_manager.release_nonce(tx['nonce'])
+                    return False
+                
+                # Mined (success or revert) - stop tracking the nonce and drop its pre-signed cancel
+                await self.nonce_manager.confirm_nonce(tx['nonce'])
+                
+                if success:
                     profit = self._calculate_actual_profit(receipt, opportunity)
                     self.stats['total_profit_usd'] += profit
                     
-                    logger.success(f"💰 Profit: ${profit:.2f}")
+                    logger.success("💰 Profit: ${:.2f}", profit)
                     return True
                 else:
                     logger.error("Transaction reverted")
@@ -496,7 +801,26 @@ class MEVBotEngine:
             self.kill_switch.record_failed_transaction()
             return False
     
-    async def _pre_execution_checks(self, opportunity: Dict) -> bool:
+    async def _prefetch_block_context(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Fetch network gas price and latest block timestamp in a single JSON-RPC batch
+        
+        Returns:
+            Tuple of (gas_price_wei, block_timestamp), (None, None) on failure
+        """
+        try:
+            gas_price, block = await asyncio.to_thread(
+                batch_request,
+                self.w3,
+                [('eth_gasPrice', []), ('eth_getBlockByNumber', ['latest', False])]
+            )
+            return int(gas_price, 16), int(block['timestamp'], 16)
+        except Exception as e:
+            # Callers fall back to their own (cached) lookups
+            logger.debug("Block context prefetch failed: {}", e)
+            return None, None
+    
+    async def _pre_execution_checks(self, opportunity: Opportunity) -> bool:
         """
         Pre-execution safety checks
         """
@@ -515,69 +839,213 @@ class MEVBotEngine:
         
         return True
     
-    async def _build_direct_arbitrage_tx(self, opp: Dict, gas_price: int, tip: int):
+    def _build_direct_arbitrage_tx(self, opp: Opportunity, gas_price: int, tip: int):
         """Build transaction for direct arbitrage"""
         # Implementation in transaction_builder.py
-        return await self.tx_builder.build_arbitrage_tx(opp, gas_price, tip)
+        return self.tx_builder.build_arbitrage_tx(opp, gas_price, tip)
     
-    async def _build_triangular_arbitrage_tx(self, opp: Dict, gas_price: int, tip: int):
+    def _build_triangular_arbitrage_tx(self, opp: Opportunity, gas_price: int, tip: int):
         """Build transaction for triangular arbitrage"""
-        return await self.tx_builder.build_triangular_tx(opp, gas_price, tip)
+        return self.tx_builder.build_triangular_tx(opp, gas_price, tip)
     
-    async def _build_liquidation_tx(self, opp: Dict, gas_price: int, tip: int):
+    def _build_liquidation_tx(self, opp: Opportunity, gas_price: int, tip: int):
         """Build transaction for liquidation"""
-        return await self.tx_builder.build_liquidation_tx(opp, gas_price, tip)
+        return self.tx_builder.build_liquidation_tx(opp, gas_price, tip)
     
-    async def _build_sandwich_tx(self, opp: Dict, gas_price: int, tip: int):
-        """Build transaction for sandwich attack"""
-        return await self.tx_builder.build_sandwich_tx(opp, gas_price, tip)
+    def _build_sandwich_tx(self, opp: Opportunity, gas_price: int, tip: int, timestamp: Optional[int] = None):
+        """Build transaction for sandwich attack (legs come from the sandwich analysis)"""
+        return self.tx_builder.build_sandwich_tx(opp.data, gas_price, tip, timestamp)
     
     async def _send_transaction(self, tx: Dict) -> Optional[bytes]:
         """Send transaction to network"""
+        nonce = None
+        
         try:
             # Get nonce
             nonce = self.nonce_manager.get_nonce()
             tx['nonce'] = nonce
             
-            # Sign transaction
-            signed_tx = self.wallet_manager.sign_transaction(tx)
+            # Sign transaction (off the event loop, like ContractManager)
+            signed_tx = await asyncio.to_thread(self.wallet_manager.sign_transaction, tx)
             
-            # Send via MEV relay if enabled
-            if self.config['mev_boost']['enabled']:
-                # TODO: Implement MEV-Boost bundle submission
-                pass
+            # Send via private MEV relays if enabled and configured (no public fallback on rejection)
+            if self._uses_relays():
+                tx_hash = await self._send_bundle(signed_tx)
             else:
-                # Send to public mempool
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-                return tx_hash
+                # Send to public mempool (blocking HTTP - keep monitors running meanwhile)
+                tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_tx.rawTransaction)
+            
+            if not tx_hash:
+                # Every relay rejected the bundle - the nonce was never used
+                await self.nonce_manager.release_nonce(nonce)
+            return tx_hash
                 
         except Exception as e:
             logger.error(f"Error sending transaction: {e}")
+            if nonce is not None:
+                # Not broadcast - hand the nonce back so later txs don't queue behind a gap
+                await self.nonce_manager.release_nonce(nonce)
             return None
     
+    def _uses_relays(self) -> bool:
+        """Whether transactions go to private MEV relays (bundles) instead of the public mempool"""
+        return self.config['mev_boost']['enabled'] and bool(self._relay_urls)
+    
+    async def _send_bundle(self, signed_tx) -> Optional[bytes]:
+        """
+        Submit a single-tx bundle (eth_sendBundle) for the next block to every relay
+        Reuses one keep-alive session, so submissions skip the TCP/TLS handshake
+        
+        Args:
+            signed_tx: Signed transaction
+            
+        Returns:
+            Transaction hash if any relay accepted the bundle, else None
+        """
+        if self._relay_session is None:
+            self._relay_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=30),
+                timeout=self._relay_timeout
+            )
+        
+        block_number = self.block_monitor.latest_block_number
+        if block_number is None:
+            block_number = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        
+        # Encode the JSON-RPC body once and POST the same bytes to every relay
+        payload = orjson.dumps({
+            'jsonrpc': '2.0',
+            'id': 1,
+            'method': 'eth_sendBundle',
+            'params': [{
+                'txs': ['0x' + bytes(signed_tx.rawTransaction).hex()],
+                'blockNumber': hex(block_number + 1)
+            }]
+        })
+        
+        results = await asyncio.gather(
+            *(self._post_bundle(url, payload) for url in self._relay_urls),
+            return_exceptions=True
+        )
+        
+        accepted = 0
+        for url, result in zip(self._relay_urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Bundle rejected by {url[:40]}: {result}")
+            else:
+                accepted += 1
+        
+        if not accepted:
+            return None
+        
+        logger.debug("Bundle accepted by {}/{} relays", accepted, len(self._relay_urls))
+        return signed_tx.hash
+    
+    async def _post_bundle(self, url: str, payload: bytes) -> Dict:
+        """
+        POST a pre-encoded eth_sendBundle request
+        
+        Args:
+            url: Relay endpoint
+            payload: orjson-encoded JSON-RPC request body
+            
+        Returns:
+            Relay result
+        """
+        async with self._relay_session.post(
+            url,
+            data=payload,
+            headers={'Content-Type': 'application/json'}
+        ) as response:
+            result = orjson.loads(await response.read())
+        
+        if 'error' in result:
+            raise ValueError(result['error'])
+        
+        return result.get('result')
+    
+    async def _close_relay_session(self):
+        """Close the relay HTTP session"""
+        if self._relay_session is not None:
+            await self._relay_session.close()
+            self._relay_session = None
+    
     async def _wait_for_confirmation(self, tx_hash: bytes, timeout: int = 60):
-        """Wait for transaction confirmation"""
-        start_time = time.time()
+        """
+        Wait for transaction confirmation
+        Polls every connected RPC concurrently - the first to see the receipt wins -
+        backing off from 100 ms to 1 s between rounds
         
-        while time.time() - start_time < timeout:
-            try:
-                receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-                return receipt
-            except TransactionNotFound:
-                await asyncio.sleep(2)
+        A slow RPC keeps its call in flight across rounds and is only polled again
+        once it returns (cancelling a to_thread task does not stop its worker thread)
+        """
+        deadline = time.monotonic() + timeout
+        backoff = 0.1
+        w3_instances = self.rpc_manager.get_all_web3() or [self.w3]
+        
+        # RPC index -> outstanding receipt call (at most one per RPC)
+        in_flight: Dict[int, asyncio.Task] = {}
+        
+        try:
+            while time.monotonic() < deadline:
+                round_end = time.monotonic() + backoff
+                
+                for index, w3 in enumerate(w3_instances):
+                    if index not in in_flight:
+                        in_flight[index] = asyncio.create_task(
+                            asyncio.to_thread(self._fetch_receipt, w3, tx_hash)
+                        )
+                
+                while in_flight:
+                    remaining = round_end - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    
+                    done, _ = await asyncio.wait(
+                        in_flight.values(),
+                        timeout=remaining,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    
+                    if not done:
+                        break  # Remaining RPCs are slow - carry them into the next round
+                    
+                    for index in [index for index, task in in_flight.items() if task.done()]:
+                        receipt = in_flight.pop(index).result()
+                        if receipt is not None:
+                            return receipt
+                
+                await asyncio.sleep(max(0.0, round_end - time.monotonic()))
+                backoff = min(backoff * 1.5, 1.0)
+        finally:
+            # Results no longer needed; each leftover thread finishes its one call and exits
+            for task in in_flight.values():
+                task.cancel()
         
         return None
     
-    def _calculate_actual_profit(self, receipt, opportunity) -> float:
+    @staticmethod
+    def _fetch_receipt(w3: Web3, tx_hash: bytes):
+        """Get a receipt from one RPC (None if not mined yet or the call failed)"""
+        try:
+            return w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        except Exception as e:
+            logger.debug("Receipt poll failed: {}", e)
+            return None
+    
+    def _calculate_actual_profit(self, receipt, opportunity: Opportunity) -> float:
         """Calculate actual profit from transaction receipt"""
         # Parse logs and calculate profit
         # Subtract gas costs
-        gas_used = receipt['gasUsed']
-        gas_price = receipt['effectiveGasPrice']
-        gas_cost_wei = gas_used * gas_price
-        gas_cost_usd = self.w3.from_wei(gas_cost_wei, 'ether') * 2000  # Approximate MATIC price
+        gas_cost_wei = receipt['gasUsed'] * receipt['effectiveGasPrice']
         
-        profit = opportunity['expected_profit_usd'] - gas_cost_usd
+        # Gas is paid in MATIC - price it with the live native price (integer wei, one division)
+        native_price_usd = self.price_monitor.get_native_price_usd(self.gas_calculator.matic_price_usd)
+        gas_cost_usd = gas_cost_wei * native_price_usd / 1e18
+        
+        profit = opportunity.expected_profit_usd - gas_cost_usd
         return profit
     
     async def emergency_shutdown(self):
@@ -591,15 +1059,33 @@ class MEVBotEngine:
         await self.mempool_monitor.stop()
         await self.price_monitor.stop()
         await self.liquidity_monitor.stop()
+        await self.block_monitor.stop()
+        
+        # Withdraw all profits to admin wallet (bounded - the node may be unreachable)
+        token_addresses = [token['address'] for token in self.token_config['tokens'].values()]
+        try:
+            await asyncio.wait_for(
+                self.wallet_manager.auto_withdraw_profits(self.w3, self.contract_manager, token_addresses),
+                timeout=30
+            )
+        except asyncio.TimeoutError:
+            logger.error("Profit withdrawal timed out during shutdown")
         
-        # Withdraw all profits to admin wallet
-        await self.wallet_manager.auto_withdraw_profits()
+        # Close HTTP sessions only after the withdrawal has been broadcast
+        await self.contract_manager.close()
+        await self._close_relay_session()
         
         # Send critical alert
-        await self.alert_system.send_critical_alert(
-            "MEV Bot Emergency Shutdown",
-            f"Bot stopped. Stats: {self.stats}"
-        )
+        try:
+            await asyncio.wait_for(
+                self.alert_system.send_critical_alert(
+                    "MEV Bot Emergency Shutdown",
+                    f"Bot stopped. Stats: {self.stats}"
+                ),
+                timeout=15
+            )
+        except asyncio.TimeoutError:
+            logger.error("Shutdown alert timed out")
         
         logger.critical("Shutdown complete")
     
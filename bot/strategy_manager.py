@@ -6,6 +6,8 @@ Coordinates multiple strategies and selects the best opportunity
 from typing import List, Optional, Dict
 from loguru import logger
 
+from strategies.opportunity import Opportunity
+
 
 class StrategyManager:
     """
@@ -32,7 +34,7 @@ class StrategyManager:
             'direct_arbitrage': 2
         }
     
-    def select_best_opportunity(self, opportunities: List[Optional[Dict]]) -> Optional[Dict]:
+    def select_best_opportunity(self, opportunities: List[Optional[Opportunity]]) -> Optional[Opportunity]:
         """
         Select the best opportunity from multiple strategies
         
@@ -43,7 +45,7 @@ class StrategyManager:
         4. Gas efficiency (profit/gas ratio)
         
         Args:
-            opportunities: List of opportunity dicts from different strategies
+            opportunities: List of opportunities from different strategies
             
         Returns:
             Best opportunity or None
@@ -58,32 +60,25 @@ class StrategyManager:
         min_confidence = self.config['ml_optimization']['min_confidence_score']
         confident_opps = [
             opp for opp in valid_opps
-            if opp.get('confidence', 0) >= min_confidence
+            if opp.confidence >= min_confidence
         ]
         
         if not confident_opps:
             logger.debug("No opportunities meet minimum confidence threshold")
             return None
         
-        # Sort by expected profit (descending)
-        confident_opps.sort(key=lambda x: x['expected_profit_usd'], reverse=True)
-        
-        # Get top candidate
-        top_opp = confident_opps[0]
+        # Top candidate by expected profit (single pass, no sort)
+        top_profit = max(opp.expected_profit_usd for opp in confident_opps)
         
-        # Check if there are multiple similar profit opportunities
+        # Among similar profits, choose by priority (then profit)
         similar_profit_threshold = 2.0  # $2 difference considered "similar"
-        similar_opps = [
-            opp for opp in confident_opps
-            if abs(opp['expected_profit_usd'] - top_opp['expected_profit_usd']) <= similar_profit_threshold
-        ]
-        
-        if len(similar_opps) > 1:
-            # If profits are similar, choose by priority
-            similar_opps.sort(key=lambda x: self.priority_map.get(x['strategy'], 0), reverse=True)
-            return similar_opps[0]
-        
-        return top_opp
+        return max(
+            (
+                opp for opp in confident_opps
+                if top_profit - opp.expected_profit_usd <= similar_profit_threshold
+            ),
+            key=lambda opp: (self.priority_map.get(opp.strategy, 0), opp.expected_profit_usd)
+        )
     
     def get_active_strategies(self) -> List[str]:
         """Get list of enabled strategies"""
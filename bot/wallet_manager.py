@@ -4,15 +4,31 @@ Handles dual wallet system (Executor + Admin) for security
 """
 
 import os
-from typing import Dict
+import time
+import asyncio
+from typing import Dict, Optional, Tuple
 from decimal import Decimal
 from web3 import Web3
+from web3.contract import Contract
 from eth_account import Account
 from loguru import logger
 from dotenv import load_dotenv
 
+from utils.address_cache import to_checksum_address
+
 load_dotenv()
 
+# Minimal ERC20 ABI for balance reads (parsed once per token contract)
+_BALANCE_OF_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function"
+    }
+]
+
 
 class WalletManager:
     """
@@ -21,6 +37,9 @@ class WalletManager:
     - Admin wallet: Profit withdrawal and critical functions
     """
     
+    # Head block number lifetime (seconds) - balances are cached per block
+    BLOCK_NUMBER_TTL = 0.5
+    
     def __init__(self):
         """Initialize wallet manager"""
         # Load private keys from environment
@@ -42,6 +61,16 @@ class WalletManager:
         self.target_buffer_usd = 50  # Keep $50 in executor wallet
         self.min_withdrawal_threshold_usd = 100  # Withdraw when profit > $100
         
+        # ERC20 contract objects, checksum address -> Contract
+        self._token_contracts: Dict[str, Contract] = {}
+        
+        # Balances at the head block, block number -> {(owner, token or None): balance}
+        # Only the current block is kept - entries expire exactly when the chain advances
+        self._block_cache: Dict[int, Dict[Tuple[str, Optional[str]], Decimal]] = {}
+        
+        # Last seen head block, (monotonic time, block number)
+        self._head_block: Tuple[float, int] = (0.0, -1)
+        
         logger.info(f"Executor wallet: {self.executor_address}")
         logger.info(f"Admin wallet: {self.admin_address}")
     
@@ -65,14 +94,38 @@ class WalletManager:
         
         try:
             signed_tx = account.sign_transaction(transaction)
+            
+            # This wallet's balances are about to change
+            self._invalidate_balances(account.address)
             return signed_tx
         except Exception as e:
             logger.error(f"Error signing transaction: {e}")
             raise
     
-    def get_executor_balance(self, w3: Web3, token_address: str = None) -> Decimal:
+    def _get_token_contract(self, w3: Web3, token_address: str) -> Contract:
+        """
+        Get (or build once) the balanceOf contract object for a token
+        
+        Args:
+            w3: Web3 instance
+            token_address: ERC20 token address
+            
+        Returns:
+            Contract bound to w3
+        """
+        address = to_checksum_address(token_address)
+        contract = self._token_contracts.get(address)
+        
+        if contract is None or contract.w3 is not w3:
+            contract = w3.eth.contract(address=address, abi=_BALANCE_OF_ABI)
+            self._token_contracts[address] = contract
+        
+        return contract
+    
+    async def get_executor_balance(self, w3: Web3, token_address: str = None) -> Decimal:
         """
         Get executor wallet balance
+        RPCs run in a worker thread so the event loop keeps serving strategies
         
         Args:
             w3: Web3 instance
@@ -81,49 +134,82 @@ class WalletManager:
         Returns:
             Balance in token units
         """
-        if token_address is None:
-            # Get native MATIC balance
-            balance_wei = w3.eth.get_balance(self.executor_address)
-            balance = w3.from_wei(balance_wei, 'ether')
-        else:
-            # Get ERC20 token balance
-            token_contract = w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=[
-                    {
-                        "constant": True,
-                        "inputs": [{"name": "_owner", "type": "address"}],
-                        "name": "balanceOf",
-                        "outputs": [{"name": "balance", "type": "uint256"}],
-                        "type": "function"
-                    }
-                ]
-            )
-            balance = token_contract.functions.balanceOf(self.executor_address).call()
+        return await self._get_balance(w3, self.executor_address, token_address)
+    
+    async def get_admin_balance(self, w3: Web3, token_address: str = None) -> Decimal:
+        """Get admin wallet balance (RPCs off the event loop)"""
+        return await self._get_balance(w3, self.admin_address, token_address)
+    
+    async def _current_block(self, w3: Web3) -> int:
+        """
+        Get the head block number (cached for BLOCK_NUMBER_TTL)
+        Drops balances cached at older blocks when the head moves
+        
+        Args:
+            w3: Web3 instance
+            
+        Returns:
+            Current block number
+        """
+        fetched_at, block_number = self._head_block
+        if time.monotonic() - fetched_at < self.BLOCK_NUMBER_TTL:
+            return block_number
+        
+        block_number = await asyncio.to_thread(lambda: w3.eth.block_number)
+        self._head_block = (time.monotonic(), block_number)
+        
+        if block_number not in self._block_cache:
+            # New head - balances cached at older blocks are stale
+            self._block_cache = {block_number: {}}
         
-        return Decimal(str(balance))
+        return block_number
     
-    def get_admin_balance(self, w3: Web3, token_address: str = None) -> Decimal:
-        """Get admin wallet balance"""
-        if token_address is None:
-            balance_wei = w3.eth.get_balance(self.admin_address)
+    async def _get_balance(self, w3: Web3, owner: str, token_address: Optional[str]) -> Decimal:
+        """
+        Get a wallet balance, served from cache for the rest of the block
+        
+        Args:
+            w3: Web3 instance
+            owner: Wallet address
+            token_address: ERC20 token address (None for native MATIC)
+            
+        Returns:
+            Balance in token units
+        """
+        token_key = to_checksum_address(token_address) if token_address else None
+        cache_key = (owner, token_key)
+        
+        block_number = await self._current_block(w3)
+        balances = self._block_cache.setdefault(block_number, {})
+        
+        cached = balances.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if token_key is None:
+            # Get native MATIC balance
+            balance_wei = await asyncio.to_thread(w3.eth.get_balance, owner, block_number)
             balance = w3.from_wei(balance_wei, 'ether')
         else:
-            token_contract = w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=[
-                    {
-                        "constant": True,
-                        "inputs": [{"name": "_owner", "type": "address"}],
-                        "name": "balanceOf",
-                        "outputs": [{"name": "balance", "type": "uint256"}],
-                        "type": "function"
-                    }
-                ]
+            # Get ERC20 token balance (contract object is memoized)
+            token_contract = self._get_token_contract(w3, token_key)
+            balance = await asyncio.to_thread(
+                token_contract.functions.balanceOf(owner).call,
+                block_identifier=block_number
             )
-            balance = token_contract.functions.balanceOf(self.admin_address).call()
         
-        return Decimal(str(balance))
+        balance = Decimal(str(balance))
+        balances[cache_key] = balance
+        
+        return balance
+    
+    def _invalidate_balances(self, owner: str):
+        """Drop cached balances of a wallet (after it signs a transaction)"""
+        # Signing runs in worker threads - snapshot the keys, tolerate concurrent removal
+        for balances in list(self._block_cache.values()):
+            for cache_key in list(balances):
+                if cache_key[0] == owner:
+                    balances.pop(cache_key, None)
     
     async def auto_withdraw_profits(
         self, 
@@ -143,14 +229,10 @@ class WalletManager:
             True if successful
         """
         try:
-            for token_address in token_addresses:
-                # Get contract balance
-                contract_balance = await self._get_contract_balance(
-                    w3, 
-                    contract_manager, 
-                    token_address
-                )
-                
+            # Get all contract balances in one round-trip
+            contract_balances = await contract_manager.get_contract_balances(token_addresses)
+            
+            for token_address, contract_balance in zip(token_addresses, contract_balances):
                 if contract_balance <= 0:
                     continue
                 
@@ -164,7 +246,7 @@ class WalletManager:
                     tx_hash = await contract_manager.withdraw_profits(
                         token_address,
                         self.admin_address,
-                        wallet='admin'  # Sign with admin key
+                        self  # Signs with the admin key
                     )
                     
                     if tx_hash:
@@ -179,12 +261,6 @@ class WalletManager:
             logger.error(f"Error in auto_withdraw_profits: {e}")
             return False
     
-    async def _get_contract_balance(self, w3, contract_manager, token_address):
-        """Get token balance held in the arbitrage contract"""
-        # This would query the FlashloanArbitrage contract's balance
-        # Implementation in contract_manager
-        return 0
-    
     def ensure_executor_buffer(self, w3: Web3, current_balance_usd: float) -> bool:
         """
         Ensure executor wallet maintains minimum buffer for gas
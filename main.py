@@ -10,18 +10,25 @@ from loguru import logger
 from bot.bot_engine import MEVBotEngine
 
 # Configure logging
+# enqueue=True hands records to a background writer thread, keeping sink I/O off the hot path
 logger.remove()
 logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-    level="INFO"
+    level="INFO",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 logger.add(
     "data/logs/bot.log",
     rotation="1 day",
     retention="7 days",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
-    level="DEBUG"
+    level="DEBUG",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False
 )
 
 
@@ -32,6 +39,7 @@ class MEVBotRunner:
         """Initialize bot runner"""
         self.bot = None
         self.running = False
+        self._stop_task = None  # keeps the shutdown task referenced
     
     async def start(self):
         """Start the bot"""
@@ -43,9 +51,14 @@ class MEVBotRunner:
             # Initialize bot engine
             self.bot = MEVBotEngine(config_path="config/bot_config.json")
             
-            # Register signal handlers
-            signal.signal(signal.SIGINT, self._signal_handler)
-            signal.signal(signal.SIGTERM, self._signal_handler)
+            # Register signal handlers on the running loop
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self._signal_handler, sig)
+                except NotImplementedError:
+                    # Windows event loops have no add_signal_handler
+                    signal.signal(sig, self._signal_handler)
             
             self.running = True
             
@@ -59,12 +72,12 @@ class MEVBotRunner:
             logger.error(f"Fatal error: {e}", exc_info=True)
             await self.stop()
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum, frame=None):
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}")
         
-        if self.running:
-            asyncio.create_task(self.stop())
+        if self.running and self._stop_task is None:
+            self._stop_task = asyncio.create_task(self.stop())
     
     async def stop(self):
         """Stop the bot gracefully"""
@@ -3,6 +3,8 @@ Model Trainer
 Offline training script for ML models
 """
 
+import os
+from typing import Optional
 import numpy as np
 import joblib
 from sklearn.ensemble import RandomForestClassifier
@@ -10,6 +12,19 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from loguru import logger
 
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_EXPORT_AVAILABLE = True
+except ImportError:  # Optional dependency - models are saved as joblib only
+    ONNX_EXPORT_AVAILABLE = False
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:  # Optional dependency - only the RandomForest is trained
+    LIGHTGBM_AVAILABLE = False
+
 
 class ModelTrainer:
     """
@@ -28,15 +43,17 @@ class ModelTrainer:
         try:
             logger.info(f"Training price predictor with {len(X)} samples")
             
+            # float32 throughout - sklearn trees split on float32, so this skips a cast copy
+            X = np.asarray(X, dtype=np.float32)
+            
             # Split data
             X_train, X_test, y_train, y_test = train_test_split(
                 X, y, test_size=0.2, random_state=42
             )
             
-            # Scale features
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+            # Scale features in place (splits are private copies - no scaled duplicates)
+            scaler = ModelTrainer.fit_scaler_inplace(X_train, X_test)
+            X_train_scaled, X_test_scaled = X_train, X_test
             
             # Train model
             model = RandomForestClassifier(
@@ -56,60 +73,193 @@ class ModelTrainer:
             logger.info(f"Test accuracy: {test_score:.3f}")
             
             # Save model
-            joblib.dump(model, "ml/models/price_predictor.joblib")
-            joblib.dump(scaler, "ml/models/price_scaler.joblib")
+            ModelTrainer.save_model(model, "ml/models/price_predictor.joblib")
+            ModelTrainer.save_model(scaler, "ml/models/price_scaler.joblib")
             
             logger.success("Price predictor model saved")
             
+            # Compiled copy for inference (used by PricePredictor when onnxruntime is installed)
+            ModelTrainer.export_onnx(model)
+            
+            # Gradient-boosted model on the same scaled data (preferred by PricePredictor when installed)
+            ModelTrainer.train_lightgbm(X_train_scaled, y_train, X_test_scaled, y_test)
+            
         except Exception as e:
             logger.error(f"Error training price predictor: {e}")
     
     @staticmethod
-    def generate_synthetic_warmup_data(n_samples: int = 1000) -> tuple:
+    def fit_scaler_inplace(X_train: np.ndarray, *others: np.ndarray) -> StandardScaler:
         """
-        Generate synthetic training data for model warmup
+        Standardize X_train (and any other splits) in place with X_train's statistics
+        One reduction pass for mean/std and one write pass per array - no scaled copies
         
         Args:
-            n_samples: Number of samples to generate
+            X_train: float32 training features, overwritten with scaled values
+            others: Further float32 splits scaled with the training statistics
             
         Returns:
-            (X, y) tuple
+            StandardScaler carrying the fitted mean/scale (loadable by PricePredictor)
         """
-        logger.info(f"Generating {n_samples} synthetic samples")
+        mean = np.mean(X_train, axis=0, dtype=np.float32)
+        std = np.std(X_train, axis=0, dtype=np.float32)
+        std[std == 0.0] = 1.0  # Constant features pass through, as in StandardScaler
         
-        # Features: [profit_usd, strategy_type, gas_price, volatility]
-        X = np.zeros((n_samples, 4))
-        y = np.zeros(n_samples, dtype=int)
+        for X in (X_train, *others):
+            np.subtract(X, mean, out=X)
+            np.divide(X, std, out=X)
+        
+        # Same fitted attributes as StandardScaler.fit, so saved scalers stay compatible
+        scaler = StandardScaler(copy=False)
+        scaler.mean_ = mean.astype(np.float64)
+        scaler.scale_ = std.astype(np.float64)
+        scaler.var_ = scaler.scale_ ** 2
+        scaler.n_features_in_ = X_train.shape[1]
+        scaler.n_samples_seen_ = X_train.shape[0]
+        
+        return scaler
+    
+    @staticmethod
+    def save_model(obj, path: str):
+        """
+        Save a model via a temp file swapped in with os.replace
+        A bot loading the model never sees a half-written file
+        
+        Args:
+            obj: Fitted model or scaler
+            path: Output path
+        """
+        tmp_path = f"{path}.tmp"
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def train_lightgbm(
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_test: np.ndarray,
+        y_test: np.ndarray,
+        path: str = "ml/models/price.lgb.txt"
+    ) -> bool:
+        """
+        Train a LightGBM classifier and save its booster as text
+        Booster inference runs in one native call per batch (no per-tree Python dispatch)
+        
+        Args:
+            X_train: Scaled training features
+            y_train: Training labels
+            X_test: Scaled test features
+            y_test: Test labels
+            path: Output path
+            
+        Returns:
+            True if trained and saved
+        """
+        if not LIGHTGBM_AVAILABLE:
+            logger.debug("lightgbm not installed - skipping gradient-boosted model")
+            return False
+        
+        try:
+            model = lgb.LGBMClassifier(
+                num_leaves=31,
+                n_estimators=200,
+                n_jobs=-1,
+                random_state=42,
+                verbose=-1
+            )
+            model.fit(X_train, y_train)
+            
+            logger.info(f"LightGBM test accuracy: {model.score(X_test, y_test):.3f}")
+            
+            # Same swap-in as save_model - a running bot never reads a half-written file
+            tmp_path = f"{path}.tmp"
+            model.booster_.save_model(tmp_path)
+            os.replace(tmp_path, path)
+            
+            logger.success(f"LightGBM model saved to {path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error training LightGBM model: {e}")
+            return False
+    
+    @staticmethod
+    def export_onnx(model, path: str = "ml/models/price_predictor.onnx") -> bool:
+        """
+        Export a fitted classifier to ONNX so inference runs as native code
         
-        for i in range(n_samples):
-            # Profit (USD)
-            profit = np.random.exponential(20) + np.random.uniform(-5, 50)
+        Args:
+            model: Fitted sklearn classifier (4 features)
+            path: Output path
             
-            # Strategy type (1-5)
-            strategy = np.random.randint(1, 6)
+        Returns:
+            True if exported
+        """
+        if not ONNX_EXPORT_AVAILABLE:
+            logger.debug("skl2onnx not installed - skipping ONNX export")
+            return False
+        
+        try:
+            onnx_model = convert_sklearn(
+                model,
+                initial_types=[('f', FloatTensorType([None, 4]))],
+                options={id(model): {'zipmap': False}}  # Probabilities as a plain tensor
+            )
             
-            # Gas price (gwei)
-            gas_price = np.random.normal(50, 20)
+            with open(path, 'wb') as f:
+                f.write(onnx_model.SerializeToString())
             
-            # Volatility
-            volatility = np.random.uniform(0.5, 2.0)
+            logger.success(f"ONNX model saved to {path}")
+            return True
             
-            X[i] = [profit, strategy, gas_price, volatility]
+        except Exception as e:
+            logger.error(f"Error exporting ONNX model: {e}")
+            return False
+    
+    @staticmethod
+    def generate_synthetic_warmup_data(n_samples: int = 1000, seed: Optional[int] = None) -> tuple:
+        """
+        Generate synthetic training data for model warmup
+        Each feature is drawn as one whole column (no per-sample Python loop)
+        
+        Args:
+            n_samples: Number of samples to generate
+            seed: Random generator seed (None draws fresh data each run)
             
-            # Label: profitable if profit > 10 and gas_price < 100
-            y[i] = 1 if (profit > 10 and gas_price < 100) else 0
+        Returns:
+            (X, y) tuple
+        """
+        logger.info(f"Generating {n_samples} synthetic samples")
+        
+        rng = np.random.default_rng(seed)
+        
+        # Profit (USD)
+        profit = rng.exponential(20, n_samples) + rng.uniform(-5, 50, n_samples)
+        
+        # Strategy type (1-5)
+        strategy = rng.integers(1, 6, n_samples)
+        
+        # Gas price (gwei)
+        gas_price = rng.normal(50, 20, n_samples)
+        
+        # Volatility
+        volatility = rng.uniform(0.5, 2.0, n_samples)
+        
+        # Features: [profit_usd, strategy_type, gas_price, volatility]
+        X = np.column_stack([profit, strategy, gas_price, volatility])
+        
+        # Label: profitable if profit > 10 and gas_price < 100
+        y = ((profit > 10) & (gas_price < 100)).astype(int)
         
         return X, y
     
     @staticmethod
     def save_warmup_data(X: np.ndarray, y: np.ndarray):
         """Save warmup data to file"""
-        import os
         os.makedirs("data/historical", exist_ok=True)
         
         np.savez(
             "data/historical/warmup_data.npz",
-            X=X,
+            X=np.asarray(X, dtype=np.float32),
             y=y
         )
         
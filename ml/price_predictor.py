@@ -4,18 +4,112 @@ ML model to predict arbitrage profitability
 """
 
 import os
+import asyncio
 import joblib
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 from loguru import logger
 
+from .model_trainer import ModelTrainer
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:  # Optional dependency - inference stays on sklearn
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:  # Optional dependency - inference uses the RandomForest
+    LIGHTGBM_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional dependency - features are filled with NumPy column writes
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        return lambda func: func
+
+# Strategy encoding (feature 1) - unknown strategies encode as 0.0
+_STRATEGY_MAP = {
+    'direct_arbitrage': 1.0,
+    'triangular': 2.0,
+    'flashloan': 3.0,
+    'liquidation': 4.0,
+    'sandwich_attack': 5.0
+}
+
+# Placeholder features until live inputs are wired in
+_ASSUMED_GAS_GWEI = 50.0
+_VOLATILITY_PLACEHOLDER = 1.0
+
+
+@njit(cache=True)
+def _fill_features_jit(
+    profits: np.ndarray,
+    strategy_codes: np.ndarray,
+    gas_gwei: float,
+    volatility: float,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Fill the (N, 4) feature matrix in place
+    
+    Features:
+    - Expected profit USD
+    - Strategy type (encoded)
+    - Gas price estimate
+    - Market volatility indicator
+    
+    Args:
+        profits: float32 expected profits (N,)
+        strategy_codes: float32 strategy encodings from _STRATEGY_MAP (N,)
+        gas_gwei: Gas price estimate
+        volatility: Volatility indicator
+        out: float32 array (N, 4) to fill
+        
+    Returns:
+        out
+    """
+    for i in range(profits.shape[0]):
+        out[i, 0] = profits[i]
+        out[i, 1] = strategy_codes[i]
+        out[i, 2] = gas_gwei
+        out[i, 3] = volatility
+    return out
+
+
+def _fill_features_vectorized(
+    profits: np.ndarray,
+    strategy_codes: np.ndarray,
+    gas_gwei: float,
+    volatility: float,
+    out: np.ndarray
+) -> np.ndarray:
+    """Same fill as _fill_features_jit, as one NumPy write per column"""
+    out[:, 0] = profits
+    out[:, 1] = strategy_codes
+    out[:, 2] = gas_gwei
+    out[:, 3] = volatility
+    return out
+
+
+# Compiled loop when available; column writes beat an interpreted loop
+_fill_features = _fill_features_jit if NUMBA_AVAILABLE else _fill_features_vectorized
+
 
 class PricePredictor:
     """
     ML model for predicting arbitrage success probability
-    Uses lightweight sklearn RandomForest (no GPU needed)
+    Uses lightweight sklearn RandomForest (no GPU needed), or the
+    LightGBM booster trained alongside it when lightgbm is installed
     """
     
     def __init__(self, config: Dict):
@@ -27,11 +121,26 @@ class PricePredictor:
         """
         self.config = config
         self.model = None
-        self.scaler = StandardScaler()
+        self.scaler = StandardScaler(copy=False)  # Inputs are freshly built float32 arrays
         
         # Model paths
         self.model_path = "ml/models/price_predictor.joblib"
         self.scaler_path = "ml/models/price_scaler.joblib"
+        self.onnx_path = "ml/models/price_predictor.onnx"
+        self.lgb_path = "ml/models/price.lgb.txt"
+        
+        # Compiled forest (ONNX Runtime), loaded alongside a trained model
+        self._onnx_session = None
+        
+        # Gradient-boosted model (LightGBM), preferred over both forests when loaded
+        self._booster = None
+        
+        # Fitted scaler parameters as float32 arrays (set once the scaler is fitted)
+        self._mean: Optional[np.ndarray] = None
+        self._inv_scale: Optional[np.ndarray] = None
+        
+        # Inference runs here, off the event loop (one worker serializes scaler/model use)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ml-inference')
         
         # Load or create model
         self._load_or_create_model()
@@ -45,7 +154,11 @@ class PricePredictor:
                 # Load trained model
                 self.model = joblib.load(self.model_path)
                 self.scaler = joblib.load(self.scaler_path)
+                self._cache_scaler_params()
                 logger.success(f"Loaded trained model from {self.model_path}")
+                
+                self._onnx_session = self._load_onnx_session()
+                self._booster = self._load_booster()
             else:
                 # Create new model
                 self.model = RandomForestClassifier(
@@ -68,6 +181,92 @@ class PricePredictor:
                 random_state=42
             )
     
+    def _load_onnx_session(self):
+        """
+        Load the ONNX export of the trained model
+        
+        Returns:
+            InferenceSession, or None if unavailable (sklearn is used instead)
+        """
+        if not ONNXRUNTIME_AVAILABLE or not os.path.exists(self.onnx_path):
+            return None
+        
+        # Export predates the joblib model (retrained since) - don't serve a stale forest
+        if os.path.getmtime(self.onnx_path) < os.path.getmtime(self.model_path):
+            logger.warning("ONNX model is older than the trained model - using sklearn inference")
+            return None
+        
+        try:
+            session = onnxruntime.InferenceSession(self.onnx_path, providers=['CPUExecutionProvider'])
+            logger.success(f"Loaded ONNX model from {self.onnx_path}")
+            return session
+        except Exception as e:
+            logger.error(f"Error loading ONNX model: {e}")
+            return None
+    
+    def _load_booster(self):
+        """
+        Load the LightGBM booster trained with the current scaler
+        
+        Returns:
+            Booster, or None if unavailable (forest inference is used instead)
+        """
+        if not LIGHTGBM_AVAILABLE or not os.path.exists(self.lgb_path):
+            return None
+        
+        # Booster was fitted on features from an older scaler - its splits no longer line up
+        if os.path.getmtime(self.lgb_path) < os.path.getmtime(self.scaler_path):
+            logger.warning("LightGBM model is older than the scaler - using forest inference")
+            return None
+        
+        try:
+            booster = lgb.Booster(model_file=self.lgb_path)
+            logger.success(f"Loaded LightGBM model from {self.lgb_path}")
+            return booster
+        except Exception as e:
+            logger.error(f"Error loading LightGBM model: {e}")
+            return None
+    
+    def _predict_proba(self, features_scaled: np.ndarray) -> np.ndarray:
+        """Class probabilities - LightGBM booster, then compiled ONNX forest, else sklearn"""
+        if self._booster is not None:
+            # Binary objective returns P(class 1) only - widen to predict_proba's (N, 2) layout
+            positive = self._booster.predict(features_scaled, raw_score=False)
+            return np.column_stack((1.0 - positive, positive))
+        if self._onnx_session is not None:
+            return self._onnx_session.run(None, {'f': features_scaled.astype(np.float32)})[1]
+        return self.model.predict_proba(features_scaled)
+    
+    def _cache_scaler_params(self):
+        """Keep the fitted scaler's mean and 1/scale as float32 arrays for inline scaling"""
+        mean = getattr(self.scaler, 'mean_', None)
+        scale = getattr(self.scaler, 'scale_', None)
+        
+        n_features = self.scaler.n_features_in_
+        self._mean = np.zeros(n_features, dtype=np.float32) if mean is None else mean.astype(np.float32)
+        self._inv_scale = (
+            np.ones(n_features, dtype=np.float32) if scale is None else (1.0 / scale).astype(np.float32)
+        )
+    
+    def _score(self, features: np.ndarray) -> np.ndarray:
+        """
+        Scale raw features and return class probabilities (blocking, CPU-bound)
+        Scaling is one in-place broadcast - no sklearn validation per call
+        """
+        if self._mean is None:
+            # Scaler not fitted yet - sklearn raises, callers fall back
+            features = self.scaler.transform(features)
+        else:
+            features -= self._mean
+            features *= self._inv_scale
+        
+        return self._predict_proba(features)
+    
+    async def _score_async(self, features: np.ndarray) -> np.ndarray:
+        """Run _score on the inference thread so the event loop keeps serving strategies"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._score, features)
+    
     def _train_with_warmup_data(self):
         """Train model with warmup data if available"""
         try:
@@ -75,19 +274,20 @@ class PricePredictor:
             
             if os.path.exists(warmup_path):
                 data = np.load(warmup_path)
-                X_train = data['X']
+                X_train = data['X'].astype(np.float32)
                 y_train = data['y']
                 
                 # Scale features
                 X_scaled = self.scaler.fit_transform(X_train)
+                self._cache_scaler_params()
                 
                 # Train model
                 self.model.fit(X_scaled, y_train)
                 
                 # Save model
                 os.makedirs("ml/models", exist_ok=True)
-                joblib.dump(self.model, self.model_path)
-                joblib.dump(self.scaler, self.scaler_path)
+                ModelTrainer.save_model(self.model, self.model_path)
+                ModelTrainer.save_model(self.scaler, self.scaler_path)
                 
                 logger.success("Model trained with warmup data")
             else:
@@ -111,39 +311,72 @@ class PricePredictor:
         Returns:
             Dict with confidence score and prediction
         """
-        try:
-            # Extract features
-            features = self._extract_features(expected_profit_usd, strategy_type)
+        predictions = await self.predict_batch([(expected_profit_usd, strategy_type)])
+        return predictions[0]
+    
+    async def predict_batch(self, rows: List[Tuple[float, str]]) -> List[Dict]:
+        """
+        Predict profit probability for several candidates at once
+        One scaler.transform and one predict_proba for the whole batch
+        
+        Args:
+            rows: List of (expected_profit_usd, strategy_type)
             
-            if self.model is None:
-                # No model available - return neutral prediction
-                return {
-                    'confidence': 0.5,
-                    'profitable': True if expected_profit_usd > 0 else False
-                }
+        Returns:
+            List of prediction dicts in rows order
+        """
+        if not rows:
+            return []
+        
+        if self.model is None:
+            # No model available - return neutral predictions
+            return [
+                {'confidence': 0.5, 'profitable': expected_profit_usd > 0}
+                for expected_profit_usd, _ in rows
+            ]
+        
+        try:
+            # Strings are encoded here, outside the compiled fill
+            n_rows = len(rows)
+            profits = np.fromiter((profit for profit, _ in rows), dtype=np.float32, count=n_rows)
+            strategy_codes = np.fromiter(
+                (_STRATEGY_MAP.get(strategy_type, 0.0) for _, strategy_type in rows),
+                dtype=np.float32,
+                count=n_rows
+            )
             
-            # Scale features
-            features_scaled = self.scaler.transform([features])
+            # Fill one (N, 4) matrix in place (fresh per call - scaling happens on another thread)
+            features = _fill_features(
+                profits,
+                strategy_codes,
+                _ASSUMED_GAS_GWEI,
+                _VOLATILITY_PLACEHOLDER,
+                np.empty((n_rows, 4), dtype=np.float32)
+            )
             
-            # Predict probability
-            proba = self.model.predict_proba(features_scaled)[0]
+            # Scale + predict probabilities (off the event loop)
+            probas = await self._score_async(features)
             
-            # Confidence is probability of positive class
-            confidence = proba[1] if len(proba) > 1 else 0.5
+            predictions = []
+            for proba in probas:
+                # Confidence is probability of positive class
+                confidence = proba[1] if len(proba) > 1 else 0.5
+                
+                predictions.append({
+                    'confidence': confidence,
+                    'profitable': confidence >= 0.5,
+                    'probability_vector': proba.tolist()
+                })
             
-            return {
-                'confidence': confidence,
-                'profitable': confidence >= 0.5,
-                'probability_vector': proba.tolist()
-            }
+            return predictions
             
         except Exception as e:
             logger.debug(f"Error in prediction: {e}")
-            # Return conservative estimate
-            return {
-                'confidence': 0.7 if expected_profit_usd > 10 else 0.5,
-                'profitable': True
-            }
+            # Return conservative estimates
+            return [
+                {'confidence': 0.7 if expected_profit_usd > 10 else 0.5, 'profitable': True}
+                for expected_profit_usd, _ in rows
+            ]
     
     async def predict_sandwich_success(self, analysis: Dict) -> Dict:
         """
@@ -167,8 +400,8 @@ class PricePredictor:
             if self.model is None:
                 return {'confidence': 0.75, 'profitable': True}
             
-            features_scaled = self.scaler.transform([features])
-            proba = self.model.predict_proba(features_scaled)[0]
+            probas = await self._score_async(np.array([features], dtype=np.float32))
+            proba = probas[0]
             
             return {
                 'confidence': proba[1] if len(proba) > 1 else 0.75,
@@ -179,48 +412,6 @@ class PricePredictor:
             logger.debug(f"Error predicting sandwich success: {e}")
             return {'confidence': 0.75, 'profitable': True}
     
-    def _extract_features(
-        self,
-        expected_profit_usd: float,
-        strategy_type: str
-    ) -> list:
-        """
-        Extract features for ML prediction
-        
-        Features:
-        - Expected profit USD
-        - Strategy type (encoded)
-        - Gas price estimate
-        - Market volatility indicator
-        
-        Args:
-            expected_profit_usd: Expected profit
-            strategy_type: Strategy name
-            
-        Returns:
-            Feature vector
-        """
-        # Strategy encoding
-        strategy_map = {
-            'direct_arbitrage': 1.0,
-            'triangular': 2.0,
-            'flashloan': 3.0,
-            'liquidation': 4.0,
-            'sandwich_attack': 5.0
-        }
-        
-        strategy_encoded = strategy_map.get(strategy_type, 0.0)
-        
-        # Simple features
-        features = [
-            expected_profit_usd,
-            strategy_encoded,
-            50.0,  # Assumed gas price (gwei)
-            1.0    # Volatility placeholder
-        ]
-        
-        return features
-    
     async def update_model(self, X_new: np.ndarray, y_new: np.ndarray):
         """
         Update model with new data (online learning)
@@ -234,7 +425,7 @@ class PricePredictor:
                 return
             
             # Scale features
-            _ = self.scaler.transform(X_new)  # Prepared for future use
+            _ = self.scaler.transform(X_new, copy=True)  # Prepared for future use (caller's array untouched)
             
             # Partial fit (incremental learning)
             # Note: RandomForest doesn't support partial_fit
@@ -250,8 +441,8 @@ class PricePredictor:
         """Save model to disk"""
         try:
             os.makedirs("ml/models", exist_ok=True)
-            joblib.dump(self.model, self.model_path)
-            joblib.dump(self.scaler, self.scaler_path)
+            ModelTrainer.save_model(self.model, self.model_path)
+            ModelTrainer.save_model(self.scaler, self.scaler_path)
             logger.success("Model saved")
         except Exception as e:
             logger.error(f"Error saving model: {e}")
\ No newline at end of file
@@ -4,12 +4,19 @@ ML-based dynamic MEV tip calculation to maximize inclusion probability
 """
 
 import os
-import joblib
+import asyncio
 import numpy as np
 from typing import Dict
-from sklearn.linear_model import LinearRegression
 from loguru import logger
 
+from strategies.opportunity import Opportunity, StrategyKind
+
+# Model features: [1 (intercept), expected_profit_usd, strategy kind (StrategyKind code)]
+_N_COEF = 3
+
+# Ridge penalty - keeps the normal equations solvable before samples span every feature
+_RIDGE_LAMBDA = 1e-6
+
 
 class TipOptimizer:
     """
@@ -27,15 +34,32 @@ class TipOptimizer:
             config: Bot configuration
         """
         self.config = config
-        self.model = None
+        self.model_path = "ml/models/tip_optimizer.npz"
+        
+        # Incremental ridge regression of landed tips on (profit, strategy)
+        # Running X^T X / X^T y make each sample O(d^2) and each refit a 3x3 solve
+        self.XtX = np.zeros((_N_COEF, _N_COEF))
+        self.Xty = np.zeros(_N_COEF)
+        self.beta = np.zeros(_N_COEF)
+        self.n_samples = 0
+        
+        # Prediction scratch row, reused on every call (slot 0 is the fixed intercept term)
+        self._pred_buf = np.ones(_N_COEF)
         
         # Tip constraints
         self.min_tip_gwei = config['mev_boost']['min_tip_gwei']
         self.max_tip_gwei = config['mev_boost']['max_tip_gwei']
         
         # Historical tip data
-        self.tip_history = []  # (tip_gwei, success) tuples
+        # Ring buffer of the last max_history (tip_gwei, success) outcomes with running sums
         self.max_history = 100
+        self._tips = np.zeros(self.max_history)
+        self._outcomes = np.zeros(self.max_history)
+        self._head = 0  # Next slot to write
+        self._count = 0  # Filled slots
+        self._tip_sum = 0.0
+        self._succ_sum = 0.0
+        self._n_recorded = 0  # Outcomes recorded since start
         
         # Load or create model
         self._load_or_create_model()
@@ -45,21 +69,20 @@ class TipOptimizer:
     def _load_or_create_model(self):
         """Load or create tip optimization model"""
         try:
-            model_path = "ml/models/tip_optimizer.joblib"
-            
-            if os.path.exists(model_path):
-                self.model = joblib.load(model_path)
+            if os.path.exists(self.model_path):
+                state = np.load(self.model_path)
+                self.XtX = state['XtX']
+                self.Xty = state['Xty']
+                self.n_samples = int(state['n_samples'])
+                self._solve()
                 logger.success("Loaded tip optimizer model")
             else:
-                # Simple linear regression model
-                self.model = LinearRegression()
                 logger.info("Created new tip optimizer model")
                 
         except Exception as e:
             logger.error(f"Error loading tip model: {e}")
-            self.model = LinearRegression()
     
-    async def calculate_optimal_tip(self, opportunity: Dict) -> int:
+    async def calculate_optimal_tip(self, opportunity: Opportunity) -> int:
         """
         Calculate optimal MEV tip for an opportunity
         
@@ -76,8 +99,8 @@ class TipOptimizer:
             Optimal tip in wei
         """
         try:
-            expected_profit_usd = opportunity['expected_profit_usd']
-            strategy = opportunity['strategy']
+            expected_profit_usd = opportunity.expected_profit_usd
+            strategy_kind = opportunity.kind
             
             # Base tip
             base_tip_gwei = self.min_tip_gwei
@@ -90,8 +113,8 @@ class TipOptimizer:
             optimal_tip_gwei = base_tip_gwei
             
             # For sandwich attacks, beat victim's gas
-            if strategy == 'sandwich_attack':
-                victim_gas_gwei = opportunity['data'].get('victim_gas_price_gwei', 50)
+            if strategy_kind == StrategyKind.SANDWICH:
+                victim_gas_gwei = opportunity.data.get('victim_gas_price_gwei', 50)
                 optimal_tip_gwei = max(optimal_tip_gwei, victim_gas_gwei * 1.125)  # 12.5% higher
             
             # For high-profit opportunities, increase tip
@@ -101,8 +124,8 @@ class TipOptimizer:
                 optimal_tip_gwei *= 2.0
             
             # Apply ML prediction if model is trained
-            if self.model is not None and len(self.tip_history) > 10:
-                ml_tip_gwei = self._ml_predict_tip(expected_profit_usd, strategy)
+            if self.n_samples > 10:
+                ml_tip_gwei = self._ml_predict_tip(expected_profit_usd, strategy_kind)
                 
                 if ml_tip_gwei > 0:
                     # Blend ML prediction with rule-based
@@ -123,34 +146,25 @@ class TipOptimizer:
             # Return safe default
             return int(self.min_tip_gwei * 1e9)
     
-    def _ml_predict_tip(self, expected_profit_usd: float, strategy: str) -> float:
+    def _ml_predict_tip(self, expected_profit_usd: float, strategy_kind: int) -> float:
         """
         Use ML model to predict optimal tip
         
         Args:
             expected_profit_usd: Expected profit
-            strategy: Strategy type
+            strategy_kind: StrategyKind code
             
         Returns:
             Predicted tip in gwei
         """
         try:
-            # Encode strategy
-            strategy_map = {
-                'direct_arbitrage': 1,
-                'triangular_arbitrage': 2,
-                'flashloan_arbitrage': 3,
-                'liquidation_arbitrage': 4,
-                'sandwich_attack': 5
-            }
-            
-            strategy_encoded = strategy_map.get(strategy, 0)
-            
-            # Features
-            features = np.array([[expected_profit_usd, strategy_encoded]])
+            # Features (written into the scratch row - no per-call allocation)
+            x = self._pred_buf
+            x[1] = expected_profit_usd
+            x[2] = strategy_kind
             
-            # Predict
-            predicted_tip = self.model.predict(features)[0]
+            # Predict (one dot product)
+            predicted_tip = float(self.beta @ x)
             
             return max(0, predicted_tip)
             
@@ -158,60 +172,100 @@ class TipOptimizer:
             logger.debug(f"Error in ML tip prediction: {e}")
             return 0
     
-    async def record_tip_outcome(self, tip_gwei: float, success: bool):
+    async def record_tip_outcome(
+        self,
+        tip_gwei: float,
+        success: bool,
+        expected_profit_usd: float = 0.0,
+        strategy_kind: int = 0
+    ):
         """
         Record tip and outcome for model training
         
         Args:
             tip_gwei: Tip that was used
             success: Whether transaction was successful
+            expected_profit_usd: Expected profit of the opportunity
+            strategy_kind: StrategyKind code of the opportunity
         """
         try:
-            self.tip_history.append((tip_gwei, 1 if success else 0))
+            outcome = 1.0 if success else 0.0
+            
+            # Overwrite the oldest slot once full, keeping the running sums in step
+            if self._count == self.max_history:
+                self._tip_sum -= self._tips[self._head]
+                self._succ_sum -= self._outcomes[self._head]
+            else:
+                self._count += 1
             
-            # Limit history size
-            if len(self.tip_history) > self.max_history:
-                self.tip_history.pop(0)
+            self._tips[self._head] = tip_gwei
+            self._outcomes[self._head] = outcome
+            self._tip_sum += tip_gwei
+            self._succ_sum += outcome
+            self._head = (self._head + 1) % self.max_history
+            self._n_recorded += 1
             
-            # Retrain model periodically
-            if len(self.tip_history) >= 50 and len(self.tip_history) % 20 == 0:
-                await self._retrain_model()
+            # Learn from tips that landed - rank-1 update, then a 3x3 re-solve (streaming)
+            if success:
+                x = np.array([1.0, expected_profit_usd, strategy_kind])
+                self.XtX += np.outer(x, x)
+                self.Xty += x * tip_gwei
+                self.n_samples += 1
+                self._solve()
+            
+            # Persist model periodically
+            if self._n_recorded >= 50 and self._n_recorded % 20 == 0:
+                await self._save_model()
                 
         except Exception as e:
             logger.error(f"Error recording tip outcome: {e}")
     
-    async def _retrain_model(self):
-        """Retrain model with historical data"""
+    def _solve(self):
+        """Solve the ridge normal equations for the coefficients"""
+        self.beta = np.linalg.solve(self.XtX + _RIDGE_LAMBDA * np.eye(_N_COEF), self.Xty)
+    
+    async def _save_model(self):
+        """Save the accumulated normal equations (coefficients are re-solved on load)"""
         try:
-            if len(self.tip_history) < 10:
+            if self.n_samples < 10:
                 return
             
-            # Prepare training data
-            X = np.array([[tip] for tip, _ in self.tip_history])
-            y = np.array([outcome for _, outcome in self.tip_history])
-            
-            # Retrain
-            self.model.fit(X, y)
+            # Snapshot on the loop - record_tip_outcome keeps updating the arrays in place
+            state = {'XtX': self.XtX.copy(), 'Xty': self.Xty.copy(), 'n_samples': self.n_samples}
             
-            # Save model
-            os.makedirs("ml/models", exist_ok=True)
-            joblib.dump(self.model, "ml/models/tip_optimizer.joblib")
+            # Disk write off the event loop (called from record_tip_outcome)
+            await asyncio.to_thread(self._write_state, state)
             
-            logger.info("Tip optimizer model retrained")
+            logger.info("Tip optimizer model saved")
             
         except Exception as e:
-            logger.error(f"Error retraining model: {e}")
+            logger.error(f"Error saving model: {e}")
+    
+    def _write_state(self, state: Dict):
+        """
+        Write model state to a temp file and swap it in (a crash never leaves a torn file)
+        
+        Args:
+            state: Arrays to save
+        """
+        os.makedirs("ml/models", exist_ok=True)
+        
+        tmp_path = f"{self.model_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **state)
+        os.replace(tmp_path, self.model_path)
     
     def get_tip_stats(self) -> Dict:
         """Get tip statistics"""
-        if not self.tip_history:
+        if not self._count:
             return {'avg_tip': 0, 'success_rate': 0}
         
-        avg_tip = np.mean([tip for tip, _ in self.tip_history])
-        success_rate = np.mean([outcome for _, outcome in self.tip_history])
+        # O(1) - running sums over the ring buffer
+        avg_tip = self._tip_sum / self._count
+        success_rate = self._succ_sum / self._count
         
         return {
             'avg_tip_gwei': avg_tip,
             'success_rate': success_rate * 100,
-            'total_samples': len(self.tip_history)
+            'total_samples': self._count
         }
\ No newline at end of file
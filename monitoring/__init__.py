@@ -1,10 +1,11 @@
 """
 Monitoring Package
-Handles mempool, price, and liquidity monitoring
+Handles mempool, price, liquidity, and block monitoring
 """
 
 from .mempool_monitor import MempoolMonitor
 from .price_monitor import PriceMonitor
 from .liquidity_monitor import LiquidityMonitor
+from .block_monitor import BlockMonitor
 
-__all__ = ['MempoolMonitor', 'PriceMonitor', 'LiquidityMonitor']
\ No newline at end of file
+__all__ = ['MempoolMonitor', 'PriceMonitor', 'LiquidityMonitor', 'BlockMonitor']
\ No newline at end of file
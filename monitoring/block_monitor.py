@@ -0,0 +1,143 @@
+"""
+Block Monitor
+Streams new block headers over WebSocket and notifies listeners
+"""
+
+import asyncio
+import orjson
+from typing import Awaitable, Callable, Dict, List
+from loguru import logger
+
+
+class BlockMonitor:
+    """
+    Subscribes to newHeads on a persistent WebSocket connection
+    Lets per-block caches (fees, stuck nonces) refresh without HTTP polling
+    """
+    
+    def __init__(self, rpc_manager):
+        """
+        Initialize Block Monitor
+        
+        Args:
+            rpc_manager: RPC manager for WebSocket connection
+        """
+        self.rpc_manager = rpc_manager
+        
+        # Async callbacks invoked with each new block header
+        self.listeners: List[Callable[[Dict], Awaitable[None]]] = []
+        
+        # WebSocket connection
+        self.ws = None
+        self.ws_connected = False
+        self.subscription_id = None
+        
+        # Latest block seen (None while disconnected - consumers fall back to their own lookups)
+        self.latest_block_number = None
+        
+        # Running state
+        self.running = False
+        
+        logger.info("Block Monitor initialized")
+    
+    def add_listener(self, callback: Callable[[Dict], Awaitable[None]]):
+        """
+        Register a coroutine called with every new block header
+        
+        Args:
+            callback: async fn(head) receiving the raw newHeads payload
+        """
+        self.listeners.append(callback)
+    
+    async def start(self):
+        """Start block monitoring"""
+        self.running = True
+        logger.info("Starting block monitoring...")
+        
+        await self._connect_websocket()
+        
+        asyncio.create_task(self._monitor_loop())
+    
+    async def stop(self):
+        """Stop block monitoring"""
+        self.running = False
+        
+        if self.ws:
+            await self.ws.close()
+        
+        logger.info("Block monitoring stopped")
+    
+    async def _connect_websocket(self):
+        """Connect to WebSocket endpoint and subscribe to new heads"""
+        try:
+            ws_url = self.rpc_manager.get_websocket_url()
+            
+            if not ws_url:
+                logger.error("No WebSocket URL available")
+                return
+            
+            # Close the previous (stale) socket before replacing it
+            if self.ws is not None:
+                try:
+                    await self.ws.close()
+                except Exception:
+                    pass
+                self.ws = None
+            
+            import websockets
+            self.ws = await websockets.connect(ws_url)
+            
+            await self.ws.send(orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "eth_subscribe",
+                "params": ["newHeads"]
+            }).decode())  # str -> text frame
+            
+            response_data = orjson.loads(await self.ws.recv())
+            
+            if 'result' in response_data:
+                self.subscription_id = response_data['result']
+                self.ws_connected = True
+                logger.success(f"Subscribed to new heads: {self.subscription_id}")
+            else:
+                logger.error(f"newHeads subscription failed: {response_data}")
+                
+        except Exception as e:
+            logger.error(f"Error connecting block WebSocket: {e}")
+            self._mark_disconnected()
+    
+    async def _monitor_loop(self):
+        """Receive block headers and dispatch to listeners"""
+        while self.running:
+            try:
+                if not self.ws_connected:
+                    await asyncio.sleep(5)
+                    await self._connect_websocket()
+                    continue
+                
+                message = await asyncio.wait_for(self.ws.recv(), timeout=10.0)
+                data = orjson.loads(message)
+                
+                if 'params' in data and 'result' in data['params']:
+                    head = data['params']['result']
+                    self.latest_block_number = int(head['number'], 16)
+                    
+                    for callback in self.listeners:
+                        try:
+                            await callback(head)
+                        except Exception as e:
+                            logger.error(f"Error in block listener: {e}")
+                
+            except asyncio.TimeoutError:
+                # No block for several block times - connection likely stale
+                self._mark_disconnected()
+            except Exception as e:
+                logger.debug(f"Error in block monitor loop: {e}")
+                self._mark_disconnected()
+                await asyncio.sleep(1)
+    
+    def _mark_disconnected(self):
+        """Flag the socket as down and forget the last head (it stops advancing)"""
+        self.ws_connected = False
+        self.latest_block_number = None
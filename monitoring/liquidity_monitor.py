@@ -6,8 +6,18 @@ Tracks liquidity levels in DEX pools to avoid high slippage
 import asyncio
 from typing import Dict, List, Optional, Tuple
 from web3 import Web3
+from web3.contract import Contract
+from eth_abi import encode
 from loguru import logger
 
+from utils.address_cache import to_checksum_address
+from utils.multicall import Multicall
+
+ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
+# getPair(address,address) selector for batched factory lookups
+_GET_PAIR_SELECTOR = Web3.keccak(text='getPair(address,address)')[:4]
+
 
 class LiquidityMonitor:
     """
@@ -29,6 +39,26 @@ class LiquidityMonitor:
         # Liquidity cache
         self.liquidity_cache = {}  # (dex, token_a, token_b) -> liquidity_usd
         
+        # V2 factory contracts, built once (ABI parsed once), dex name -> Contract
+        factory_abi = self._get_factory_abi()
+        self._factory_contracts: Dict[str, Contract] = {
+            dex_name: self.w3.eth.contract(
+                address=to_checksum_address(dex['factory']),
+                abi=factory_abi
+            )
+            for dex_name, dex in dex_config['polygon_dexes'].items()
+            if dex.get('version') == 'v2' and dex.get('factory')
+        }
+        
+        # Pair contracts, pair address -> Contract
+        self._pair_contracts: Dict[str, Contract] = {}
+        
+        # Resolved pair addresses (never change once created), (dex, token_a, token_b) -> pair
+        self._pair_addresses: Dict[Tuple[str, str, str], str] = {}
+        
+        # Multicall3 aggregator for cross-DEX liquidity reads
+        self._multicall = Multicall(w3)
+        
         # Running state
         self.running = False
         
@@ -61,7 +91,7 @@ class LiquidityMonitor:
         """Update liquidity for tracked pools"""
         try:
             # This is a simplified version
-            # In production, use multicall to batch all liquidity checks
+            # Per-pair reads are batched by get_all_pool_liquidity (Multicall3)
             logger.debug("Liquidity data updated")
             
         except Exception as e:
@@ -91,32 +121,36 @@ class LiquidityMonitor:
             if cache_key in self.liquidity_cache:
                 return self.liquidity_cache[cache_key]
             
-            # Fetch from blockchain
-            dex_config = self.dex_config['polygon_dexes'].get(dex_name)
+            # Fetch from blockchain (V2 factories only)
+            factory_contract = self._factory_contracts.get(dex_name)
             
-            if not dex_config or dex_config.get('version') != 'v2':
+            if factory_contract is None:
                 return 0
             
-            # Get pair address
-            factory_address = dex_config['factory']
-            factory_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(factory_address),
-                abi=self._get_factory_abi()
-            )
+            # Get pair address (one getPair RPC per pool per process)
+            pair_address = self._pair_addresses.get(cache_key)
             
-            pair_address = factory_contract.functions.getPair(
-                Web3.to_checksum_address(token_a_address),
-                Web3.to_checksum_address(token_b_address)
-            ).call()
-            
-            if pair_address == '0x0000000000000000000000000000000000000000':
-                return 0
+            if pair_address is None:
+                pair_address = factory_contract.functions.getPair(
+                    to_checksum_address(token_a_address),
+                    to_checksum_address(token_b_address)
+                ).call()
+                
+                if pair_address == ZERO_ADDRESS:
+                    # Pool may be created later - don't memoize
+                    return 0
+                
+                self._pair_addresses[cache_key] = pair_address
             
             # Get reserves
-            pair_contract = self.w3.eth.contract(
-                address=pair_address,
-                abi=self._get_pair_abi()
-            )
+            pair_contract = self._pair_contracts.get(pair_address)
+            
+            if pair_contract is None:
+                pair_contract = self.w3.eth.contract(
+                    address=pair_address,
+                    abi=self._get_pair_abi()
+                )
+                self._pair_contracts[pair_address] = pair_contract
             
             reserves = pair_contract.functions.getReserves().call()
             reserve_0 = reserves[0]
@@ -150,23 +184,92 @@ class LiquidityMonitor:
         Returns:
             Dict mapping DEX name to liquidity USD
         """
+        cache_keys = [
+            (dex_name, token_a_address, token_b_address)
+            for dex_name, dex_config in self.dex_config['polygon_dexes'].items()
+            if dex_config.get('enabled', False)
+        ]
+        
+        # Uncached V2 pools are read together (other DEX versions report no liquidity)
+        missing = [
+            cache_key for cache_key in cache_keys
+            if cache_key not in self.liquidity_cache and cache_key[0] in self._factory_contracts
+        ]
+        
+        if missing:
+            await self._fetch_liquidity_batch(missing, token_a_address, token_b_address)
+        
         results = {}
         
-        for dex_name, dex_config in self.dex_config['polygon_dexes'].items():
-            if not dex_config.get('enabled', False):
-                continue
-            
-            liquidity = await self.get_pool_liquidity(
-                dex_name,
-                token_a_address,
-                token_b_address
-            )
+        for cache_key in cache_keys:
+            liquidity = self.liquidity_cache.get(cache_key, 0)
             
             if liquidity > 0:
-                results[dex_name] = liquidity
+                results[cache_key[0]] = liquidity
         
         return results
     
+    async def _fetch_liquidity_batch(
+        self,
+        cache_keys: List[Tuple[str, str, str]],
+        token_a_address: str,
+        token_b_address: str
+    ):
+        """
+        Fill the liquidity cache for several DEXes of one pair
+        At most two Multicall3 round-trips: getPair for unresolved pools, then getReserves
+        
+        Args:
+            cache_keys: (dex, token_a, token_b) keys of V2 DEXes to fetch
+            token_a_address: First token
+            token_b_address: Second token
+        """
+        try:
+            # Resolve pair addresses not seen before
+            unresolved = [cache_key for cache_key in cache_keys if cache_key not in self._pair_addresses]
+            
+            if unresolved:
+                call_data = _GET_PAIR_SELECTOR + encode(
+                    ['address', 'address'],
+                    [to_checksum_address(token_a_address), to_checksum_address(token_b_address)]
+                )
+                
+                pair_results = await self._multicall.aggregate([
+                    {'target': self._factory_contracts[cache_key[0]].address, 'call_data': call_data}
+                    for cache_key in unresolved
+                ])
+                
+                for cache_key, return_data in zip(unresolved, pair_results):
+                    if not return_data or len(return_data) < 32:
+                        continue
+                    
+                    pair_address = to_checksum_address('0x' + return_data[12:32].hex())
+                    
+                    # Pool may be created later - don't memoize missing pools
+                    if pair_address != ZERO_ADDRESS:
+                        self._pair_addresses[cache_key] = pair_address
+            
+            # Read reserves of every existing pool
+            resolved = [cache_key for cache_key in cache_keys if cache_key in self._pair_addresses]
+            
+            if not resolved:
+                return
+            
+            reserves = await self._multicall.get_pair_reserves_batch(
+                [self._pair_addresses[cache_key] for cache_key in resolved]
+            )
+            
+            for cache_key in resolved:
+                reserve_0 = reserves[self._pair_addresses[cache_key]][0]
+                
+                # Failed reads come back as zero - leave uncached so they are retried
+                if reserve_0 > 0:
+                    # Estimate USD value (simplified, as in get_pool_liquidity)
+                    self.liquidity_cache[cache_key] = (reserve_0 / 10**18) * 2
+            
+        except Exception as e:
+            logger.debug(f"Error getting batched pool liquidity: {e}")
+    
     async def get_best_liquidity_dex(
         self,
         token_a_address: str,
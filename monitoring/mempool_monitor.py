@@ -4,12 +4,24 @@ Monitors pending transactions for sandwich attack opportunities
 """
 
 import asyncio
-import json
+import orjson
 from typing import Dict, Set, Optional
-from collections import deque
+from collections import deque, OrderedDict
 from web3 import Web3
 from loguru import logger
 
+from utils.rpc_manager import batch_request
+
+# Router swap selectors the sandwich strategy can decode
+SWAP_SELECTORS = frozenset({
+    0x38ed1739,  # swapExactTokensForTokens
+    0x8803dbee,  # swapTokensForExactTokens
+    0x7ff36ab5,  # swapExactETHForTokens
+    0x4a25d94a,  # swapTokensForExactETH
+    0x18cbafe5,  # swapExactTokensForETH
+    0xfb3bdb41,  # swapETHForExactTokens
+})
+
 
 class MempoolMonitor:
     """
@@ -17,6 +29,15 @@ class MempoolMonitor:
     Uses WebSocket connection for real-time monitoring
     """
     
+    # Pending tx bodies are fetched in JSON-RPC batches of up to this many hashes,
+    # collected for at most FETCH_BATCH_WINDOW seconds after the first one arrives
+    FETCH_BATCH_SIZE = 50
+    FETCH_BATCH_WINDOW = 0.02
+    
+    # Fixed fetcher pool - bounds in-flight batch RPCs; hashes beyond the queue bound are dropped
+    FETCH_WORKERS = 4
+    MAX_QUEUED_HASHES = 2000
+    
     def __init__(self, rpc_manager, config: Dict):
         """
         Initialize Mempool Monitor
@@ -28,8 +49,9 @@ class MempoolMonitor:
         self.rpc_manager = rpc_manager
         self.config = config
         
-        # Pending transactions cache
-        self.pending_txs = {}  # tx_hash -> tx_data
+        # Pending transactions cache, tx_hash -> tx_data
+        # Kept in timestamp order (oldest first) so eviction and expiry pop from the front
+        self.pending_txs: OrderedDict = OrderedDict()
         self.max_cache_size = 1000
         
         # WebSocket connection
@@ -37,6 +59,10 @@ class MempoolMonitor:
         self.ws_connected = False
         self.subscription_id = None
         
+        # Hashes awaiting a batched eth_getTransactionByHash (created in start())
+        self._hash_queue: Optional[asyncio.Queue] = None
+        self.dropped_tx_hashes = 0  # Hashes shed because the fetchers fell behind
+        
         # Filtering
         self.min_value_usd = config['monitoring']['mempool_filter_min_value_usd']
         
@@ -50,11 +76,16 @@ class MempoolMonitor:
         self.running = True
         logger.info("Starting mempool monitoring...")
         
+        # Created on the running loop (Python 3.9 queues bind a loop at construction)
+        self._hash_queue = asyncio.Queue(maxsize=self.MAX_QUEUED_HASHES)
+        
         # Start WebSocket connection
         await self._connect_websocket()
         
-        # Start monitoring loop
+        # Start monitoring loop and the batched tx fetchers
         asyncio.create_task(self._monitor_loop())
+        for _ in range(self.FETCH_WORKERS):
+            asyncio.create_task(self._fetch_loop())
     
     async def stop(self):
         """Stop mempool monitoring"""
@@ -94,18 +125,18 @@ class MempoolMonitor:
         """Subscribe to pending transaction events"""
         try:
             # Ethereum JSON-RPC subscription
-            subscribe_msg = json.dumps({
+            subscribe_msg = orjson.dumps({
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "eth_subscribe",
                 "params": ["newPendingTransactions"]
-            })
+            }).decode()  # str -> text frame
             
             await self.ws.send(subscribe_msg)
             
             # Receive subscription ID
             response = await self.ws.recv()
-            response_data = json.loads(response)
+            response_data = orjson.loads(response)
             
             if 'result' in response_data:
                 self.subscription_id = response_data['result']
@@ -120,12 +151,12 @@ class MempoolMonitor:
         """Unsubscribe from pending transactions"""
         try:
             if self.subscription_id:
-                unsubscribe_msg = json.dumps({
+                unsubscribe_msg = orjson.dumps({
                     "jsonrpc": "2.0",
                     "id": 1,
                     "method": "eth_unsubscribe",
                     "params": [self.subscription_id]
-                })
+                }).decode()
                 
                 await self.ws.send(unsubscribe_msg)
                 logger.info("Unsubscribed from pending transactions")
@@ -147,14 +178,20 @@ class MempoolMonitor:
                 
                 # Receive transaction hash
                 message = await asyncio.wait_for(self.ws.recv(), timeout=1.0)
-                data = json.loads(message)
+                data = orjson.loads(message)  # One message per pending tx
                 
                 # Extract transaction hash
                 if 'params' in data and 'result' in data['params']:
                     tx_hash = data['params']['result']
                     
-                    # Fetch full transaction data
-                    asyncio.create_task(self._process_pending_tx(tx_hash))
+                    # Full transaction data is fetched in batches by _fetch_loop
+                    try:
+                        self._hash_queue.put_nowait(tx_hash)
+                    except asyncio.QueueFull:
+                        # Shed load rather than stall the WebSocket reader
+                        self.dropped_tx_hashes += 1
+                        if self.dropped_tx_hashes % 1000 == 1:
+                            logger.warning(f"Mempool fetchers behind - dropped {self.dropped_tx_hashes} tx hashes")
                 
             except asyncio.TimeoutError:
                 # No new transactions - continue
@@ -164,24 +201,65 @@ class MempoolMonitor:
                 self.ws_connected = False
                 await asyncio.sleep(1)
     
-    async def _process_pending_tx(self, tx_hash: str):
+    async def _fetch_loop(self):
+        """
+        Fetch pending transaction bodies in JSON-RPC batches
+        One round-trip per batch instead of one per hash
+        """
+        loop = asyncio.get_running_loop()
+        
+        while self.running:
+            try:
+                # Wait for the first hash, then collect more for a short window
+                try:
+                    hashes = [await asyncio.wait_for(self._hash_queue.get(), timeout=1.0)]
+                except asyncio.TimeoutError:
+                    continue
+                
+                deadline = loop.time() + self.FETCH_BATCH_WINDOW
+                while len(hashes) < self.FETCH_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        hashes.append(await asyncio.wait_for(self._hash_queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # Drain anything already queued without waiting
+                while len(hashes) < self.FETCH_BATCH_SIZE and not self._hash_queue.empty():
+                    hashes.append(self._hash_queue.get_nowait())
+                
+                w3 = self.rpc_manager.get_web3()
+                # A bad hash only drops its own entry (None), not the whole batch
+                txs = await asyncio.to_thread(
+                    batch_request,
+                    w3,
+                    [('eth_getTransactionByHash', [tx_hash]) for tx_hash in hashes],
+                    allow_errors=True
+                )
+                
+                for tx_hash, tx in zip(hashes, txs):
+                    self._process_pending_tx(tx_hash, tx)
+                
+            except Exception as e:
+                logger.debug(f"Error fetching pending tx batch: {e}")
+    
+    def _process_pending_tx(self, tx_hash: str, tx: Optional[Dict]):
         """
         Process a pending transaction
         
         Args:
             tx_hash: Transaction hash
+            tx: Raw eth_getTransactionByHash result (hex quantities), None if dropped
         """
         try:
-            # Get full transaction data
-            w3 = self.rpc_manager.get_web3()
-            tx = w3.eth.get_transaction(tx_hash)
-            
             if not tx:
                 return
             
             # Filter by value
-            value_eth = w3.from_wei(tx.get('value', 0), 'ether')
-            value_usd = float(value_eth) * 0.80  # Approximate MATIC price
+            value = int(tx.get('value') or '0x0', 16)
+            value_usd = value / 1e18 * 0.80  # Approximate MATIC price
             
             # Skip small transactions
             if value_usd < self.min_value_usd:
@@ -194,20 +272,17 @@ class MempoolMonitor:
                     'hash': tx_hash,
                     'from': tx['from'],
                     'to': tx['to'],
-                    'value': tx['value'],
+                    'value': value,
                     'input': tx['input'],
-                    'gasPrice': tx.get('gasPrice', 0),
+                    'gasPrice': int(tx.get('gasPrice') or '0x0', 16),
                     'timestamp': asyncio.get_event_loop().time()
                 }
+                self.pending_txs.move_to_end(tx_hash)  # Re-seen hash - keep timestamp order
                 
                 # Maintain cache size
                 if len(self.pending_txs) > self.max_cache_size:
                     # Remove oldest
-                    oldest_hash = min(
-                        self.pending_txs.keys(),
-                        key=lambda k: self.pending_txs[k]['timestamp']
-                    )
-                    del self.pending_txs[oldest_hash]
+                    self.pending_txs.popitem(last=False)
                 
                 logger.debug(f"Found potential sandwich target: {tx_hash[:10]}...")
             
@@ -224,23 +299,30 @@ class MempoolMonitor:
         Returns:
             True if swap transaction
         """
-        input_data = tx.get('input', '')
+        # Unparseable input yields -1, which is never in the set
+        return self._parse_selector(tx.get('input', '')) in SWAP_SELECTORS
+    
+    @staticmethod
+    def _parse_selector(input_data) -> int:
+        """
+        Parse the 4-byte function selector of calldata
         
-        if not input_data or len(input_data) < 10:
-            return False
+        Args:
+            input_data: Calldata as a 0x-prefixed hex string or bytes (HexBytes)
+            
+        Returns:
+            Selector as an integer, -1 if calldata is too short or malformed
+        """
+        if isinstance(input_data, (bytes, bytearray)):
+            return int.from_bytes(input_data[:4], 'big') if len(input_data) >= 4 else -1
         
-        # Common swap function signatures
-        swap_signatures = [
-            '0x38ed1739',  # swapExactTokensForTokens
-            '0x8803dbee',  # swapTokensForExactTokens
-            '0x7ff36ab5',  # swapExactETHForTokens
-            '0x4a25d94a',  # swapTokensForExactETH
-            '0x18cbafe5',  # swapExactTokensForETH
-            '0xfb3bdb41',  # swapETHForExactTokens
-        ]
+        if not input_data or len(input_data) < 10:
+            return -1
         
-        function_sig = input_data[:10]
-        return function_sig in swap_signatures
+        try:
+            return int(input_data[2:10], 16)
+        except ValueError:
+            return -1
     
     def get_pending_transactions(self) -> Dict[str, Dict]:
         """
@@ -249,15 +331,13 @@ class MempoolMonitor:
         Returns:
             Dict mapping tx_hash to tx_data
         """
-        # Clean up old transactions (>60 seconds)
+        # Clean up old transactions (>60 seconds) - oldest first, stop at the first fresh one
         current_time = asyncio.get_event_loop().time()
-        to_remove = [
-            tx_hash for tx_hash, tx_data in self.pending_txs.items()
-            if current_time - tx_data['timestamp'] > 60
-        ]
-        
-        for tx_hash in to_remove:
-            del self.pending_txs[tx_hash]
+        while self.pending_txs:
+            oldest = next(iter(self.pending_txs.values()))
+            if current_time - oldest['timestamp'] <= 60:
+                break
+            self.pending_txs.popitem(last=False)
         
         return self.pending_txs.copy()
     
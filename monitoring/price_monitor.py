@@ -19,6 +19,9 @@ class PriceMonitor:
     DEXSCREENER_API = "https://api.dexscreener.com/latest/dex"
     GECKOTERMINAL_API = "https://api.geckoterminal.com/api/v2"
     
+    # Wrapped native (gas) token symbol
+    NATIVE_TOKEN = 'WMATIC'
+    
     def __init__(self, config: Dict, token_config: Dict):
         """
         Initialize Price Monitor
@@ -212,6 +215,18 @@ class PriceMonitor:
         """
         return self.price_cache.get(token_symbol)
     
+    def get_native_price_usd(self, fallback: float = 0.80) -> float:
+        """
+        Get cached native token (MATIC) price for gas cost accounting
+        
+        Args:
+            fallback: Price to use until the first update lands
+            
+        Returns:
+            Price in USD
+        """
+        return self.price_cache.get(self.NATIVE_TOKEN) or fallback
+    
     def get_all_prices(self) -> Dict[str, float]:
         """Get all cached prices"""
         return self.price_cache.copy()
@@ -7,10 +7,13 @@ from .flashloan_arb import FlashloanArbitrage
 from .triangular_arb import TriangularArbitrage
 from .liquidation_arb import LiquidationArbitrage
 from .sandwich_attack import SandwichAttack
+from .opportunity import Opportunity, StrategyKind
 
 __all__ = [
     'FlashloanArbitrage',
     'TriangularArbitrage',
     'LiquidationArbitrage',
-    'SandwichAttack'
+    'SandwichAttack',
+    'Opportunity',
+    'StrategyKind'
 ]
\ No newline at end of file
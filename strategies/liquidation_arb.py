@@ -22,6 +22,9 @@ class LiquidationArbitrage:
     # Liquidation incentive (typically 5-10% bonus)
     LIQUIDATION_BONUS_PCT = 5.0
     
+    # Fixed-point scale for on-chain debt amounts (18 decimals)
+    WEI_SCALE = 10 ** 18
+    
     def __init__(self, w3: Web3, config: Dict, multicall):
         """
         Initialize Liquidation Arbitrage strategy
@@ -317,6 +320,8 @@ class LiquidationArbitrage:
                 'debt_asset': debt_to_repay['address'],
                 'debt_symbol': debt_to_repay['symbol'],
                 'debt_to_cover': max_debt_to_cover,
+                # Exact integer amount for calldata (Decimal avoids float rounding)
+                'debt_to_cover_wei': int(Decimal(str(max_debt_to_cover)) * self.WEI_SCALE),
                 'collateral_to_receive': collateral_to_receive,
                 'liquidation_bonus_pct': self.LIQUIDATION_BONUS_PCT,
                 'gross_profit_usd': gross_profit_usd,
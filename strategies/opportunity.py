@@ -0,0 +1,39 @@
+"""
+Opportunity
+Result of a strategy scan, passed from the bot engine to selection and execution
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict
+
+
+class StrategyKind(IntEnum):
+    """
+    Integer code of each strategy, used as an ML feature
+    Carried on the Opportunity so scoring never hashes the strategy name
+    """
+    
+    DIRECT_ARB = 1
+    TRI_ARB = 2
+    FLASH_ARB = 3
+    LIQ_ARB = 4
+    SANDWICH = 5
+
+
+@dataclass
+class Opportunity:
+    """
+    Scored trading opportunity
+    One is built per strategy per main loop iteration, so the layout is fixed
+    """
+
+    # Fixed attribute layout (declared explicitly - dataclass slots=True needs 3.10+)
+    __slots__ = ('strategy', 'kind', 'priority', 'expected_profit_usd', 'confidence', 'data')
+
+    strategy: str
+    kind: StrategyKind
+    priority: int
+    expected_profit_usd: float
+    confidence: float
+    data: Dict
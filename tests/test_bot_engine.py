@@ -0,0 +1,178 @@
+"""
+Unit Tests for Bot Engine scans
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from blockchain.nonce_manager import NonceManager
+from bot.bot_engine import MEVBotEngine
+
+
+ROUTER = '0xa5E0829CaCEd8fFDD4De3c43696c57F7D7A678ff'
+
+PRICE_CALL = {
+    'dex': 'quickswap_v2',
+    'pair': ('WMATIC', 'USDC'),
+    'router': ROUTER,
+    'cache_key': 'price_quickswap_v2_WMATIC_USDC'
+}
+
+
+def _pending_swap(index: int) -> dict:
+    """Pending swapExactTokensForTokens sent to the test router"""
+    return {
+        'hash': f'0x{index:064x}',
+        'to': ROUTER,
+        'input': '0x38ed1739' + '00' * 32
+    }
+
+
+@pytest.fixture
+def engine():
+    """Engine with only the state the sandwich scan reads (no RPC, no config files)"""
+    engine = MEVBotEngine.__new__(MEVBotEngine)
+    engine._strategy_enabled = {'sandwich_attack': True}
+    engine._dex_routers = frozenset({ROUTER.lower()})
+    engine._sandwich_concurrency = 16
+    engine._sandwich_scan_timeout = 0.05
+    engine._min_conf = 0.9
+    engine.mempool_monitor = Mock()
+    engine.mempool_monitor.get_pending_transactions = Mock(
+        return_value={i: _pending_swap(i) for i in range(3)}
+    )
+    engine.sandwich_attack = Mock()
+    engine.price_predictor = Mock()
+    engine.price_predictor.predict_sandwich_success = AsyncMock(return_value={'confidence': 0.95})
+    return engine
+
+
+class TestSandwichScan:
+    """Test the concurrent sandwich scan"""
+    
+    @pytest.mark.asyncio
+    async def test_deadline_stops_scan(self, engine):
+        """Analyses still running at the deadline end the scan without per-tx errors"""
+        async def slow_analysis(tx_data):
+            await asyncio.sleep(10)
+        
+        engine.sandwich_attack.analyze_transaction = slow_analysis
+        
+        with patch('bot.bot_engine.logger') as logger:
+            result = await asyncio.wait_for(engine._check_sandwich_opportunities(), timeout=1)
+        
+        assert result is None
+        logger.debug.assert_called_once_with("Sandwich scan deadline reached")
+        logger.error.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_first_confident_hit_returned(self, engine):
+        """A profitable analysis finishing before the deadline is returned"""
+        engine.sandwich_attack.analyze_transaction = AsyncMock(
+            return_value={'is_profitable': True, 'expected_profit_usd': 25.0}
+        )
+        
+        result = await engine._check_sandwich_opportunities()
+        
+        assert result is not None
+        assert result.strategy == 'sandwich_attack'
+        assert result.expected_profit_usd == 25.0
+    
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_skipped(self, engine):
+        """One failing analysis doesn't stop the others"""
+        engine.sandwich_attack.analyze_transaction = AsyncMock(side_effect=[
+            ValueError('bad calldata'),
+            {'is_profitable': True, 'expected_profit_usd': 12.0},
+            None
+        ])
+        
+        result = await engine._check_sandwich_opportunities()
+        
+        assert result is not None
+        assert result.expected_profit_usd == 12.0
+
+
+class TestPriceQuoteCache:
+    """Test the per-block direct-arbitrage quote cache"""
+    
+    @pytest.fixture
+    def quote_engine(self):
+        """Engine with only the state the price fetch reads"""
+        engine = MEVBotEngine.__new__(MEVBotEngine)
+        engine._block_time_seconds = 2
+        engine._price_quotes = {PRICE_CALL['cache_key']: 1.0}
+        engine._price_quotes_since = time.monotonic()
+        engine.block_monitor = Mock()
+        engine.block_monitor.latest_block_number = 123
+        engine.token_config = {
+            'tokens': {
+                'WMATIC': {'address': '0x0d500B1d8E8eF31E21C99d1Db9A6444d3ADf1270', 'decimals': 18},
+                'USDC': {'address': '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174', 'decimals': 6}
+            }
+        }
+        engine.multicall = Mock()
+        engine.multicall.get_amounts_out_multi = AsyncMock(return_value=[[10 ** 18, 2 * 10 ** 6]])
+        return engine
+    
+    @pytest.mark.asyncio
+    async def test_fresh_quote_served_from_cache(self, quote_engine):
+        """Quotes from the current block are not re-requested"""
+        prices = await quote_engine._fetch_prices_multicall([PRICE_CALL])
+        
+        assert prices[PRICE_CALL['pair']]['quickswap_v2'] == 1.0
+        quote_engine.multicall.get_amounts_out_multi.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_quotes_expire_without_new_heads(self, quote_engine):
+        """Quotes older than a block time are refetched even if the head never advanced"""
+        quote_engine._price_quotes_since = time.monotonic() - 10
+        
+        prices = await quote_engine._fetch_prices_multicall([PRICE_CALL])
+        
+        assert prices[PRICE_CALL['pair']]['quickswap_v2'] == 2.0
+        quote_engine.multicall.get_amounts_out_multi.assert_called_once()
+
+
+class TestSendTransaction:
+    """Test nonce handling when a send fails"""
+    
+    @pytest.fixture
+    def send_engine(self):
+        """Engine with a real nonce manager synced to nonce 5"""
+        engine = MEVBotEngine.__new__(MEVBotEngine)
+        engine.config = {'mev_boost': {'enabled': True}}
+        engine._relay_urls = ['https://relay.example']
+        engine.w3 = Mock()
+        engine.nonce_manager = NonceManager(Mock(), ROUTER)
+        engine.nonce_manager.current_nonce = 5
+        engine.wallet_manager = Mock()
+        return engine
+    
+    @pytest.mark.asyncio
+    async def test_sign_error_releases_nonce(self, send_engine):
+        """A tx that fails before broadcast hands its nonce back"""
+        send_engine.wallet_manager.sign_transaction = Mock(side_effect=ValueError('bad tx'))
+        
+        tx_hash = await send_engine._send_transaction({})
+        
+        assert tx_hash is None
+        assert send_engine.nonce_manager.current_nonce == 5
+        assert not send_engine.nonce_manager._pending
+        send_engine.nonce_manager.w3.eth.get_transaction_count.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_rejected_bundle_releases_only_its_nonce(self, send_engine):
+        """A rejected bundle releases its nonce without touching other in-flight nonces"""
+        in_flight = send_engine.nonce_manager.get_nonce()
+        send_engine.nonce_manager._cancel_cache[in_flight] = Mock()
+        send_engine._send_bundle = AsyncMock(return_value=None)
+        
+        tx_hash = await send_engine._send_transaction({})
+        
+        assert tx_hash is None
+        assert send_engine.nonce_manager.current_nonce == in_flight + 1
+        assert in_flight in send_engine.nonce_manager._pending
+        assert in_flight in send_engine.nonce_manager._cancel_cache
@@ -0,0 +1,89 @@
+"""
+Unit Tests for Nonce Manager
+"""
+
+import pytest
+from unittest.mock import Mock
+from web3 import Web3
+
+from blockchain.nonce_manager import NonceManager
+
+
+EXECUTOR = '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174'
+
+
+@pytest.fixture
+def nonce_manager():
+    """Nonce manager synced to nonce 10"""
+    w3 = Mock(spec=Web3)
+    w3.eth = Mock()
+    w3.eth.get_transaction_count = Mock(return_value=10)
+    
+    manager = NonceManager(w3, EXECUTOR)
+    manager.current_nonce = 10
+    return manager
+
+
+class TestReleaseNonce:
+    """Test releasing a nonce after a failed send"""
+    
+    @pytest.mark.asyncio
+    async def test_release_highest_rewinds(self, nonce_manager):
+        """Releasing the last issued nonce hands it out again"""
+        nonce = nonce_manager.get_nonce()
+        
+        await nonce_manager.release_nonce(nonce)
+        
+        assert nonce_manager.current_nonce == nonce
+        assert nonce_manager.get_nonce() == nonce
+        nonce_manager.w3.eth.get_transaction_count.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_release_keeps_other_nonces(self, nonce_manager):
+        """Other in-flight nonces keep their tracking and pre-signed cancels"""
+        first = nonce_manager.get_nonce()
+        second = nonce_manager.get_nonce()
+        nonce_manager._cancel_cache[first] = Mock()
+        nonce_manager._cancel_cache[second] = Mock()
+        
+        await nonce_manager.release_nonce(second)
+        
+        assert first in nonce_manager._pending
+        assert first in nonce_manager._cancel_cache
+        assert second not in nonce_manager._pending
+        assert second not in nonce_manager._cancel_cache
+    
+    @pytest.mark.asyncio
+    async def test_release_below_in_flight_is_reissued(self, nonce_manager):
+        """A released gap below an in-flight nonce is filled before going higher"""
+        first = nonce_manager.get_nonce()
+        second = nonce_manager.get_nonce()
+        
+        await nonce_manager.release_nonce(first)
+        
+        assert nonce_manager.current_nonce == second + 1
+        assert second in nonce_manager._pending
+        assert nonce_manager.get_nonce() == first
+        assert nonce_manager.get_nonce() == second + 1
+    
+    @pytest.mark.asyncio
+    async def test_release_collapses_gaps(self, nonce_manager):
+        """Releasing the top nonce also rewinds over released gaps below it"""
+        first = nonce_manager.get_nonce()
+        second = nonce_manager.get_nonce()
+        
+        await nonce_manager.release_nonce(first)
+        await nonce_manager.release_nonce(second)
+        
+        assert nonce_manager.current_nonce == first
+        assert not nonce_manager._released
+    
+    @pytest.mark.asyncio
+    async def test_release_unknown_nonce_is_noop(self, nonce_manager):
+        """Releasing a nonce that isn't pending changes nothing"""
+        nonce_manager.get_nonce()
+        
+        await nonce_manager.release_nonce(3)
+        
+        assert nonce_manager.current_nonce == 11
+        assert not nonce_manager._released
@@ -0,0 +1,96 @@
+"""
+Unit Tests for JSON-RPC batching
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from utils.rpc_manager import batch_request
+
+
+CALLS = [
+    ('eth_chainId', []),
+    ('eth_gasPrice', []),
+    ('eth_getTransactionCount', ['0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174', 'pending'])
+]
+
+
+@pytest.fixture
+def w3():
+    """Mock Web3 instance with an HTTP provider"""
+    w3 = Mock()
+    w3.provider.endpoint_uri = 'http://127.0.0.1:8545'
+    return w3
+
+
+def _post_returning(body):
+    """Patch the pooled HTTP session so the batch POST answers with body"""
+    response = Mock()
+    response.json = Mock(return_value=body)
+    session = Mock()
+    session.post = Mock(return_value=response)
+    return patch('utils.rpc_manager.get_http_session', return_value=session)
+
+
+class TestBatchRequest:
+    """Test batch_request response mapping"""
+    
+    def test_results_in_call_order(self, w3):
+        """Responses arriving out of order are mapped back by id"""
+        body = [
+            {'jsonrpc': '2.0', 'id': 2, 'result': '0x5'},
+            {'jsonrpc': '2.0', 'id': 0, 'result': '0x89'},
+            {'jsonrpc': '2.0', 'id': 1, 'result': '0x3b9aca00'}
+        ]
+        
+        with _post_returning(body):
+            results = batch_request(w3, CALLS)
+        
+        assert results == ['0x89', '0x3b9aca00', '0x5']
+    
+    def test_item_error_raises(self, w3):
+        """A per-call error fails the batch by default"""
+        body = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': '0x89'},
+            {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'boom'}},
+            {'jsonrpc': '2.0', 'id': 2, 'result': '0x5'}
+        ]
+        
+        with _post_returning(body), pytest.raises(ValueError):
+            batch_request(w3, CALLS)
+    
+    def test_item_error_allowed(self, w3):
+        """With allow_errors, only the failed call comes back as None"""
+        body = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': '0x89'},
+            {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'boom'}}
+        ]
+        
+        with _post_returning(body):
+            results = batch_request(w3, CALLS, allow_errors=True)
+        
+        assert results == ['0x89', None, None]
+    
+    @pytest.mark.parametrize('body', [
+        {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'batch not supported'}},
+        'rate limited'
+    ])
+    def test_rejected_batch_raises_value_error(self, w3, body):
+        """A single error object instead of a list raises ValueError, even with allow_errors"""
+        with _post_returning(body), pytest.raises(ValueError):
+            batch_request(w3, CALLS, allow_errors=True)
+    
+    def test_non_http_provider_falls_back(self):
+        """Providers without HTTP batching get one request per call"""
+        w3 = Mock()
+        w3.provider.endpoint_uri = None
+        w3.provider.make_request = Mock(side_effect=[
+            {'jsonrpc': '2.0', 'id': 0, 'result': '0x89'},
+            {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'boom'}},
+            {'jsonrpc': '2.0', 'id': 2, 'result': '0x5'}
+        ])
+        
+        results = batch_request(w3, CALLS, allow_errors=True)
+        
+        assert results == ['0x89', None, '0x5']
+        assert w3.provider.make_request.call_count == 3
@@ -0,0 +1,111 @@
+"""
+Unit Tests for Transaction Builder
+Hand-written calldata encoders are checked against eth_abi
+"""
+
+import pytest
+from unittest.mock import Mock
+from eth_abi import encode
+from web3 import Web3
+
+from blockchain.transaction_builder import (
+    Selectors,
+    TransactionBuilder,
+    _encode_arbitrage_fixed,
+    _encode_swap_fixed2
+)
+from strategies.opportunity import Opportunity, StrategyKind
+from utils.address_cache import to_address_bytes
+
+
+WMATIC = '0x0d500B1d8E8eF31E21C99d1Db9A6444d3ADf1270'
+USDC = '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174'
+QUICKSWAP_ROUTER = '0xa5E0829CaCEd8fFDD4De3c43696c57F7D7A678ff'
+SUSHISWAP_ROUTER = '0x1b02dA8Cb0d097eB8D57A175b88c7D8b47997506'
+EXECUTOR = '0x794a61358D6845594F94dc1DB02A252b5b4814aD'
+
+
+@pytest.fixture
+def tx_builder():
+    """Transaction builder with a mock wallet manager"""
+    wallet_manager = Mock()
+    wallet_manager.executor_address = EXECUTOR
+    return TransactionBuilder(Mock(spec=Web3), wallet_manager)
+
+
+class TestCalldataEncoders:
+    """Test fixed-layout encoders against eth_abi"""
+    
+    @pytest.mark.parametrize('amount_in,deadline', [
+        (0, 0),
+        (10 ** 18, 1700000000),
+        (2 ** 256 - 1, 2 ** 64 - 1)
+    ])
+    def test_encode_swap_fixed2(self, amount_in, deadline):
+        """swapExactTokensForTokens calldata matches eth_abi byte for byte"""
+        expected = Selectors.SWAP_EXACT_TOKENS_FOR_TOKENS + encode(
+            ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
+            [amount_in, 0, [WMATIC, USDC], EXECUTOR, deadline]
+        )
+        
+        calldata = _encode_swap_fixed2(amount_in, WMATIC, USDC, to_address_bytes(EXECUTOR), deadline)
+        
+        assert calldata == expected
+    
+    @pytest.mark.parametrize('strategy_type,path,routers,amounts_out_min', [
+        (1, [WMATIC, USDC, WMATIC], [QUICKSWAP_ROUTER, SUSHISWAP_ROUTER], [0, 0]),
+        (2, [WMATIC, USDC, EXECUTOR, WMATIC], [QUICKSWAP_ROUTER] * 3, [1, 2 ** 256 - 1, 0]),
+        (255, [], [], [])
+    ])
+    def test_encode_arbitrage_fixed(self, strategy_type, path, routers, amounts_out_min):
+        """(uint8,address[],address[],uint256[]) encoding matches eth_abi byte for byte"""
+        expected = encode(
+            ['uint8', 'address[]', 'address[]', 'uint256[]'],
+            [strategy_type, path, routers, amounts_out_min]
+        )
+        
+        encoded = _encode_arbitrage_fixed(
+            strategy_type,
+            [to_address_bytes(address) for address in path],
+            [to_address_bytes(address) for address in routers],
+            amounts_out_min
+        )
+        
+        assert encoded == expected
+    
+    def test_encode_arbitrage_fixed_rejects_wide_strategy_type(self):
+        """Strategy types outside uint8 are rejected"""
+        with pytest.raises(ValueError):
+            _encode_arbitrage_fixed(256, [], [], [])
+
+
+class TestBuildArbitrageTx:
+    """Test the direct arbitrage builder"""
+    
+    def test_build_uses_resolved_addresses(self, tx_builder):
+        """Symbols and DEX names in the opportunity are not encoded"""
+        opportunity = Opportunity(
+            strategy='direct_arbitrage',
+            kind=StrategyKind.DIRECT_ARB,
+            priority=2,
+            expected_profit_usd=10.0,
+            confidence=0.95,
+            data={
+                'pair': ('WMATIC', 'USDC'),
+                'pair_addresses': (WMATIC, USDC),
+                'buy_dex': 'quickswap_v2',
+                'sell_dex': 'sushiswap',
+                'buy_router': QUICKSWAP_ROUTER,
+                'sell_router': SUSHISWAP_ROUTER
+            }
+        )
+        
+        tx = tx_builder.build_arbitrage_tx(opportunity, gas_price=30 * 10 ** 9, tip=10 ** 9)
+        
+        assert tx['to'] == QUICKSWAP_ROUTER
+        assert bytes(tx['data']) == encode(
+            ['uint8', 'address[]', 'address[]', 'uint256[]'],
+            [1, [WMATIC, USDC, WMATIC], [QUICKSWAP_ROUTER, SUSHISWAP_ROUTER], [0, 0]]
+        )
+        assert tx['maxFeePerGas'] == 31 * 10 ** 9
+        assert tx['maxPriorityFeePerGas'] == 10 ** 9
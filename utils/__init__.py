@@ -10,6 +10,7 @@ from .rpc_manager import RPCManager
 from .alert_system import AlertSystem
 from .kill_switch import KillSwitch
 from .data_cache import DataCache
+from .address_cache import to_checksum_address, to_address_bytes
 
 __all__ = [
     'Multicall',
@@ -18,5 +19,7 @@ __all__ = [
     'RPCManager',
     'AlertSystem',
     'KillSwitch',
-    'DataCache'
+    'DataCache',
+    'to_checksum_address',
+    'to_address_bytes'
 ]
\ No newline at end of file
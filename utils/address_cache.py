@@ -0,0 +1,46 @@
+"""
+Address Cache
+Memoizes EIP-55 checksum conversion (one keccak per address per process)
+and raw 20-byte address normalization for ABI encoding
+"""
+
+import functools
+from web3 import Web3
+
+
+@functools.lru_cache(maxsize=4096)
+def to_checksum_address(address: str) -> str:
+    """
+    Checksum an address, caching the result
+    Hot paths re-pass the same token/router addresses on every transaction
+    
+    Args:
+        address: Hex address (any case)
+        
+    Returns:
+        EIP-55 checksummed address
+    """
+    return Web3.to_checksum_address(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def to_address_bytes(address: str) -> bytes:
+    """
+    Convert a hex address to its raw 20 bytes, caching the result
+    eth_abi encodes bytes addresses as-is, skipping checksum validation
+    
+    Args:
+        address: Hex address (any case, with or without 0x)
+        
+    Returns:
+        20-byte address
+        
+    Raises:
+        ValueError: If the address is not 20 bytes of hex
+    """
+    raw = bytes.fromhex(address[2:] if address[:2] in ('0x', '0X') else address)
+    
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {address}")
+    
+    return raw
@@ -0,0 +1,141 @@
+"""
+Arbitrage Scan
+Cross-DEX price spread search over a (pairs x dexes) price matrix
+Uses the numba kernel when numba is installed, otherwise a vectorized NumPy scan
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional dependency - scan_pairs falls back to NumPy
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        return lambda func: func
+
+
+@njit(cache=True)
+def scan_pairs_jit(
+    price_matrix: np.ndarray,
+    gas_cost: float,
+    trade_size: float,
+    min_profit: float,
+    min_diff_pct: float
+) -> Tuple[int, int, int, float]:
+    """
+    Find the pair with the most profitable buy-low/sell-high spread
+
+    Args:
+        price_matrix: float64 array (n_pairs, n_dexes), NaN/<=0 where no quote
+        gas_cost: Gas cost in USD (same for every pair)
+        trade_size: Trade size in USD
+        min_profit: Minimum net profit in USD
+        min_diff_pct: Minimum spread in percent (exclusive)
+
+    Returns:
+        Tuple of (row, buy_col, sell_col, net_profit) - row is -1 if nothing qualifies
+    """
+    best_row = -1
+    best_buy = -1
+    best_sell = -1
+    best_net = 0.0
+
+    n_pairs, n_dexes = price_matrix.shape
+
+    for row in range(n_pairs):
+        buy_col = -1
+        sell_col = -1
+        min_price = np.inf
+        max_price = 0.0
+
+        for col in range(n_dexes):
+            price = price_matrix[row, col]
+            if not price > 0.0:  # Also skips NaN
+                continue
+            if price < min_price:
+                min_price = price
+                buy_col = col
+            if price > max_price:
+                max_price = price
+                sell_col = col
+
+        if buy_col < 0 or buy_col == sell_col:
+            continue
+
+        diff_pct = (max_price - min_price) / min_price * 100.0
+        if diff_pct <= min_diff_pct:
+            continue
+
+        net_profit = trade_size * diff_pct / 100.0 - gas_cost
+        if net_profit > best_net and net_profit >= min_profit:
+            best_row = row
+            best_buy = buy_col
+            best_sell = sell_col
+            best_net = net_profit
+
+    return best_row, best_buy, best_sell, best_net
+
+
+def scan_pairs_vectorized(
+    price_matrix: np.ndarray,
+    gas_cost: float,
+    trade_size: float,
+    min_profit: float,
+    min_diff_pct: float
+) -> Tuple[int, int, int, float]:
+    """
+    Same search as scan_pairs_jit, as whole-matrix NumPy ops (no per-pair Python loop)
+
+    Args:
+        price_matrix: float64 array (n_pairs, n_dexes), NaN/<=0 where no quote
+        gas_cost: Gas cost in USD (same for every pair)
+        trade_size: Trade size in USD
+        min_profit: Minimum net profit in USD
+        min_diff_pct: Minimum spread in percent (exclusive)
+
+    Returns:
+        Tuple of (row, buy_col, sell_col, net_profit) - row is -1 if nothing qualifies
+    """
+    if price_matrix.size == 0:
+        return -1, -1, -1, 0.0
+
+    valid = price_matrix > 0.0  # NaN compares False
+
+    # Invalid quotes can never be the min (inf) or the max (0)
+    low = np.where(valid, price_matrix, np.inf)
+    high = np.where(valid, price_matrix, 0.0)
+
+    buy_cols = low.argmin(axis=1)
+    sell_cols = high.argmax(axis=1)
+
+    rows = np.arange(price_matrix.shape[0])
+    min_prices = low[rows, buy_cols]
+    max_prices = high[rows, sell_cols]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        diff_pct = (max_prices - min_prices) / min_prices * 100.0
+
+    net_profit = trade_size * diff_pct / 100.0 - gas_cost
+
+    # Need 2+ quotes on distinct DEXes, enough spread and enough profit
+    eligible = (
+        (valid.sum(axis=1) >= 2)
+        & (buy_cols != sell_cols)
+        & (diff_pct > min_diff_pct)
+        & (net_profit > 0.0)
+        & (net_profit >= min_profit)
+    )
+
+    if not eligible.any():
+        return -1, -1, -1, 0.0
+
+    row = int(np.where(eligible, net_profit, -np.inf).argmax())
+    return row, int(buy_cols[row]), int(sell_cols[row]), float(net_profit[row])
+
+
+# Compiled loop when available; the vectorized scan beats an interpreted loop
+scan_pairs = scan_pairs_jit if NUMBA_AVAILABLE else scan_pairs_vectorized
@@ -39,17 +39,20 @@ class GasCalculator:
         
         logger.info("Gas Calculator initialized")
     
-    async def get_jit_gas_price(self) -> int:
+    async def get_jit_gas_price(self, network_gas_price: Optional[int] = None) -> int:
         """
         Get Just-In-Time gas price
         Fetches current network gas price at the moment of sending
         
+        Args:
+            network_gas_price: Gas price already fetched by the caller (skips the RPC)
+            
         Returns:
             Gas price in wei
         """
         try:
             # Get current gas price from network
-            gas_price_wei = self.w3.eth.gas_price
+            gas_price_wei = network_gas_price if network_gas_price is not None else self.w3.eth.gas_price
             gas_price_gwei = self.w3.from_wei(gas_price_wei, 'gwei')
             
             # Apply buffer (5% increase for faster inclusion)
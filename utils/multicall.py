@@ -4,11 +4,17 @@ Batch multiple contract calls into single RPC request
 CRITICAL for reducing RPC calls and saving CU (Compute Units)
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from web3 import Web3
 from eth_abi import encode, decode
 from loguru import logger
 
+from utils.address_cache import to_checksum_address
+
+# getAmountsOut(uint256,address[]) function selector
+_GET_AMOUNTS_OUT_SELECTOR = Web3.keccak(text='getAmountsOut(uint256,address[])')[:4]
+
 
 class Multicall:
     """
@@ -101,8 +107,8 @@ class Multicall:
                 for call in calls
             ]
             
-            # Call multicall3.aggregate3
-            results = self.contract.functions.aggregate3(multicall_calls).call()
+            # Call multicall3.aggregate3 (blocking eth_call - keep it off the event loop)
+            results = await asyncio.to_thread(self.contract.functions.aggregate3(multicall_calls).call)
             
             # Decode results
             decoded_results = []
@@ -277,15 +283,12 @@ class Multicall:
             List of amounts out for each path
         """
         try:
-            # getAmountsOut function signature
-            get_amounts_sig = Web3.keccak(text='getAmountsOut(uint256,address[])')[:4]
-            
             calls = []
             for path in paths:
                 # Encode call
-                call_data = get_amounts_sig + encode(
+                call_data = _GET_AMOUNTS_OUT_SELECTOR + encode(
                     ['uint256', 'address[]'],
-                    [amount_in, [Web3.to_checksum_address(addr) for addr in path]]
+                    [amount_in, [to_checksum_address(addr) for addr in path]]
                 )
                 
                 calls.append({
@@ -311,6 +314,49 @@ class Multicall:
             logger.error(f"Error getting amounts out batch: {e}")
             return [[] for _ in paths]
     
+    async def get_amounts_out_multi(
+        self,
+        requests: List[Tuple[str, int, List[str]]]
+    ) -> List[List[int]]:
+        """
+        Get amounts out for quotes spread across several routers
+        All quotes go through aggregate3 (allowFailure per call), so they are
+        read from the same block in as few eth_calls as the chunk size allows
+        
+        Args:
+            requests: List of (router_address, amount_in, path)
+            
+        Returns:
+            List of amounts out per request ([] if that quote failed)
+        """
+        try:
+            calls = [
+                {
+                    'target': router_address,
+                    'call_data': _GET_AMOUNTS_OUT_SELECTOR + encode(
+                        ['uint256', 'address[]'],
+                        [amount_in, [to_checksum_address(addr) for addr in path]]
+                    )
+                }
+                for router_address, amount_in, path in requests
+            ]
+            
+            results = await self.aggregate(calls)
+            
+            # Decode amounts
+            amounts_list = []
+            for result in results:
+                if result:
+                    amounts_list.append(list(decode(['uint256[]'], result)[0]))
+                else:
+                    amounts_list.append([])
+            
+            return amounts_list
+            
+        except Exception as e:
+            logger.error(f"Error getting multi-router amounts out: {e}")
+            return [[] for _ in requests]
+    
     def _get_multicall3_abi(self) -> List[Dict]:
         """Get Multicall3 ABI"""
         return [
@@ -7,13 +7,108 @@ CRITICAL for free tier optimization and avoiding rate limits
 import os
 import json
 import time
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from loguru import logger
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Pooled keep-alive sessions, one per RPC host (shared by providers and batch calls)
+_HTTP_SESSIONS: Dict[str, requests.Session] = {}
+
+
+def get_http_session(url: str) -> requests.Session:
+    """
+    Get persistent HTTP session for an RPC host
+    Reuses TCP+TLS connections instead of reconnecting per request
+    
+    Args:
+        url: RPC endpoint URL
+        
+    Returns:
+        Shared requests session
+    """
+    host = urlparse(url).netloc
+    session = _HTTP_SESSIONS.get(host)
+    
+    if session is None:
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.05)
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _HTTP_SESSIONS[host] = session
+    
+    return session
+
+
+def batch_request(
+    w3: Web3,
+    calls: List[Tuple[str, list]],
+    timeout: float = 10,
+    allow_errors: bool = False
+) -> List[Any]:
+    """
+    Issue several JSON-RPC calls in a single HTTP round-trip
+    
+    Args:
+        w3: Web3 instance (HTTP provider)
+        calls: List of (method, params) tuples
+        timeout: Request timeout in seconds
+        allow_errors: If True, a failed call yields None instead of failing the batch
+        
+    Returns:
+        Raw JSON-RPC results in call order
+        
+    Raises:
+        ValueError: If the node rejects the batch, or (unless allow_errors) any call
+            returns a JSON-RPC error
+    """
+    endpoint = getattr(w3.provider, 'endpoint_uri', None)
+    
+    if not endpoint or not str(endpoint).startswith('http'):
+        # Non-HTTP provider - no batch support, fall back to sequential calls
+        return [
+            _unwrap_response(w3.provider.make_request(method, params), allow_errors)
+            for method, params in calls
+        ]
+    
+    payload = [
+        {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    
+    response = get_http_session(str(endpoint)).post(str(endpoint), json=payload, timeout=timeout)
+    response.raise_for_status()
+    
+    body = response.json()
+    
+    if not isinstance(body, list):
+        # A node that rejects the whole batch answers with a single error object
+        raise ValueError(body.get('error', body) if isinstance(body, dict) else body)
+    
+    # Batch responses may arrive in any order
+    responses = {item.get('id'): item for item in body if isinstance(item, dict)}
+    return [_unwrap_response(responses.get(i), allow_errors) for i in range(len(calls))]
+
+
+def _unwrap_response(response: Optional[Dict], allow_errors: bool = False) -> Any:
+    """Extract result from a JSON-RPC response (None on error if allow_errors)"""
+    if not response or 'error' in response:
+        if allow_errors:
+            return None
+        raise ValueError(response['error'] if response else "Missing JSON-RPC response")
+    return response['result']
+
 
 class RPCManager:
     """
@@ -82,7 +177,10 @@ class RPCManager:
         """Create Web3 instances for each tier"""
         for tier_name, tier_data in self.tiers.items():
             try:
-                w3 = Web3(Web3.HTTPProvider(tier_data['http_url']))
+                w3 = Web3(Web3.HTTPProvider(
+                    tier_data['http_url'],
+                    session=get_http_session(tier_data['http_url'])
+                ))
                 
                 # Test connection
                 if w3.is_connected():
@@ -112,6 +210,15 @@ class RPCManager:
         
         return self.w3_instances[tier_name]
     
+    def get_all_web3(self) -> List[Web3]:
+        """
+        Get Web3 instances for every connected tier
+        
+        Returns:
+            List of Web3 instances (tier order)
+        """
+        return list(self.w3_instances.values())
+    
     def get_websocket_url(self) -> Optional[str]:
         """Get WebSocket URL for current tier"""
         if self.ws_url_cache: